@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+MIDI loader benchmark - byte-level SMF reader (serial and parallel) and .pydomino load vs. the mido loader
+Usage: python benchmark_midi_loader.py [file.mid ...]
+Without arguments a corpus of large synthetic files is generated in a temp directory.
+"""
+import os
+import sys
+import random
+import struct
+import tempfile
+import time
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.smf_reader import read_midi_file
+from src.midi_parser import load_midi_file_mido, MIDO_AVAILABLE
+from src.project_file import save_project_file, load_project_file, ProjectFile
+
+# (track count, notes per track) for the synthetic corpus
+SYNTHETIC_CORPUS = [(4, 25_000), (16, 25_000), (64, 8_000)]
+
+
+def _vlq(value: int) -> bytes:
+    """Encode a variable-length quantity"""
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def write_synthetic_smf(file_path: str, track_count: int, notes_per_track: int, seed: int = 0):
+    """Write a format 1 SMF with overlapping notes, running status and controller traffic"""
+    rng = random.Random(seed)
+    chunks = []
+
+    tempo_track = b'\x00\xff\x51\x03' + (500000).to_bytes(3, 'big') + b'\x00\xff\x58\x04\x04\x02\x18\x08\x00\xff\x2f\x00'
+    chunks.append(tempo_track)
+
+    for track_index in range(track_count):
+        channel = track_index % 16
+        events = []
+        tick = 0
+        for _ in range(notes_per_track):
+            tick += rng.choice((0, 0, 60, 120, 240))
+            pitch = rng.randint(36, 96)
+            events.append((tick, 0x90 | channel, pitch, rng.randint(1, 127)))
+            events.append((tick + rng.randint(30, 960), 0x80 | channel, pitch, 0))
+            if rng.random() < 0.1:
+                events.append((tick, 0xB0 | channel, 7, rng.randint(0, 127)))
+        events.sort(key=lambda event: event[0])
+
+        body = bytearray()
+        last_tick = 0
+        running = None
+        for event_tick, status, data1, data2 in events:
+            body += _vlq(event_tick - last_tick)
+            last_tick = event_tick
+            if status != running:
+                body.append(status)
+                running = status
+            body += bytes((data1, data2))
+        body += b'\x00\xff\x2f\x00'
+        chunks.append(bytes(body))
+
+    with open(file_path, 'wb') as f:
+        f.write(b'MThd' + struct.pack('>IHHH', 6, 1, len(chunks), 480))
+        for chunk in chunks:
+            f.write(b'MTrk' + struct.pack('>I', len(chunk)) + chunk)
+
+
+def measure(loader, file_path: str):
+    """Time a loader, then measure its peak memory in a second traced run; returns (project, seconds, peak bytes)"""
+    start = time.perf_counter()
+    project = loader(file_path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    loader(file_path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return project, elapsed, peak
+
+
+def note_key(project):
+    """Comparable note content of a project"""
+    return [sorted((n.pitch, n.start_tick, n.end_tick, n.velocity, n.channel) for n in track.notes)
+            for track in project.tracks]
+
+
+def benchmark(file_path: str):
+    size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    project, fast_time, fast_peak = measure(lambda path: read_midi_file(path, parallel=False), file_path)
+    note_count = sum(len(track.notes) for track in project.tracks)
+    print(f"{os.path.basename(file_path)}: {size_mb:.1f} MB, {len(project.tracks)} tracks, {note_count} notes")
+    print(f"  smf_reader: {fast_time:8.3f} s  peak {fast_peak / 1e6:8.1f} MB")
+
+    start = time.perf_counter()
+    parallel_project = read_midi_file(file_path, parallel=True)
+    parallel_time = time.perf_counter() - start
+    print(f"  parallel:   {parallel_time:8.3f} s  ({os.cpu_count()} cores, {fast_time / parallel_time:.1f}x vs serial)")
+    if note_key(parallel_project) != note_key(project):
+        print("  WARNING: parallel and serial parsing disagree on note content")
+
+    project_path = os.path.splitext(file_path)[0] + ".pydomino"
+    save_project_file(project, project_path)
+    start = time.perf_counter()
+    with ProjectFile(project_path) as project_file:
+        for name in project_file.sections:
+            project_file.section(name)
+    map_time = time.perf_counter() - start
+    native_project, native_time, native_peak = measure(lambda path: load_project_file(path)[0], project_path)
+    print(f"  .pydomino:  {native_time:8.3f} s  peak {native_peak / 1e6:8.1f} MB  (sections mapped in {map_time * 1000:.1f} ms)")
+    if note_key(native_project) != note_key(project):
+        print("  WARNING: project file round trip changed note content")
+
+    if not MIDO_AVAILABLE:
+        print("  mido:       not installed, skipped")
+        return
+
+    reference, mido_time, mido_peak = measure(load_midi_file_mido, file_path)
+    print(f"  mido:       {mido_time:8.3f} s  peak {mido_peak / 1e6:8.1f} MB  "
+          f"({mido_time / fast_time:.1f}x slower)")
+    if note_key(project) != note_key(reference):
+        print("  WARNING: loaders disagree on note content")
+
+
+def main():
+    paths = sys.argv[1:]
+    if paths:
+        for path in paths:
+            benchmark(path)
+        return
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        for track_count, notes_per_track in SYNTHETIC_CORPUS:
+            path = os.path.join(corpus_dir, f"synthetic_{track_count}x{notes_per_track}.mid")
+            write_synthetic_smf(path, track_count, notes_per_track)
+            benchmark(path)
+
+
+if __name__ == "__main__":
+    main()
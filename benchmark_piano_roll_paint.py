@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Piano roll paint benchmark - frame time of PianoRollWidget.paintEvent at 1k, 100k and 1M notes
+Usage: python benchmark_piano_roll_paint.py [note count ...]
+Notes are spread at a constant density, so every project shows about the same number
+of notes per screen; with viewport culling the frame time should stay flat as the
+project grows. The full scan the paint loop used to do is timed alongside for reference.
+Each frame scrolls by a fraction of a screen; note tiles rasterized in the background
+are collected between frames, so the paint time is compositing plus newly exposed tiles.
+Following playback only paints the strip scrolled into view each frame; that is timed too.
+"""
+import os
+import sys
+import random
+import statistics
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QPoint
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QImage, QPainter, QRegion
+
+from src.midi_data_model import MidiProject, MidiTrack, MidiNote
+from src.ui.piano_roll_widget import PianoRollWidget
+
+NOTE_COUNTS = [1_000, 100_000, 1_000_000]
+TRACK_COUNT = 16
+NOTES_PER_MEASURE = 8    # Per track
+FRAMES = 60
+SCROLL_FRACTION = 0.25   # Of a screen width per frame
+FOLLOW_TICKS_PER_FRAME = 16  # Smooth follow at 120 BPM, 480 ticks per beat, 60 frames per second
+VIEW_SIZE = (1600, 900)
+
+
+def build_project(note_count: int, seed: int = 0) -> MidiProject:
+    """Project with note_count notes at a constant density across TRACK_COUNT tracks"""
+    rng = random.Random(seed)
+    project = MidiProject()
+    ticks_per_measure = project.ticks_per_beat * 4
+    step = ticks_per_measure // NOTES_PER_MEASURE
+    per_track = note_count // TRACK_COUNT
+    for track_index in range(TRACK_COUNT):
+        track = MidiTrack(name=f"Track {track_index + 1}", channel=track_index % 16)
+        track.notes = [
+            MidiNote(rng.randint(36, 96), i * step, i * step + rng.choice((step // 2, step, step * 4)), 100, track.channel)
+            for i in range(per_track)
+        ]
+        project.add_track(track)
+    return project
+
+
+def full_scan(widget: PianoRollWidget, width: int, grid_start_x: int) -> int:
+    """The per-note visibility test the paint loop ran over every note before culling"""
+    visible = 0
+    for track in widget.midi_project.tracks:
+        for note in track.notes:
+            x = widget._tick_to_x(note.start_tick) + grid_start_x
+            if x < width and x + note.duration * widget.pixels_per_tick > grid_start_x:
+                visible += 1
+    return visible
+
+
+def benchmark(note_count: int):
+    project = build_project(note_count)
+    widget = PianoRollWidget()
+    widget.resize(*VIEW_SIZE)
+    widget.set_midi_project(project)
+    width, height = VIEW_SIZE
+    grid_start_x = widget.piano_width if widget.show_piano_keyboard else 0
+
+    start = time.perf_counter()
+    list(widget.note_index.query(0, 1))
+    build_time = time.perf_counter() - start
+
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    last_tick = max(note.end_tick for track in project.tracks for note in track.notes)
+    view_ticks = int((width - grid_start_x) / widget.pixels_per_tick)
+    frame_times, scan_times = [], []
+    visible = 0
+    first_tick = max(0, last_tick // 2 - view_ticks)
+    for frame in range(FRAMES):
+        # Scroll through the middle of the project, partly overlapping the previous frame
+        widget.visible_start_tick = first_tick + int(frame * view_ticks * SCROLL_FRACTION)
+        widget.vertical_offset = 30 * widget.pixels_per_pitch
+
+        painter = QPainter(image)
+        start = time.perf_counter()
+        widget.render(painter)
+        frame_times.append(time.perf_counter() - start)
+        painter.end()
+
+        # Let the background tiles land before the next frame
+        widget.tile_cache.pool.waitForDone()
+        QCoreApplication.processEvents()
+
+        start = time.perf_counter()
+        visible = full_scan(widget, width, grid_start_x)
+        scan_times.append(time.perf_counter() - start)
+
+    # Smooth follow: the view moves a few pixels per frame and only the exposed strip is painted
+    follow_times = []
+    for frame in range(FRAMES):
+        old_origin = round(widget.visible_start_tick * widget.pixels_per_tick)
+        widget.visible_start_tick += FOLLOW_TICKS_PER_FRAME
+        dx = old_origin - round(widget.visible_start_tick * widget.pixels_per_tick)
+        if not dx:
+            continue
+
+        painter = QPainter(image)
+        start = time.perf_counter()
+        widget.render(painter, QPoint(width + dx, 0), QRegion(width + dx, 0, -dx, height))
+        follow_times.append(time.perf_counter() - start)
+        painter.end()
+
+        widget.tile_cache.pool.waitForDone()
+        QCoreApplication.processEvents()
+
+    stats = widget.note_index.get_stats()
+    tile_stats = widget.tile_cache.get_stats()
+    print(f"{note_count:>9} notes: {visible:5d} on screen, index built in {build_time * 1000:7.1f} ms")
+    print(f"    paint:     median {statistics.median(frame_times) * 1000:7.2f} ms  "
+          f"max {max(frame_times) * 1000:7.2f} ms  ({tile_stats['tiles_rendered']} tiles rendered, "
+          f"{tile_stats['cache_bytes'] // 1024} KiB cached)")
+    print(f"    follow:    median {statistics.median(follow_times) * 1000:7.2f} ms  "
+          f"max {max(follow_times) * 1000:7.2f} ms  (exposed strip only)")
+    print(f"    full scan: median {statistics.median(scan_times) * 1000:7.2f} ms  (per frame, before any drawing)")
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    counts = [int(arg) for arg in sys.argv[1:]] or NOTE_COUNTS
+    for note_count in counts:
+        benchmark(note_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ from enum import Enum
 import time
 
 from src.midi_data_model import MidiNote
-from src.audio_source_manager import AudioSource, AudioSourceType
+from src.audio_source import AudioSource, AudioSourceType
 
 
 class AudioRoutingState(Enum):
@@ -63,6 +63,9 @@ class AudioRoutingCoordinator:
         self.channel_states: Dict[int, AudioChannelState] = {}
         self.reserved_channels: Set[int] = set()
         
+        # Per-sink timing of the last dispatch_notes() call: (sink name, send seconds, event indices)
+        self.last_dispatch_sinks: List[Tuple[str, float, List[int]]] = []
+        
         # Manager references (will be set during initialization)
         self.audio_manager = None
         self.audio_source_manager = None
@@ -172,25 +175,9 @@ class AudioRoutingCoordinator:
     def play_note(self, track_index: int, note: MidiNote) -> bool:
         """Play a note using the track's audio route"""
         # Get route for track
-        route = self.track_routes.get(track_index)
+        route = self._get_active_route(track_index)
         if not route:
-            print(f"AudioRoutingCoordinator: No route for track {track_index}, attempting setup...")
-            if not self.setup_track_route(track_index):
-                print(f"AudioRoutingCoordinator: Failed to setup route for track {track_index}")
-                return False
-            route = self.track_routes.get(track_index)
-            if not route:
-                print(f"AudioRoutingCoordinator: Route setup failed - no route created for track {track_index}")
-                return False
-        
-        # Verify route is still active
-        if not route.is_active:
-            print(f"AudioRoutingCoordinator: Route for track {track_index} is inactive, refreshing...")
-            if not self.refresh_track_route(track_index):
-                return False
-            route = self.track_routes.get(track_index)
-            if not route or not route.is_active:
-                return False
+            return False
         
         # Update last used time
         route.last_used = time.time()
@@ -222,6 +209,175 @@ class AudioRoutingCoordinator:
         
         return success
     
+    def stop_notes(self, voices: List[Tuple[int, MidiNote]]) -> int:
+        """Stop many notes at once, sending one batch per audio sink.
+
+        Args:
+            voices: List of (track_index, note) tuples
+
+        Returns the number of note-offs sent.
+        """
+        results = self.dispatch_notes([(track_index, note, False) for track_index, note in voices])
+        return sum(1 for sent in results if sent)
+    
+    def dispatch_notes(self, events: List[Tuple[int, MidiNote, bool]]) -> List[bool]:
+        """Route a batch of simultaneous note events, one send per audio sink.
+
+        Routes are resolved once per track and program changes checked once per route.
+
+        Args:
+            events: List of (track_index, note, is_note_on) tuples
+
+        Returns a success flag per event.
+        """
+        results = [False] * len(events)
+        routes: Dict[int, Optional[AudioRoute]] = {}
+        shared_messages: List[List[int]] = []      # Shared FluidSynth via MIDI routing
+        shared_indices: List[int] = []
+        per_track_events: Dict[int, List[Tuple[int, MidiNote, bool]]] = {}  # External MIDI instances
+        now = time.time()
+        
+        for i, (track_index, note, is_note_on) in enumerate(events):
+            if track_index not in routes:
+                route = self._get_active_route(track_index) if is_note_on else self.track_routes.get(track_index)
+                if route:
+                    route.last_used = now
+                    if route.audio_source.source_type == AudioSourceType.SOUNDFONT:
+                        self._ensure_channel_program(route)
+                routes[track_index] = route
+            route = routes[track_index]
+            if not route:
+                continue
+            
+            if route.audio_source.source_type == AudioSourceType.SOUNDFONT:
+                if is_note_on:
+                    shared_messages.append([0x90 | route.channel, note.pitch, note.velocity])
+                else:
+                    shared_messages.append([0x80 | route.channel, note.pitch, 0])
+                shared_indices.append(i)
+            elif route.audio_source.source_type == AudioSourceType.EXTERNAL_MIDI:
+                per_track_events.setdefault(track_index, []).append((i, note, is_note_on))
+        
+        self.last_dispatch_sinks = []
+        
+        # One burst to the shared synth / MIDI outputs
+        if shared_messages:
+            delivered = False
+            send_start = time.perf_counter()
+            if self.midi_routing_manager:
+                self.midi_routing_manager.send_midi_messages(shared_messages)
+                delivered = True
+            elif self.audio_manager:
+                delivered = self.audio_manager.send_note_messages(shared_messages) > 0
+            if delivered:
+                self.last_dispatch_sinks.append(("shared_synth", time.perf_counter() - send_start, shared_indices))
+                for i in shared_indices:
+                    results[i] = True
+        
+        # One burst per external MIDI track instance
+        if self.per_track_router:
+            for track_index, track_events in per_track_events.items():
+                send_start = time.perf_counter()
+                if self.per_track_router.send_notes(track_index, [(note, on) for _, note, on in track_events]):
+                    indices = [i for i, _, _ in track_events]
+                    sink_name = f"midi:{routes[track_index].audio_source.name}"
+                    self.last_dispatch_sinks.append((sink_name, time.perf_counter() - send_start, indices))
+                    for i in indices:
+                        results[i] = True
+        
+        # Keep channel note tracking in sync
+        for (track_index, note, is_note_on), sent in zip(events, results):
+            if not sent:
+                continue
+            active_notes = self.channel_states[routes[track_index].channel].active_notes
+            if is_note_on:
+                active_notes.add(note.pitch)
+            else:
+                active_notes.discard(note.pitch)
+        
+        return results
+    
+    def dispatch_controls(self, events: List[Tuple[int, int, int, int]]) -> int:
+        """Route a batch of channel events (CC, program, pitch bend, aftertouch), one send per sink.
+
+        Soundfont tracks are moved onto their route's channel and keep the route's
+        program (the track's instrument setting owns it); external MIDI tracks get
+        the events unchanged.
+
+        Args:
+            events: List of (track_index, status, data1, data2) tuples
+
+        Returns the number of events sent.
+        """
+        shared_messages: List[List[int]] = []
+        per_track_messages: Dict[int, List[List[int]]] = {}
+        
+        for track_index, status, data1, data2 in events:
+            route = self.track_routes.get(track_index)
+            if not route:
+                continue
+            kind = status & 0xF0
+            if route.audio_source.source_type == AudioSourceType.SOUNDFONT:
+                if kind == 0xC0:
+                    continue
+                shared_messages.append([kind | route.channel, data1, data2])
+            elif route.audio_source.source_type == AudioSourceType.EXTERNAL_MIDI:
+                per_track_messages.setdefault(track_index, []).append([status, data1, data2])
+        
+        sent = 0
+        if shared_messages:
+            if self.midi_routing_manager:
+                self.midi_routing_manager.send_midi_messages(shared_messages)
+                sent += len(shared_messages)
+            elif self.audio_manager:
+                sent += self.audio_manager.send_note_messages(shared_messages)
+        
+        if self.per_track_router:
+            for track_index, messages in per_track_messages.items():
+                if self.per_track_router.send_messages(track_index, messages):
+                    sent += len(messages)
+        
+        return sent
+    
+    def _get_active_route(self, track_index: int) -> Optional[AudioRoute]:
+        """Get a track's route, setting it up or refreshing it if needed"""
+        route = self.track_routes.get(track_index)
+        if not route:
+            print(f"AudioRoutingCoordinator: No route for track {track_index}, attempting setup...")
+            if not self.setup_track_route(track_index):
+                print(f"AudioRoutingCoordinator: Failed to setup route for track {track_index}")
+                return None
+            route = self.track_routes.get(track_index)
+            if not route:
+                print(f"AudioRoutingCoordinator: Route setup failed - no route created for track {track_index}")
+                return None
+        
+        # Verify route is still active
+        if not route.is_active:
+            print(f"AudioRoutingCoordinator: Route for track {track_index} is inactive, refreshing...")
+            if not self.refresh_track_route(track_index):
+                return None
+            route = self.track_routes.get(track_index)
+            if not route or not route.is_active:
+                return None
+        
+        return route
+    
+    def _ensure_channel_program(self, route: AudioRoute):
+        """Select the route's program on the shared synth channel if it changed"""
+        channel_state = self.channel_states.get(route.channel)
+        if channel_state and channel_state.current_program != route.program:
+            # Program change needed
+            if self.audio_manager and hasattr(self.audio_manager, 'fluidsynth_audio'):
+                fluidsynth = self.audio_manager.fluidsynth_audio
+                if fluidsynth and hasattr(fluidsynth, 'fs'):
+                    try:
+                        fluidsynth.fs.program_select(route.channel, fluidsynth.sfid, 0, route.program)
+                        channel_state.current_program = route.program
+                        print(f"🎵 Program changed to {route.program} ({route.audio_source.name}) on channel {route.channel}")
+                    except Exception as e:
+                        print(f"❌ Failed to change program: {e}")
+    
     def _allocate_channel(self, track_index: int, audio_source: AudioSource) -> Optional[int]:
         """Allocate a MIDI channel for a track"""
         # For soundfont sources, use track index as preferred channel
@@ -291,18 +447,7 @@ class AudioRoutingCoordinator:
         """Route a note-on event through the appropriate audio backend"""
         if route.audio_source.source_type == AudioSourceType.SOUNDFONT:
             # Ensure correct program is set before playing note
-            channel_state = self.channel_states.get(route.channel)
-            if channel_state and channel_state.current_program != route.program:
-                # Program change needed
-                if self.audio_manager and hasattr(self.audio_manager, 'fluidsynth_audio'):
-                    fluidsynth = self.audio_manager.fluidsynth_audio
-                    if fluidsynth and hasattr(fluidsynth, 'fs'):
-                        try:
-                            fluidsynth.fs.program_select(route.channel, fluidsynth.sfid, 0, route.program)
-                            channel_state.current_program = route.program
-                            print(f"🎵 Program changed to {route.program} ({route.audio_source.name}) on channel {route.channel}")
-                        except Exception as e:
-                            print(f"❌ Failed to change program: {e}")
+            self._ensure_channel_program(route)
             
             # Route through MIDI routing manager if available
             if self.midi_routing_manager:
@@ -0,0 +1,32 @@
+"""
+Audio source types
+Qt-free description of a track's audio source, shared by the source manager
+and the routing coordinator.
+"""
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+class AudioSourceType(Enum):
+    """Types of audio sources available"""
+    SOUNDFONT = "soundfont"
+    EXTERNAL_MIDI = "external_midi"
+
+@dataclass
+class AudioSource:
+    """Represents an audio source for a track"""
+    id: str
+    name: str
+    source_type: AudioSourceType
+    file_path: Optional[str] = None  # For soundfonts
+    midi_port_name: Optional[str] = None  # For external MIDI
+    program: int = 0  # MIDI program number (0-based, 0-127)
+    channel: int = 0  # MIDI channel
+    
+    def __str__(self):
+        if self.source_type == AudioSourceType.SOUNDFONT:
+            return f"{self.name} (SF2)"
+        elif self.source_type == AudioSourceType.EXTERNAL_MIDI:
+            return f"{self.name} (MIDI)"
+        else:
+            return f"{self.name} (Unknown)"
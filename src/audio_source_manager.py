@@ -6,33 +6,10 @@ import os
 import glob
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
-from enum import Enum
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
-class AudioSourceType(Enum):
-    """Types of audio sources available"""
-    SOUNDFONT = "soundfont"
-    EXTERNAL_MIDI = "external_midi"
-
-@dataclass
-class AudioSource:
-    """Represents an audio source for a track"""
-    id: str
-    name: str
-    source_type: AudioSourceType
-    file_path: Optional[str] = None  # For soundfonts
-    midi_port_name: Optional[str] = None  # For external MIDI
-    program: int = 0  # MIDI program number (0-based, 0-127)
-    channel: int = 0  # MIDI channel
-    
-    def __str__(self):
-        if self.source_type == AudioSourceType.SOUNDFONT:
-            return f"{self.name} (SF2)"
-        elif self.source_type == AudioSourceType.EXTERNAL_MIDI:
-            return f"{self.name} (MIDI)"
-        else:
-            return f"{self.name} (Unknown)"
+from src.audio_source import AudioSource, AudioSourceType
 
 @dataclass 
 class SoundfontInfo:
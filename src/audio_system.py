@@ -30,6 +30,32 @@ if sys.platform == "darwin":
 else:
     MACOS_AUDIO_AVAILABLE = False
 
+def send_fluidsynth_messages(fs, messages: List[List[int]]) -> int:
+    """Apply raw channel messages to a FluidSynth synth; returns the number delivered"""
+    delivered = 0
+    for message in messages:
+        status, data1 = message[0], message[1]
+        data2 = message[2] if len(message) > 2 else 0
+        command, channel = status & 0xF0, status & 0x0F
+        if command == 0x90 and data2 > 0:
+            fs.noteon(channel, data1, data2)
+        elif command == 0x80 or command == 0x90:
+            fs.noteoff(channel, data1)
+        elif command == 0xB0:
+            fs.cc(channel, data1, data2)
+        elif command == 0xC0:
+            fs.program_change(channel, data1)
+        elif command == 0xE0:
+            fs.pitch_bend(channel, ((data2 << 7) | data1) - 8192)
+        elif command == 0xD0 and hasattr(fs, 'channel_pressure'):
+            fs.channel_pressure(channel, data1)
+        elif command == 0xA0 and hasattr(fs, 'key_pressure'):
+            fs.key_pressure(channel, data1, data2)
+        else:
+            continue
+        delivered += 1
+    return delivered
+
 @dataclass
 class AudioSettings:
     """Audio system settings"""
@@ -445,6 +471,40 @@ class AudioManager(QObject):
         # Don't add to active_notes for auto-stop (playback engine handles timing)
         return success
     
+    def send_note_messages(self, messages: List[List[int]]) -> int:
+        """Send a batch of channel messages, resolving the output backend once.
+
+        FluidSynth takes notes, CC, program, pitch bend and aftertouch; the other
+        backends take notes only. Returns the number of messages delivered.
+        """
+        if MACOS_AUDIO_AVAILABLE and hasattr(self, 'macos_audio') and self.macos_audio:
+            note_on, note_off = self.macos_audio.play_note, self.macos_audio.stop_note
+        elif self.use_fluidsynth and self.fluidsynth_audio and self.fluidsynth_audio.is_initialized:
+            try:
+                return send_fluidsynth_messages(self.fluidsynth_audio.fs, messages)
+            except Exception as e:
+                print_debug(f"AudioManager: Error sending message batch: {e}")
+                return 0
+        elif self.midi_device:
+            note_on, note_off = self.midi_device.send_note_on, self.midi_device.send_note_off
+        else:
+            return 0
+        
+        delivered = 0
+        try:
+            for status, pitch, velocity in messages:
+                command = status & 0xF0
+                if command == 0x90 and velocity > 0:
+                    note_on(status & 0x0F, pitch, velocity)
+                elif command == 0x80 or command == 0x90:
+                    note_off(status & 0x0F, pitch)
+                else:
+                    continue
+                delivered += 1
+        except Exception as e:
+            print_debug(f"AudioManager: Error sending note batch: {e}")
+        return delivered
+    
     def stop_note_immediate(self, pitch: int, channel: int = None) -> bool:
         """Stop a note immediately (for playback engine)"""
         success = False
@@ -0,0 +1,367 @@
+"""
+Autosave Service
+Writes the open project to an autosave file on a worker thread, at an interval
+or after a number of edits. The GUI thread copies the track settings and note
+fields into typed arrays (a consistent snapshot between two commands) and the
+worker serializes that snapshot.
+
+Every command is also appended to an edit journal; each snapshot folds the
+journal, and a journal left behind by a crash is replayed on top of its snapshot.
+"""
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src.atomic_file import atomic_write
+from src.command_system import Command, CommandHistory
+from src.midi_data_model import MidiProject, MidiTrack
+from src.project_file import NoteColumns, write_project, load_project_file, PROJECT_FILE_EXTENSION
+from src.edit_journal import EditJournal, read_journal, replay_journal
+from src.logger import print_debug
+
+AUTOSAVE_DIRECTORY = os.path.expanduser("~/.pydomino_autosave")
+AUTOSAVE_SUFFIX = ".autosave" + PROJECT_FILE_EXTENSION
+JOURNAL_SUFFIX = ".journal"
+# Files of a crashed session are renamed so the new session can't overwrite them
+CRASHED_SNAPSHOT_SUFFIX = ".crashed" + PROJECT_FILE_EXTENSION
+CRASHED_JOURNAL_SUFFIX = ".journal.crashed"
+
+
+@dataclass
+class AutosaveRequest:
+    """What the GUI thread hands to the worker"""
+    project: MidiProject            # Snapshot; its tracks carry no MidiNote objects
+    note_columns: Dict[int, NoteColumns]
+    edit_state: Dict[str, Any]
+    file_path: str
+    generation: int = 0             # Command history generation the snapshot reflects
+    journal: Optional[EditJournal] = None
+    gui_ms: float = 0.0
+
+
+def snapshot_project(project: MidiProject) -> Tuple[MidiProject, Dict[int, NoteColumns]]:
+    """Copy the project for the worker (GUI thread): track settings and events, plus note columns per track"""
+    snapshot = MidiProject()
+    snapshot.ticks_per_beat = project.ticks_per_beat
+    snapshot.tempo_changes = [copy.copy(change) for change in project.tempo_changes]
+    snapshot.time_signature_changes = [copy.copy(change) for change in project.time_signature_changes]
+    snapshot.tracks = []
+    for track in project.tracks:
+        track_copy = MidiTrack(name=track.name, channel=track.channel, program=track.program, color=track.color)
+        track_copy.events = track.events.copy()
+        snapshot.tracks.append(track_copy)
+    note_columns = {index: NoteColumns(track.notes) for index, track in enumerate(project.tracks)}
+    return snapshot, note_columns
+
+
+def _autosave_base(project_name: str) -> str:
+    """Autosave file stem: the file name plus a hash of its absolute path, so equally named files don't collide"""
+    base = os.path.splitext(os.path.basename(project_name))[0] or "Untitled"
+    path_hash = hashlib.sha1(os.path.abspath(project_name).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(AUTOSAVE_DIRECTORY, re.sub(r'[^\w\-. ]', '_', base) + '-' + path_hash)
+
+
+def autosave_path_for(project_name: str) -> str:
+    """Autosave file for a project name (file name or 'Untitled')"""
+    return _autosave_base(project_name) + AUTOSAVE_SUFFIX
+
+
+def journal_path_for(project_name: str) -> str:
+    """Edit journal file for a project name"""
+    return _autosave_base(project_name) + JOURNAL_SUFFIX
+
+
+@dataclass
+class CrashedSession:
+    """Autosave snapshot and edit journal left behind by a session that didn't shut down cleanly"""
+    name: str
+    snapshot_path: str
+    journal_path: str
+    modified: float
+
+    @property
+    def display_name(self) -> str:
+        """Project file name without the path hash"""
+        return re.sub(r'-[0-9a-f]{12}$', '', self.name)
+
+
+def collect_crashed_sessions() -> List[CrashedSession]:
+    """Find journals of crashed sessions (newest first), moving them out of the new session's way"""
+    if not os.path.isdir(AUTOSAVE_DIRECTORY):
+        return []
+    sessions = []
+    for entry in os.listdir(AUTOSAVE_DIRECTORY):
+        if entry.endswith(JOURNAL_SUFFIX):
+            name = entry[:-len(JOURNAL_SUFFIX)]
+            snapshot_source = os.path.join(AUTOSAVE_DIRECTORY, name + AUTOSAVE_SUFFIX)
+        elif entry.endswith(CRASHED_JOURNAL_SUFFIX):
+            name = entry[:-len(CRASHED_JOURNAL_SUFFIX)]
+            snapshot_source = os.path.join(AUTOSAVE_DIRECTORY, name + CRASHED_SNAPSHOT_SUFFIX)
+        else:
+            continue
+
+        session = CrashedSession(name, os.path.join(AUTOSAVE_DIRECTORY, name + CRASHED_SNAPSHOT_SUFFIX),
+                                 os.path.join(AUTOSAVE_DIRECTORY, name + CRASHED_JOURNAL_SUFFIX), 0.0)
+        try:
+            os.replace(os.path.join(AUTOSAVE_DIRECTORY, entry), session.journal_path)
+            if not os.path.exists(snapshot_source):
+                discard_session(session)  # Crashed before the first snapshot; nothing to replay onto
+                continue
+            os.replace(snapshot_source, session.snapshot_path)
+            session.modified = os.path.getmtime(session.journal_path)
+        except OSError as e:
+            print(f"Error collecting crashed session {name}: {e}")
+            continue
+        sessions.append(session)
+    sessions.sort(key=lambda session: session.modified, reverse=True)
+    return sessions
+
+
+def recover_session(session: CrashedSession) -> Tuple[MidiProject, Dict[str, Any], int]:
+    """Load a crashed session's snapshot and replay its journal; returns (project, edit state, commands replayed)"""
+    project, edit_state = load_project_file(session.snapshot_path)
+    session_id, _ = read_journal(session.journal_path)
+    if session_id != edit_state.get('journal_session'):
+        return project, edit_state, 0  # Journal belongs to a newer session than the snapshot
+    replayed = replay_journal(project, session.journal_path, edit_state.get('journal_generation', 0))
+    return project, edit_state, replayed
+
+
+def discard_session(session: CrashedSession):
+    """Delete a crashed session's files"""
+    for path in (session.snapshot_path, session.journal_path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class AutosaveService(QObject):
+    """Saves the attached project in the background while it has unsaved edits"""
+
+    # Signals (emitted from the worker thread; delivered queued to the GUI thread)
+    saved = Signal(str, float, float)   # file path, GUI thread time (ms), worker write time (s)
+    failed = Signal(str)                # error message
+
+    def __init__(self, interval_seconds: int = 60, edits_threshold: int = 50):
+        super().__init__()
+        self.interval_seconds = interval_seconds
+        self.edits_threshold = edits_threshold
+        self.enabled = True
+
+        self.project: Optional[MidiProject] = None
+        self.command_history: Optional[CommandHistory] = None
+        self.project_name = "Untitled"
+        self.journal: Optional[EditJournal] = None
+        self.edit_state_provider: Optional[Callable[[], Dict[str, Any]]] = None
+
+        self.edits_since_save = 0
+        self.dirty = False
+
+        # Statistics
+        self.saves = 0
+        self.failures = 0
+        self.last_gui_ms = 0.0
+        self.max_gui_ms = 0.0
+        self.last_write_seconds = 0.0
+
+        # Worker: a single pending slot, newer requests replace an unstarted one
+        self._pending: Optional[AutosaveRequest] = None
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="AutosaveWorker", daemon=True)
+        self._thread.start()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._on_timer)
+        self.timer.start(self.interval_seconds * 1000)
+
+    def configure(self, enabled: bool, interval_seconds: int, edits_threshold: int):
+        """Apply autosave settings"""
+        self.enabled = enabled
+        self.interval_seconds = interval_seconds
+        self.edits_threshold = edits_threshold
+        self.timer.start(self.interval_seconds * 1000)
+
+    def attach(self, project: MidiProject, command_history: Optional[CommandHistory], project_name: str = "Untitled"):
+        """Autosave a (newly opened) project"""
+        if self.command_history is not None:
+            self.command_history.remove_listener(self._on_command)
+        if self.journal is not None:
+            self.journal.close(delete=True)
+            self.journal = None
+        self.project = project
+        self.command_history = command_history
+        self.project_name = project_name
+        self.edits_since_save = 0
+        self.dirty = False
+
+        if command_history is not None:
+            command_history.add_listener(self._on_command)
+            if self.enabled:
+                try:
+                    session_id = int.from_bytes(os.urandom(8), 'little')
+                    self.journal = EditJournal(journal_path_for(project_name), project, session_id)
+                except OSError as e:
+                    print(f"Error creating edit journal: {e}")
+
+        # Baseline snapshot the journal continues from
+        self.request_save()
+
+    def set_edit_state_provider(self, provider: Callable[[], Dict[str, Any]]):
+        """Callback returning edit state (track settings, playhead...) saved with the project"""
+        self.edit_state_provider = provider
+
+    def get_autosave_path(self) -> str:
+        return autosave_path_for(self.project_name)
+
+    def _on_command(self, command: Command, action: str):
+        journal = self.journal
+        if journal is not None:
+            was_broken = journal.broken
+            journal.record(command, action, self.command_history.generation)
+            if journal.broken and not was_broken:
+                self.request_save()  # The journal can't replay past this command; snapshot it now
+                return
+        self.mark_dirty()
+
+    def track_list_changed(self, *args):
+        """Tracks were added or removed outside the command history. Journal records
+        address tracks by index, so replay must not cross this point onto an older
+        snapshot: stop it here and snapshot the new track list now"""
+        if self.command_history is not None:
+            self.command_history.note_external_edit()
+            if self.journal is not None:
+                self.journal.record_stop(self.command_history.generation)
+        if not self.request_save():
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        """Record an edit; saves right away once edits_threshold edits have accumulated"""
+        self.dirty = True
+        self.edits_since_save += 1
+        if self.edits_since_save >= self.edits_threshold:
+            self.request_save()
+
+    def _on_timer(self):
+        if self.dirty:
+            self.request_save()
+
+    def request_save(self) -> bool:
+        """Queue a snapshot of the project for the worker (GUI thread)"""
+        start = time.perf_counter()
+        project = self.project
+        if not self.enabled or project is None:
+            return False
+        if any(track.loading for track in project.tracks):
+            return False  # Wait until a progressive load has finished
+        generation = self.command_history.generation if self.command_history else 0
+        if generation & 1:
+            return False  # Called from inside a command; the project is mid-edit
+
+        edit_state = self.edit_state_provider() if self.edit_state_provider else {}
+        edit_state['project_name'] = self.project_name
+        edit_state['journal_generation'] = generation
+        if self.journal is not None:
+            edit_state['journal_session'] = self.journal.session_id
+        snapshot, note_columns = snapshot_project(project)
+        request = AutosaveRequest(snapshot, note_columns, edit_state, self.get_autosave_path(), generation,
+                                  self.journal)
+        with self._condition:
+            self._pending = request
+            self._condition.notify()
+        self.edits_since_save = 0
+        self.dirty = False
+
+        request.gui_ms = (time.perf_counter() - start) * 1000
+        self.last_gui_ms = request.gui_ms
+        self.max_gui_ms = max(self.max_gui_ms, request.gui_ms)
+        return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                request = self._pending
+                self._pending = None
+            self._write(request)
+
+    def _write(self, request: AutosaveRequest):
+        """Serialize a request's snapshot (worker thread)"""
+        start = time.perf_counter()
+        try:
+            os.makedirs(os.path.dirname(request.file_path), exist_ok=True)
+            with atomic_write(request.file_path) as f:
+                write_project(f, request.project, request.edit_state, request.note_columns)
+            if request.journal is not None:
+                request.journal.compact(request.generation)  # The snapshot now holds these edits
+        except Exception as e:
+            self.failures += 1
+            self.dirty = True
+            self.failed.emit(str(e))
+            return
+
+        self.last_write_seconds = time.perf_counter() - start
+        self.saves += 1
+        print_debug(f"Autosaved {request.file_path} (GUI {request.gui_ms:.3f} ms, "
+                    f"write {self.last_write_seconds:.3f} s)")
+        self.saved.emit(request.file_path, request.gui_ms, self.last_write_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Autosave and journal counters and timings"""
+        stats = {
+            'saves': self.saves,
+            'failures': self.failures,
+            'last_gui_ms': self.last_gui_ms,
+            'max_gui_ms': self.max_gui_ms,
+            'last_write_seconds': self.last_write_seconds,
+        }
+        if self.journal is not None:
+            stats['journal'] = self.journal.get_stats()
+        return stats
+
+    def shutdown(self):
+        """Stop the timer and the worker thread"""
+        self.timer.stop()
+        if self.command_history is not None:
+            self.command_history.remove_listener(self._on_command)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join(timeout=5.0)
+        if self.journal is not None:
+            self.journal.close(delete=True)  # Clean shutdown: nothing to recover
+            self.journal = None
+
+
+# Global autosave service instance
+_autosave_service: Optional[AutosaveService] = None
+
+def get_autosave_service() -> Optional[AutosaveService]:
+    """Get the global autosave service"""
+    return _autosave_service
+
+def initialize_autosave_service(interval_seconds: int = 60, edits_threshold: int = 50) -> AutosaveService:
+    """Initialize the global autosave service"""
+    global _autosave_service
+    if _autosave_service is not None:
+        _autosave_service.shutdown()
+    _autosave_service = AutosaveService(interval_seconds, edits_threshold)
+    return _autosave_service
+
+def cleanup_autosave_service():
+    """Clean up the global autosave service"""
+    global _autosave_service
+    if _autosave_service:
+        _autosave_service.shutdown()
+        _autosave_service = None
@@ -2,7 +2,7 @@
 Command pattern implementation for Undo/Redo system
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, List, Optional
 from src.midi_data_model import MidiNote, MidiTrack, MidiProject
 
 
@@ -157,10 +157,39 @@ class CommandHistory:
     def __init__(self):
         self.commands: List[Command] = []
         self.current_index = -1
+        # Edit counter, odd while a command is changing the project; readers on other
+        # threads compare it before and after reading to detect concurrent edits
+        self.generation = 0
+        self.listeners: List[Callable[[Command, str], None]] = []  # (command, 'execute' | 'undo' | 'redo')
+    
+    def add_listener(self, callback: Callable[[Command, str], None]):
+        """Call back after every executed, undone or redone command"""
+        self.listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[Command, str], None]):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def _apply(self, command: Command, action: str):
+        """Run a command step inside the edit counter and notify listeners"""
+        self.generation += 1
+        try:
+            if action == 'undo':
+                command.undo()
+            else:
+                command.execute()
+        finally:
+            self.generation += 1
+        for listener in self.listeners:
+            listener(command, action)
+    
+    def note_external_edit(self):
+        """Count a change made outside the history (e.g. a track added) as an edit"""
+        self.generation += 2
     
     def execute_command(self, command: Command):
         """Execute a command and add it to history"""
-        command.execute()
+        self._apply(command, 'execute')
         
         # Remove any commands after current index (for redo after undo)
         self.commands = self.commands[:self.current_index + 1]
@@ -173,7 +202,7 @@ class CommandHistory:
         """Undo the last command"""
         if self.current_index >= 0:
             command = self.commands[self.current_index]
-            command.undo()
+            self._apply(command, 'undo')
             self.current_index -= 1
             return True
         return False
@@ -183,7 +212,7 @@ class CommandHistory:
         if self.current_index < len(self.commands) - 1:
             self.current_index += 1
             command = self.commands[self.current_index]
-            command.execute()
+            self._apply(command, 'redo')
             return True
         return False
     
@@ -0,0 +1,347 @@
+"""
+Edit Journal
+Append-only binary log of the commands run through CommandHistory, so edits made
+after the last autosave snapshot can be replayed after a crash.
+
+File layout:
+    header   '<8sQ'  magic, session id (matches the snapshot the journal continues)
+    records  '<III'  payload length, CRC-32 of the payload, history generation
+             payload '<BB' command code, action, then the command's fields
+
+Notes are referenced by MidiNote.id, which snapshots store alongside the notes.
+Records are buffered in memory and written + fsynced by a background thread in
+batches; a torn record at the end of the file is ignored on replay.
+"""
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.atomic_file import atomic_write
+from src.command_system import (Command, AddNoteCommand, DeleteNoteCommand, MoveNoteCommand, ResizeNoteCommand,
+                                DeleteMultipleNotesCommand, PasteNotesCommand, CutNotesCommand,
+                                MoveMultipleNotesCommand, ResizeMultipleNotesCommand)
+from src.midi_data_model import MidiNote, MidiProject, reserve_note_ids
+
+JOURNAL_MAGIC = b'PYDJRNL1'
+JOURNAL_HEADER_FORMAT = '<8sQ'
+JOURNAL_HEADER_SIZE = struct.calcsize(JOURNAL_HEADER_FORMAT)
+RECORD_HEADER = struct.Struct('<III')
+
+# Seconds between batched write + fsync of pending records
+JOURNAL_FSYNC_INTERVAL = 0.25
+
+# Actions
+ACTION_EXECUTE = 0
+ACTION_UNDO = 1
+ACTION_REDO = 2
+ACTION_CODES = {'execute': ACTION_EXECUTE, 'undo': ACTION_UNDO, 'redo': ACTION_REDO}
+
+# Command codes
+CMD_UNSUPPORTED = 0  # Replay stops here: the command's effect can't be reproduced
+CMD_ADD_NOTE = 1
+CMD_DELETE_NOTE = 2
+CMD_MOVE_NOTE = 3
+CMD_RESIZE_NOTE = 4
+CMD_DELETE_MULTIPLE = 5
+CMD_PASTE_NOTES = 6
+CMD_CUT_NOTES = 7
+CMD_MOVE_MULTIPLE = 8
+CMD_RESIZE_MULTIPLE = 9
+
+PAYLOAD_HEADER = struct.Struct('<BB')   # command code, action
+COUNT = struct.Struct('<I')
+# note id, track index, pitch, start, end, velocity, channel, volume, expression
+NOTE = struct.Struct('<IHBiiBBBB')
+# note id, old start, old pitch, new start, new pitch, old end, duration
+MOVE = struct.Struct('<IiBiBii')
+# note id, old start, old pitch, new start, new pitch
+MOVE_ITEM = struct.Struct('<IiBiB')
+# note id, old start, old end, new start, new end
+RESIZE = struct.Struct('<Iiiii')
+
+
+class UnsupportedCommandError(Exception):
+    """A command (or a track it refers to) can't be journaled"""
+
+
+def _pack_note(track_index: int, note: MidiNote) -> bytes:
+    return NOTE.pack(note.id, track_index, note.pitch, note.start_tick, note.end_tick,
+                     note.velocity, note.channel, note.volume, note.expression)
+
+
+def _pack_track_notes(track_indices: Dict[int, int], pairs) -> bytes:
+    out = [COUNT.pack(len(pairs))]
+    for track, note in pairs:
+        out.append(_pack_note(track_indices[id(track)], note))
+    return b''.join(out)
+
+
+def encode_command(command: Command, track_indices: Dict[int, int]) -> Tuple[int, bytes]:
+    """Command code and body for a command; track_indices maps id(track) to its project index"""
+    try:
+        kind = type(command)
+        if kind is AddNoteCommand:
+            return CMD_ADD_NOTE, _pack_note(track_indices[id(command.track)], command.note)
+        if kind is DeleteNoteCommand:
+            return CMD_DELETE_NOTE, _pack_note(track_indices[id(command.track)], command.note)
+        if kind is MoveNoteCommand:
+            return CMD_MOVE_NOTE, MOVE.pack(command.note.id, command.old_start_tick, command.old_pitch,
+                                            command.new_start_tick, command.new_pitch,
+                                            command.old_end_tick, command.duration)
+        if kind is ResizeNoteCommand:
+            return CMD_RESIZE_NOTE, RESIZE.pack(command.note.id, command.old_start_tick, command.old_end_tick,
+                                                command.new_start_tick, command.new_end_tick)
+        if kind is DeleteMultipleNotesCommand:
+            return CMD_DELETE_MULTIPLE, _pack_track_notes(track_indices, command.track_note_pairs)
+        if kind is CutNotesCommand:
+            return CMD_CUT_NOTES, _pack_track_notes(track_indices, command.track_note_pairs)
+        if kind is PasteNotesCommand:
+            return CMD_PASTE_NOTES, _pack_track_notes(track_indices, [(command.track, note) for note in command.notes])
+        if kind is MoveMultipleNotesCommand:
+            items = command.notes_with_deltas
+            return CMD_MOVE_MULTIPLE, COUNT.pack(len(items)) + b''.join(
+                MOVE_ITEM.pack(note.id, old_start, old_pitch, new_start, new_pitch)
+                for note, old_start, old_pitch, new_start, new_pitch in items)
+        if kind is ResizeMultipleNotesCommand:
+            items = command.notes_with_resize_data
+            return CMD_RESIZE_MULTIPLE, COUNT.pack(len(items)) + b''.join(
+                RESIZE.pack(note.id, old_start, old_end, new_start, new_end)
+                for note, old_start, old_end, new_start, new_end in items)
+    except (KeyError, struct.error) as e:
+        raise UnsupportedCommandError(str(e))
+    raise UnsupportedCommandError(type(command).__name__)
+
+
+class _Decoder:
+    """Rebuilds commands against a restored project"""
+
+    def __init__(self, project: MidiProject):
+        self.project = project
+        self.notes: Dict[int, MidiNote] = {note.id: note for track in project.tracks for note in track.notes}
+
+    def _note(self, note_id: int) -> MidiNote:
+        return self.notes[note_id]
+
+    def _unpack_note(self, body: bytes, offset: int):
+        note_id, track_index, pitch, start, end, velocity, channel, volume, expression = NOTE.unpack_from(body, offset)
+        note = self.notes.get(note_id)
+        if note is None:
+            # Created after the snapshot (added or pasted); rebuild it with its original id
+            note = MidiNote(pitch, start, end, velocity, channel)
+            note.id = note_id
+            note.volume = volume
+            note.expression = expression
+            self.notes[note_id] = note
+            reserve_note_ids(note_id)
+        return self.project.tracks[track_index], note
+
+    def _unpack_track_notes(self, body: bytes) -> List[tuple]:
+        count, = COUNT.unpack_from(body, 0)
+        return [self._unpack_note(body, COUNT.size + i * NOTE.size) for i in range(count)]
+
+    def decode(self, code: int, body: bytes) -> Command:
+        if code in (CMD_ADD_NOTE, CMD_DELETE_NOTE):
+            track, note = self._unpack_note(body, 0)
+            return AddNoteCommand(track, note) if code == CMD_ADD_NOTE else DeleteNoteCommand(track, note)
+        if code == CMD_MOVE_NOTE:
+            note_id, old_start, old_pitch, new_start, new_pitch, old_end, duration = MOVE.unpack(body)
+            command = MoveNoteCommand(self._note(note_id), old_start, old_pitch, new_start, new_pitch)
+            command.old_end_tick = old_end
+            command.duration = duration
+            return command
+        if code == CMD_RESIZE_NOTE:
+            note_id, *ticks = RESIZE.unpack(body)
+            return ResizeNoteCommand(self._note(note_id), *ticks)
+        if code == CMD_DELETE_MULTIPLE:
+            return DeleteMultipleNotesCommand(self._unpack_track_notes(body))
+        if code == CMD_CUT_NOTES:
+            return CutNotesCommand(self._unpack_track_notes(body))
+        if code == CMD_PASTE_NOTES:
+            pairs = self._unpack_track_notes(body)
+            track = pairs[0][0] if pairs else self.project.tracks[0]
+            return PasteNotesCommand(track, [note for _, note in pairs])
+        if code == CMD_MOVE_MULTIPLE:
+            return MoveMultipleNotesCommand([(self._note(note_id), *values) for note_id, *values
+                                             in MOVE_ITEM.iter_unpack(body[COUNT.size:])])
+        if code == CMD_RESIZE_MULTIPLE:
+            return ResizeMultipleNotesCommand([(self._note(note_id), *values) for note_id, *values
+                                               in RESIZE.iter_unpack(body[COUNT.size:])])
+        raise UnsupportedCommandError(f"command code {code}")
+
+
+class EditJournal:
+    """Append-only journal for one editing session (records are appended on the GUI thread)"""
+
+    def __init__(self, file_path: str, project: MidiProject, session_id: int,
+                 fsync_interval: float = JOURNAL_FSYNC_INTERVAL):
+        self.file_path = file_path
+        self.project = project
+        self.session_id = session_id
+        self.fsync_interval = fsync_interval
+
+        # Records since the last compaction: (generation, record bytes)
+        self.records: List[Tuple[int, bytes]] = []
+        self.broken = False        # An unsupported command was recorded; later records aren't replayable
+
+        # Statistics
+        self.appended = 0
+        self.append_seconds = 0.0
+        self.max_append_seconds = 0.0
+        self.syncs = 0
+        self.compactions = 0
+
+        self._pending = bytearray()
+        self._lock = threading.Lock()       # Guards _pending and records
+        self._file_lock = threading.Lock()  # Guards the file (flush vs. compaction)
+        self._stop_event = threading.Event()
+        self._closed = False
+
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        self._file = open(file_path, 'wb')
+        self._file.write(struct.pack(JOURNAL_HEADER_FORMAT, JOURNAL_MAGIC, session_id))
+        self._sync()
+
+        self._thread = threading.Thread(target=self._run, name="EditJournalWriter", daemon=True)
+        self._thread.start()
+
+    def record(self, command: Command, action: str, generation: int):
+        """Append a record for a command that just ran (GUI thread)"""
+        start = time.perf_counter()
+        track_indices = {id(track): index for index, track in enumerate(self.project.tracks)}
+        try:
+            code, body = encode_command(command, track_indices)
+        except UnsupportedCommandError:
+            code, body = CMD_UNSUPPORTED, b''
+            self.broken = True
+        self._append(PAYLOAD_HEADER.pack(code, ACTION_CODES[action]) + body, generation)
+
+        elapsed = time.perf_counter() - start
+        self.appended += 1
+        self.append_seconds += elapsed
+        self.max_append_seconds = max(self.max_append_seconds, elapsed)
+
+    def record_stop(self, generation: int):
+        """Append a replay stop for a change made outside the command history (GUI thread)"""
+        self.broken = True
+        self._append(PAYLOAD_HEADER.pack(CMD_UNSUPPORTED, ACTION_EXECUTE), generation)
+
+    def _append(self, payload: bytes, generation: int):
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload), generation) + payload
+        with self._lock:
+            self._pending += record
+            self.records.append((generation, record))
+
+    def _run(self):
+        while not self._stop_event.wait(self.fsync_interval):
+            self.flush()
+
+    def flush(self):
+        """Write and fsync pending records"""
+        with self._file_lock:
+            if self._closed:
+                return
+            with self._lock:
+                if not self._pending:
+                    return
+                data = bytes(self._pending)
+                self._pending.clear()
+            self._file.write(data)
+            self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.syncs += 1
+
+    def compact(self, snapshot_generation: int):
+        """Drop records folded into a snapshot taken at snapshot_generation (background thread)"""
+        with self._file_lock:
+            if self._closed:
+                return
+            with self._lock:
+                self.records = [entry for entry in self.records if entry[0] > snapshot_generation]
+                retained = b''.join(record for _, record in self.records)
+                self._pending.clear()
+                if not self.records:
+                    self.broken = False  # The snapshot now covers the unsupported command
+            self._file.close()
+            with atomic_write(self.file_path) as f:
+                f.write(struct.pack(JOURNAL_HEADER_FORMAT, JOURNAL_MAGIC, self.session_id))
+                f.write(retained)
+            self._file = open(self.file_path, 'ab')
+        self.compactions += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            'records': self.appended,
+            'pending_records': len(self.records),
+            'average_append_us': self.append_seconds / self.appended * 1e6 if self.appended else 0.0,
+            'max_append_us': self.max_append_seconds * 1e6,
+            'syncs': self.syncs,
+            'compactions': self.compactions,
+        }
+
+    def close(self, delete: bool = False):
+        """Flush and close; delete=True removes the file (clean shutdown)"""
+        self._stop_event.set()
+        self._thread.join(timeout=2.0)
+        self.flush()
+        with self._file_lock:
+            self._closed = True
+            self._file.close()
+        if delete:
+            try:
+                os.remove(self.file_path)
+            except OSError:
+                pass
+
+
+def read_journal(file_path: str) -> Tuple[int, List[Tuple[int, int, int, bytes]]]:
+    """Read a journal; returns (session id, [(generation, command code, action, body)])"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if len(data) < JOURNAL_HEADER_SIZE:
+        raise ValueError("Not a DominoPy edit journal")
+    magic, session_id = struct.unpack_from(JOURNAL_HEADER_FORMAT, data, 0)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError("Not a DominoPy edit journal")
+
+    entries = []
+    offset = JOURNAL_HEADER_SIZE
+    while offset + RECORD_HEADER.size <= len(data):
+        length, crc, generation = RECORD_HEADER.unpack_from(data, offset)
+        payload = data[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+        if len(payload) < max(length, PAYLOAD_HEADER.size) or zlib.crc32(payload) != crc:
+            break  # Torn write at the end of the file
+        code, action = PAYLOAD_HEADER.unpack_from(payload, 0)
+        entries.append((generation, code, action, payload[PAYLOAD_HEADER.size:]))
+        offset += RECORD_HEADER.size + length
+    return session_id, entries
+
+
+def replay_journal(project: MidiProject, file_path: str, after_generation: int,
+                   on_command: Optional[Callable[[Command, int], None]] = None) -> int:
+    """Re-run journaled commands newer than after_generation on project; returns the number replayed"""
+    _, entries = read_journal(file_path)
+    decoder = _Decoder(project)
+    replayed = 0
+    for generation, code, action, body in entries:
+        if generation <= after_generation:
+            continue
+        if code == CMD_UNSUPPORTED:
+            break
+        try:
+            command = decoder.decode(code, body)
+        except (KeyError, IndexError, struct.error, UnsupportedCommandError):
+            break
+        if action == ACTION_UNDO:
+            command.undo()
+        else:
+            command.execute()
+        if on_command:
+            on_command(command, action)
+        replayed += 1
+    return replayed
@@ -4,7 +4,7 @@ Grid and cell selection system for piano roll
 from typing import List, Optional, Tuple, Set
 from dataclasses import dataclass
 from PySide6.QtCore import QRectF, QPointF
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush
 from PySide6.QtCore import Qt
 
 
@@ -50,6 +50,12 @@ class GridManager:
         self.grid_ticks = ticks_per_beat // grid_division
         self.selected_cells: Set[GridCell] = set()
         self.paste_target_cell: Optional[GridCell] = None
+        
+        # Cell styles, built once
+        self._selected_fill = QBrush(QColor(100, 200, 255, 60))
+        self._selected_pen = QPen(QColor(100, 200, 255, 120), 2)
+        self._paste_target_fill = QBrush(QColor(255, 200, 100, 60))
+        self._paste_target_pen = QPen(QColor(255, 200, 100, 160), 2)
     
     def get_grid_cell_at_position(self, tick: int, pitch: int) -> GridCell:
         """Get the grid cell at a specific tick and pitch"""
@@ -136,32 +142,30 @@ class GridManager:
     def draw_grid_cells(self, painter: QPainter, pixels_per_tick: float, 
                        pixels_per_pitch: float, height: int, visible_start_tick: int):
         """Draw selected grid cells and paste target"""
-        # Draw selected cells
-        for cell in self.selected_cells:
-            self._draw_cell(painter, cell, pixels_per_tick, pixels_per_pitch, 
-                          height, visible_start_tick, 
-                          QColor(100, 200, 255, 60), QColor(100, 200, 255, 120))
+        # Draw selected cells (one drawRects call for all of them)
+        if self.selected_cells:
+            rects = [self._cell_rect(cell, pixels_per_tick, pixels_per_pitch, height, visible_start_tick)
+                     for cell in self.selected_cells]
+            painter.setBrush(self._selected_fill)
+            painter.setPen(self._selected_pen)
+            painter.drawRects(rects)
         
         # Draw paste target cell
         if self.paste_target_cell:
-            self._draw_cell(painter, self.paste_target_cell, pixels_per_tick, 
-                          pixels_per_pitch, height, visible_start_tick,
-                          QColor(255, 200, 100, 60), QColor(255, 200, 100, 160))
-    
-    def _draw_cell(self, painter: QPainter, cell: GridCell, pixels_per_tick: float,
-                   pixels_per_pitch: float, height: int, visible_start_tick: int,
-                   fill_color: QColor, border_color: QColor):
-        """Draw a single grid cell"""
-        # Calculate position
-        x = (cell.start_tick - visible_start_tick) * pixels_per_tick
+            painter.setBrush(self._paste_target_fill)
+            painter.setPen(self._paste_target_pen)
+            painter.drawRect(self._cell_rect(self.paste_target_cell, pixels_per_tick,
+                                             pixels_per_pitch, height, visible_start_tick))
+    
+    def _cell_rect(self, cell: GridCell, pixels_per_tick: float, pixels_per_pitch: float,
+                   height: int, visible_start_tick: int) -> QRectF:
+        """Widget rectangle of a single grid cell"""
+        # Calculate position (from the whole-pixel content origin, like the piano roll grid)
+        x = cell.start_tick * pixels_per_tick - round(visible_start_tick * pixels_per_tick)
         y = height - ((cell.pitch + 1) * pixels_per_pitch)
         width = (cell.end_tick - cell.start_tick) * pixels_per_tick
         cell_height = pixels_per_pitch
-        
-        # Draw cell
-        painter.setBrush(fill_color)
-        painter.setPen(QPen(border_color, 2))
-        painter.drawRect(int(x), int(y), int(width), int(cell_height))
+        return QRectF(int(x), int(y), int(width), int(cell_height))
     
     def update_grid_settings(self, ticks_per_beat: int, grid_division: int):
         """Update grid settings"""
@@ -0,0 +1,247 @@
+"""
+Import Cache
+Keeps parsed MIDI imports as .pydomino files so reopening a file skips parsing.
+Entries are keyed by a BLAKE2 hash of the file contents plus its size; the
+path's size and mtime are remembered so unchanged files aren't hashed again.
+Entries written by another reader or project format version are discarded.
+The cache directory is capped in size and evicts least recently used entries.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from src.atomic_file import atomic_write
+from src.midi_data_model import MidiProject
+from src.project_file import write_project, load_project_file, PROJECT_FILE_EXTENSION, PROJECT_FORMAT_VERSION
+from src.smf_reader import ParsedMidiFile, parse_midi_file, SMF_READER_VERSION
+
+IMPORT_CACHE_DIRECTORY = os.path.expanduser("~/.pydomino_cache/imports")
+IMPORT_CACHE_INDEX = "index.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Cached parses are only valid for the reader and project format that wrote them
+IMPORT_CACHE_VERSION = f"{SMF_READER_VERSION}.{PROJECT_FORMAT_VERSION}"
+
+
+def hash_file(file_path: str) -> str:
+    """BLAKE2b digest of a file's contents"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImportCache:
+    """Content-addressed cache of parsed MIDI files with LRU eviction"""
+
+    def __init__(self, directory: str = IMPORT_CACHE_DIRECTORY, max_bytes: int = 1024 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        # key -> {'bytes': entry size, 'last_used': timestamp}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # absolute source path -> {'size', 'mtime_ns', 'key'} (skips hashing unchanged files)
+        self.paths: Dict[str, Dict[str, Any]] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.hashes = 0
+
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, IMPORT_CACHE_INDEX)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + PROJECT_FILE_EXTENSION)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), 'r') as f:
+                data = json.load(f)
+            if data.get('version') != IMPORT_CACHE_VERSION:
+                self._discard_all_entries()
+                return
+            self.paths = data.get('paths', {})
+            # Keep only entries whose files still exist
+            self.entries = {key: entry for key, entry in data.get('entries', {}).items()
+                            if os.path.exists(self._entry_path(key))}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading import cache index: {e}")
+
+    def _discard_all_entries(self):
+        """Delete entry files written by another cache version and start a fresh index"""
+        removed = 0
+        for entry in os.listdir(self.directory):
+            if entry.endswith(PROJECT_FILE_EXTENSION):
+                try:
+                    os.remove(os.path.join(self.directory, entry))
+                    removed += 1
+                except OSError:
+                    pass
+        print(f"Import cache version changed, discarded {removed} entries")
+        self._save_index()
+
+    def _save_index(self):
+        try:
+            with atomic_write(self._index_path(), 'w') as f:
+                json.dump({'version': IMPORT_CACHE_VERSION, 'entries': self.entries, 'paths': self.paths}, f)
+        except Exception as e:
+            print(f"Error saving import cache index: {e}")
+
+    def key_for(self, file_path: str) -> str:
+        """Cache key of a file's current contents"""
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self._lock:
+            known = self.paths.get(file_path)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            return known['key']
+
+        key = f"{hash_file(file_path)}-{stat.st_size}"
+        with self._lock:
+            self.hashes += 1
+            self.paths[file_path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'key': key}
+        return key
+
+    def contains(self, file_path: str) -> bool:
+        """Check whether a file's parsed form is cached (doesn't count as a hit or miss)"""
+        try:
+            key = self.key_for(file_path)
+        except OSError:
+            return False
+        with self._lock:
+            return key in self.entries
+
+    def load(self, file_path: str) -> Optional[MidiProject]:
+        """Cached project for a file, or None on a miss"""
+        key = self.key_for(file_path)
+        with self._lock:
+            cached = key in self.entries
+        if cached:
+            try:
+                project, _ = load_project_file(self._entry_path(key))
+            except Exception as e:
+                print(f"Discarding unreadable import cache entry {key}: {e}")
+                self._remove(key)
+            else:
+                with self._lock:
+                    self.hits += 1
+                    self.entries[key]['last_used'] = time.time()
+                    self._save_index()
+                return project
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def store(self, file_path: str, parsed: ParsedMidiFile):
+        """Cache a parsed file; notes are written from the parsed arrays without building MidiNotes"""
+        key = self.key_for(file_path)
+        shell = parsed.to_project(with_notes=False)
+        base = len(shell.tracks) - len(parsed.tracks)
+        note_arrays = {base + index: track for index, track in enumerate(parsed.tracks)}
+
+        entry_path = self._entry_path(key)
+        try:
+            with atomic_write(entry_path) as f:
+                write_project(f, shell, note_arrays=note_arrays)
+        except Exception as e:
+            print(f"Error writing import cache entry: {e}")
+            return
+
+        with self._lock:
+            self.entries[key] = {'bytes': os.path.getsize(entry_path), 'last_used': time.time()}
+            self.stores += 1
+            self._evict()
+            self._save_index()
+
+    def load_midi_file(self, file_path: str, parallel: Optional[bool] = None) -> MidiProject:
+        """Load a MIDI file from the cache, parsing and caching it on a miss"""
+        project = self.load(file_path)
+        if project is not None:
+            return project
+        parsed = parse_midi_file(file_path, parallel)
+        self.store(file_path, parsed)
+        return parsed.to_project()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes (lock held)"""
+        total = sum(entry['bytes'] for entry in self.entries.values())
+        for key in sorted(self.entries, key=lambda key: self.entries[key]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= self.entries[key]['bytes']
+            self._delete_entry(key)
+            self.evictions += 1
+
+    def _delete_entry(self, key: str):
+        self.entries.pop(key, None)
+        self.paths = {path: info for path, info in self.paths.items() if info['key'] != key}
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def _remove(self, key: str):
+        with self._lock:
+            self._delete_entry(key)
+            self._save_index()
+
+    def clear(self):
+        """Delete every cached entry"""
+        with self._lock:
+            for key in list(self.entries):
+                self._delete_entry(key)
+            self.paths.clear()
+            self._save_index()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'hashes': self.hashes,
+                'entries': len(self.entries),
+                'bytes': sum(entry['bytes'] for entry in self.entries.values()),
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Global import cache instance
+_import_cache: Optional[ImportCache] = None
+
+def get_import_cache() -> Optional[ImportCache]:
+    """Get the global import cache (None when disabled)"""
+    return _import_cache
+
+def initialize_import_cache(max_bytes: int, directory: str = IMPORT_CACHE_DIRECTORY) -> Optional[ImportCache]:
+    """Initialize the global import cache"""
+    global _import_cache
+    try:
+        _import_cache = ImportCache(directory, max_bytes)
+    except OSError as e:
+        print(f"Import cache unavailable: {e}")
+        _import_cache = None
+    return _import_cache
+
+def cleanup_import_cache():
+    """Clean up the global import cache"""
+    global _import_cache
+    _import_cache = None
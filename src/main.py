@@ -1,9 +1,11 @@
 import sys
+import multiprocessing
 from PySide6.QtWidgets import QApplication
 from src.ui.main_window import DominoPyMainWindow
 
 def main():
     """Main application entry point"""
+    multiprocessing.freeze_support()  # Needed by the parallel MIDI loader in bundled builds
     app = QApplication(sys.argv)
     
     # Set application properties (for macOS menu bar)
@@ -0,0 +1,176 @@
+"""
+Measure Summary
+How many notes start in each measure of each track: a small tracks × measures
+table behind the overview strip. It is computed once from the note index and
+the bar map (measure start ticks from the time signature changes), then kept
+current through NoteIndex notifications, so reading it never touches the notes.
+"""
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from src.midi_data_model import MidiProject
+from src.note_index import NoteIndex
+
+SLACK_MEASURES = 4  # Empty measures kept after the last note
+
+
+class MeasureSummary:
+    """Per-track note counts per measure"""
+
+    def __init__(self, note_index: NoteIndex):
+        self.note_index = note_index
+        self.project: Optional[MidiProject] = None
+        self.measure_starts: List[int] = []  # Tick of every measure, plus the end of the last one
+        self.counts: List[array] = []        # Track position -> notes starting in each measure
+        self.version = 0                     # Bumped on every change, for caches of the rendered strip
+
+        self._bar_signature = None
+        self._dirty_tracks: Set[int] = set()
+        self._all_dirty = True
+
+        # Statistics
+        self.rebuilds = 0
+
+    def set_project(self, project: Optional[MidiProject]):
+        """Summarize a new project (computed on the next sync)"""
+        self.project = project
+        self._all_dirty = True
+        self.version += 1
+
+    def note_extent_changed(self, position: Optional[int], extent: Optional[Tuple[int, int, int]],
+                            filed: bool = True):
+        """NoteIndex listener: count a note in or out of its start measure"""
+        self.version += 1
+        if position is None:
+            self._all_dirty = True
+        elif extent is None:
+            self._dirty_tracks.add(position)
+        elif not self._all_dirty and position not in self._dirty_tracks and position < len(self.counts):
+            measure = self.measure_at(extent[0])
+            row = self.counts[position]
+            row[measure] = max(0, row[measure] + (1 if filed else -1))
+
+    @property
+    def measure_count(self) -> int:
+        return max(0, len(self.measure_starts) - 1)
+
+    def _bar_map_signature(self) -> tuple:
+        return (self.project.ticks_per_beat,
+                tuple((change.tick, change.numerator, change.denominator)
+                      for change in self.project.time_signature_changes))
+
+    def _ticks_per_measure_at(self, tick: int) -> int:
+        numerator, denominator = 4, 4
+        for change in sorted(self.project.time_signature_changes, key=lambda change: change.tick):
+            if change.tick > tick:
+                break
+            numerator, denominator = change.numerator, change.denominator
+        return max(1, self.project.calculate_ticks_per_measure(numerator, denominator))
+
+    def _extend_bar_map(self, end_tick: int):
+        """Append measures until the bar map reaches end_tick"""
+        if not self.measure_starts:
+            self.measure_starts = [0]
+        changes = sorted(self.project.time_signature_changes, key=lambda change: change.tick)
+        added = 0
+        while self.measure_starts[-1] <= end_tick:
+            tick = self.measure_starts[-1]
+            next_tick = tick + self._ticks_per_measure_at(tick)
+            # A time signature change starts a new measure
+            for change in changes:
+                if tick < change.tick < next_tick:
+                    next_tick = change.tick
+                    break
+            self.measure_starts.append(next_tick)
+            added += 1
+        if added:
+            for row in self.counts:
+                row.extend([0] * added)
+
+    def measure_at(self, tick: int) -> int:
+        """Measure index containing a tick (the bar map grows to reach it)"""
+        if not self.measure_starts or tick >= self.measure_starts[-1]:
+            self._extend_bar_map(tick)
+        return max(0, bisect_right(self.measure_starts, tick) - 1)
+
+    def tick_at(self, measure: float) -> int:
+        """Tick at a (fractional) measure position"""
+        if not self.measure_starts:
+            return 0
+        index = min(max(0, int(measure)), self.measure_count - 1)
+        start, end = self.measure_starts[index], self.measure_starts[index + 1]
+        return int(start + (end - start) * (measure - index))
+
+    def position_of(self, tick: int) -> float:
+        """Fractional measure position of a tick (inverse of tick_at), clamped to the
+        summarized measures. Unlike measure_at() it never grows the bar map, so
+        painting the visible range doesn't rescale the strip"""
+        if not self.measure_count:
+            return 0.0
+        if tick >= self.measure_starts[-1]:
+            return float(self.measure_count)
+        if tick <= self.measure_starts[0]:
+            return 0.0
+        index = max(0, bisect_right(self.measure_starts, tick) - 1)
+        start, end = self.measure_starts[index], self.measure_starts[index + 1]
+        return index + (tick - start) / (end - start)
+
+    def _count_track(self, position: int) -> array:
+        starts = [extent[0] for extent in self.note_index.extents(position)]
+        if starts:
+            self.measure_at(max(starts))
+        if NUMPY_AVAILABLE and starts:
+            measures = np.searchsorted(np.asarray(self.measure_starts), np.asarray(starts), side='right') - 1
+            counts = np.bincount(np.maximum(measures, 0), minlength=self.measure_count)
+            return array('i', counts[:self.measure_count].tolist())
+        row = array('i', [0] * self.measure_count)
+        for start in starts:
+            row[self.measure_at(start)] += 1
+        return row
+
+    def sync(self):
+        """Recompute whatever the bar map, a track list change or a re-indexed track made stale"""
+        if not self.project:
+            self.measure_starts, self.counts = [], []
+            return
+        self.note_index.sync()  # May report re-indexed tracks first
+
+        signature = self._bar_map_signature()
+        if signature != self._bar_signature or len(self.counts) != len(self.project.tracks):
+            self._all_dirty = True
+        if self._all_dirty:
+            self._bar_signature = signature
+            self.measure_starts = []
+            self.counts = []
+            self._extend_bar_map(0)
+            self.counts = [array('i', [0] * self.measure_count) for _ in self.project.tracks]
+            dirty = range(len(self.project.tracks))
+        else:
+            dirty = sorted(self._dirty_tracks)
+        for position in dirty:
+            if position < len(self.counts):
+                self.counts[position] = self._count_track(position)
+        if self._all_dirty:
+            # Keep a few empty measures after the content
+            for _ in range(SLACK_MEASURES):
+                self._extend_bar_map(self.measure_starts[-1])
+        if dirty:
+            self.rebuilds += 1
+            self.version += 1
+        self._all_dirty = False
+        self._dirty_tracks.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Table size and rebuild count"""
+        return {
+            'tracks': len(self.counts),
+            'measures': self.measure_count,
+            'rebuilds': self.rebuilds,
+        }
@@ -1,7 +1,20 @@
 
-from typing import List, Dict, Tuple, Optional
+import copy
+import itertools
+from array import array
+from typing import List, Dict, Tuple, Optional, Iterator
 from dataclasses import dataclass
 
+# Non-note event types stored in TrackEvents (channel events use their status nibble)
+EVENT_POLY_AFTERTOUCH = 0xA0
+EVENT_CONTROL_CHANGE = 0xB0
+EVENT_PROGRAM_CHANGE = 0xC0
+EVENT_CHANNEL_AFTERTOUCH = 0xD0
+EVENT_PITCH_BEND = 0xE0
+EVENT_SYSEX = 0xF0
+EVENT_SYSEX_ESCAPE = 0xF7
+EVENT_META = 0xFF
+
 @dataclass
 class AutomationPoint:
     """Represents a single automation point for parameter control"""
@@ -46,8 +59,18 @@ class TimeSignatureChange:
     def __str__(self):
         return f"{self.numerator}/{self.denominator}"
 
+# Source of MidiNote.id (unique per process; the edit journal refers to notes by id)
+_note_ids = itertools.count(1)
+
+def reserve_note_ids(highest_id: int):
+    """Make sure new notes get ids above highest_id (after restoring notes with saved ids)"""
+    global _note_ids
+    next_id = next(_note_ids)
+    _note_ids = itertools.count(max(next_id, highest_id + 1))
+
 class MidiNote:
     def __init__(self, pitch: int, start_tick: int, end_tick: int, velocity: int, channel: int = 0):
+        self.id = next(_note_ids)  # Stable identity for journaling and snapshots
         self.pitch = pitch  # MIDI note number (0-127)
         self.start_tick = start_tick # Start time in MIDI ticks
         self.end_tick = end_tick    # End time in MIDI ticks
@@ -63,6 +86,14 @@ class MidiNote:
         self.volume = 100        # Default volume (CC7)
         self.expression = 127    # Default expression (CC11)
 
+    def __deepcopy__(self, memo):
+        """Copies are new notes (clipboard/paste), so they get their own id"""
+        duplicate = MidiNote.__new__(MidiNote)
+        memo[id(self)] = duplicate
+        duplicate.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        duplicate.id = next(_note_ids)
+        return duplicate
+
     @property
     def duration(self):
         return self.end_tick - self.start_tick
@@ -266,6 +297,65 @@ class MidiNote:
         if not self.expression_automation:
             self.expression_automation = None
 
+class TrackEvents:
+    """
+    Non-note events of a track (CC, program, pitch bend, aftertouch, sysex, meta)
+    as parallel typed arrays in tick order: 8 bytes per event plus
+    sysex/meta payloads, which are kept in event order.
+    """
+    
+    def __init__(self):
+        self.ticks = array('I')
+        self.types = array('B')      # EVENT_* constant
+        self.channels = array('B')
+        self.data1 = array('B')      # Controller/program/pitch/bend LSB, or meta type
+        self.data2 = array('B')      # Value/pressure/bend MSB
+        self.payloads: List[bytes] = []  # Data of each sysex/meta event, in order
+    
+    def __len__(self) -> int:
+        return len(self.ticks)
+    
+    def append(self, tick: int, event_type: int, channel: int = 0, data1: int = 0, data2: int = 0,
+               payload: Optional[bytes] = None):
+        """Append an event (events must be appended in tick order)"""
+        self.ticks.append(tick)
+        self.types.append(event_type)
+        self.channels.append(channel)
+        self.data1.append(data1)
+        self.data2.append(data2)
+        if event_type >= EVENT_SYSEX:
+            self.payloads.append(payload or b'')
+    
+    def __iter__(self) -> Iterator[Tuple[int, int, int, int, int, Optional[bytes]]]:
+        """Iterate (tick, type, channel, data1, data2, payload) tuples"""
+        payloads = iter(self.payloads)
+        for tick, event_type, channel, data1, data2 in zip(self.ticks, self.types, self.channels,
+                                                           self.data1, self.data2):
+            yield tick, event_type, channel, data1, data2, (next(payloads) if event_type >= EVENT_SYSEX else None)
+    
+    def channel_events(self) -> Iterator[Tuple[int, int, int, int]]:
+        """Iterate (tick, status, data1, data2) for channel events only"""
+        for tick, event_type, channel, data1, data2 in zip(self.ticks, self.types, self.channels,
+                                                           self.data1, self.data2):
+            if event_type < EVENT_SYSEX:
+                yield tick, event_type | channel, data1, data2
+    
+    def copy(self, channel: Optional[int] = None) -> 'TrackEvents':
+        """Copy the events, optionally moving channel events to another channel"""
+        events = TrackEvents()
+        events.ticks = array('I', self.ticks)
+        events.types = array('B', self.types)
+        events.channels = array('B', self.channels) if channel is None else array('B', [channel]) * len(self.ticks)
+        events.data1 = array('B', self.data1)
+        events.data2 = array('B', self.data2)
+        events.payloads = list(self.payloads)
+        return events
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the event data"""
+        return len(self.ticks) * 8 + sum(len(payload) for payload in self.payloads)
+
 class MidiTrack:
     def __init__(self, name: str = "New Track", channel: int = 0, program: int = None, color: str = "#FF6B6B"):
         self.name = name
@@ -273,7 +363,8 @@ class MidiTrack:
         self.program = program # MIDI program number (instrument), None for empty tracks
         self.color = color     # Track color for visual distinction
         self.notes: List[MidiNote] = []
-        # Add other MIDI events later (e.g., CC, Pitch Bend)
+        self.events = TrackEvents()  # CC, program, pitch bend, aftertouch, sysex and meta events
+        self.loading = False   # True while a progressive file load hasn't parsed this track yet
 
 class MidiProject:
     def __init__(self):
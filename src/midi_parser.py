@@ -1,9 +1,28 @@
 
-from mido import MidiFile, Message, MetaMessage, MidiTrack as MidoTrack
+try:
+    from mido import MidiFile, MetaMessage
+    MIDO_AVAILABLE = True
+except ImportError:
+    MIDO_AVAILABLE = False
 from src.midi_data_model import MidiNote, MidiTrack, MidiProject
-from typing import List
+from src.smf_reader import read_midi_file
+from src.smf_writer import write_midi_file
+from src.import_cache import get_import_cache
+from typing import List, Optional
 
-def load_midi_file(file_path: str) -> MidiProject:
+def load_midi_file(file_path: str, parallel: Optional[bool] = None) -> MidiProject:
+    """Load a MIDI file with the byte-level SMF reader (tracks are decoded in parallel for large files)"""
+    import_cache = get_import_cache()
+    if import_cache:
+        try:
+            return import_cache.load_midi_file(file_path, parallel)
+        except OSError as e:
+            print(f"Import cache error, parsing directly: {e}")
+    return read_midi_file(file_path, parallel)
+
+
+def load_midi_file_mido(file_path: str) -> MidiProject:
+    """Load a MIDI file through mido (reference loader, used for benchmarking)"""
     project = MidiProject()
     mid = MidiFile(file_path)
 
@@ -79,119 +98,20 @@ def load_midi_file(file_path: str) -> MidiProject:
     return project
 
 
-def save_midi_file(midi_project: MidiProject, file_path: str) -> bool:
+def save_midi_file(midi_project: MidiProject, file_path: str, atomic: bool = True) -> bool:
     """
     Save a MidiProject to a MIDI file.
     
     Args:
         midi_project: The MidiProject to save
         file_path: Path where to save the MIDI file
+        atomic: Write to a temporary file and rename it over the target
         
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        # Create a new MIDI file
-        mid = MidiFile(ticks_per_beat=midi_project.ticks_per_beat)
-        
-        # Create tempo and time signature track (track 0)
-        meta_track = MidoTrack()
-        
-        # Add tempo changes
-        current_tempo_tick = 0
-        for tempo_change in midi_project.tempo_changes:
-            tick = tempo_change.tick
-            tempo = tempo_change.microseconds_per_beat  # MIDI tempo in microseconds per beat
-            
-            # Add delta time
-            delta_time = tick - current_tempo_tick
-            current_tempo_tick = tick
-            
-            # Create tempo meta message
-            tempo_msg = MetaMessage('set_tempo', tempo=tempo, time=delta_time)
-            meta_track.append(tempo_msg)
-        
-        # Add time signature changes
-        current_ts_tick = 0
-        for ts_change in midi_project.time_signature_changes:
-            tick = ts_change.tick
-            numerator = ts_change.numerator
-            denominator = ts_change.denominator
-            
-            # Add delta time
-            delta_time = tick - current_ts_tick
-            current_ts_tick = tick
-            
-            # Create time signature meta message
-            ts_msg = MetaMessage('time_signature', 
-                               numerator=numerator, 
-                               denominator=denominator,
-                               time=delta_time)
-            meta_track.append(ts_msg)
-        
-        # Add end of track message
-        meta_track.append(MetaMessage('end_of_track', time=0))
-        mid.tracks.append(meta_track)
-        
-        # Process each track
-        for track_index, midi_track in enumerate(midi_project.tracks):
-            if not midi_track.notes:
-                continue  # Skip empty tracks
-                
-            mido_track = MidoTrack()
-            
-            # Create a list of all MIDI events (note_on and note_off) with their timestamps
-            events = []
-            
-            for note in midi_track.notes:
-                # Note on event
-                events.append({
-                    'tick': note.start_tick,
-                    'type': 'note_on',
-                    'note': note.pitch,
-                    'velocity': note.velocity,
-                    'channel': note.channel
-                })
-                
-                # Note off event
-                events.append({
-                    'tick': note.end_tick,
-                    'type': 'note_off',
-                    'note': note.pitch,
-                    'velocity': 64,  # Standard note off velocity
-                    'channel': note.channel
-                })
-            
-            # Sort events by tick
-            events.sort(key=lambda x: x['tick'])
-            
-            # Convert absolute ticks to delta times and create MIDI messages
-            current_tick = 0
-            for event in events:
-                delta_time = event['tick'] - current_tick
-                current_tick = event['tick']
-                
-                if event['type'] == 'note_on':
-                    msg = Message('note_on',
-                                channel=event['channel'],
-                                note=event['note'],
-                                velocity=event['velocity'],
-                                time=delta_time)
-                elif event['type'] == 'note_off':
-                    msg = Message('note_off',
-                                channel=event['channel'],
-                                note=event['note'],
-                                velocity=event['velocity'],
-                                time=delta_time)
-                
-                mido_track.append(msg)
-            
-            # Add end of track message
-            mido_track.append(MetaMessage('end_of_track', time=0))
-            mid.tracks.append(mido_track)
-        
-        # Save the MIDI file
-        mid.save(file_path)
+        write_midi_file(midi_project, file_path, atomic)
         return True
         
     except Exception as e:
@@ -256,6 +256,53 @@ class MIDIRoutingManager(QObject):
             for secondary_id in self.settings.secondary_outputs:
                 self._send_to_device(secondary_id, message)
     
+    def send_midi_messages(self, messages: List[List[int]], device_id: Optional[str] = None):
+        """Send a batch of simultaneous MIDI messages as one burst per device"""
+        if not messages:
+            return
+        
+        if device_id:
+            self._send_batch_to_device(device_id, messages)
+            return
+        
+        if self.settings.primary_output:
+            self._send_batch_to_device(self.settings.primary_output, messages)
+        for secondary_id in self.settings.secondary_outputs:
+            self._send_batch_to_device(secondary_id, messages)
+    
+    def _send_batch_to_device(self, device_id: str, messages: List[List[int]]):
+        """Send several MIDI messages to a device, resolving the connection once"""
+        device = self.available_devices.get(device_id)
+        if not device:
+            return
+        
+        connection = self.active_connections.get(device_id)
+        if not connection:
+            return
+        
+        try:
+            if device.output_type == MIDIOutputType.INTERNAL_FLUIDSYNTH:
+                if self.settings.enable_internal_audio:
+                    from src.audio_system import get_audio_manager
+                    audio_manager = get_audio_manager()
+                    if audio_manager:
+                        audio_manager.send_note_messages(messages)
+            
+            elif device.output_type == MIDIOutputType.EXTERNAL_DEVICE and connection != "internal":
+                if self.settings.enable_external_routing:
+                    # rtmidi takes one complete message per call, so the burst is a tight
+                    # write loop; note-offs go out as running-status friendly 0x9n vel 0
+                    send = connection.send_message
+                    for message in messages:
+                        if message[0] & 0xF0 == 0x80:
+                            message = [0x90 | (message[0] & 0x0F), message[1], 0]
+                        elif message[0] & 0xE0 == 0xC0:
+                            message = message[:2]  # Program change / channel pressure carry one data byte
+                        send(message)
+        
+        except Exception as e:
+            self.connection_error.emit(f"Error sending MIDI to {device.name}: {str(e)}")
+    
     def _send_to_device(self, device_id: str, message: List[int]):
         """Send MIDI message to a specific device"""
         device = self.available_devices.get(device_id)
@@ -0,0 +1,152 @@
+"""
+Note Density
+Level-of-detail view of the notes for far zoom levels. Instead of hundreds of
+thousands of sub-pixel rectangles, the piano roll blits one QImage made from a
+pitch × column occupancy grid: how many notes cover each pitch within each
+column of ticks_per_column ticks.
+
+Grids are built with NumPy (np.add.at over the note arrays) and cached per zoom
+bucket, a power-of-two column width no wider than one pixel. They stay current
+through NoteIndex notifications: a filed or unfiled note adds or subtracts one
+over its columns, and a re-indexed track drops the grids until the next draw.
+"""
+import math
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from PySide6.QtCore import QRect, QRectF
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from src.midi_data_model import MidiProject
+
+PITCHES = 128
+MAX_ZOOM_BUCKETS = 3     # Grids kept at once
+DENSITY_LEVELS = 4       # Notes covering a cell at which it is drawn fully opaque
+COLUMN_SLACK = 256       # Extra columns allocated when an edit reaches past the grid
+
+
+def ticks_per_column(pixels_per_tick: float) -> int:
+    """Zoom bucket: the widest power-of-two column (in ticks) that is at most one pixel wide"""
+    return 1 << max(0, math.floor(math.log2(1.0 / pixels_per_tick)))
+
+
+class NoteDensity:
+    """Occupancy grids of a project's notes, one per zoom bucket"""
+
+    def __init__(self):
+        self.project: Optional[MidiProject] = None
+        self._grids: 'OrderedDict[int, np.ndarray]' = OrderedDict()  # ticks per column -> int32 (PITCHES, columns)
+        self._lut_color: Optional[str] = None
+        self._lut = None
+
+        # Statistics
+        self.builds = 0
+
+    def set_project(self, project: Optional[MidiProject]):
+        """Use a new project (grids are built on the next draw)"""
+        self.project = project
+        self._grids.clear()
+
+    def note_extent_changed(self, position: Optional[int], extent: Optional[Tuple[int, int, int]],
+                            filed: bool = True):
+        """NoteIndex listener: add or subtract a (start_tick, end_tick, pitch) extent in every grid"""
+        if extent is None:
+            self._grids.clear()
+            return
+        start_tick, end_tick, pitch = extent
+        if not 0 <= pitch < PITCHES:
+            return
+        step = 1 if filed else -1
+        for column_ticks, counts in list(self._grids.items()):
+            first = start_tick // column_ticks
+            last = max(end_tick - 1, start_tick) // column_ticks
+            if last >= counts.shape[1]:
+                grown = np.zeros((PITCHES, last + 1 + COLUMN_SLACK), dtype=np.int32)
+                grown[:, :counts.shape[1]] = counts
+                self._grids[column_ticks] = counts = grown
+            counts[pitch, first:last + 1] += step
+
+    def _build(self, column_ticks: int) -> 'np.ndarray':
+        """Occupancy grid of every note at one column width"""
+        notes = [note for track in self.project.tracks for note in track.notes]
+        count = len(notes)
+        starts = np.fromiter((note.start_tick for note in notes), dtype=np.int64, count=count)
+        ends = np.fromiter((note.end_tick for note in notes), dtype=np.int64, count=count)
+        pitches = np.fromiter((note.pitch for note in notes), dtype=np.int64, count=count)
+
+        inside = (pitches >= 0) & (pitches < PITCHES)
+        starts, ends, pitches = starts[inside], ends[inside], pitches[inside]
+        first = starts // column_ticks
+        last = np.maximum(ends - 1, starts) // column_ticks
+        columns = int(last.max()) + 1 + COLUMN_SLACK if len(last) else COLUMN_SLACK
+
+        # +1 where a note starts covering a pitch row, -1 after it ends, summed along the row
+        steps = np.zeros((PITCHES, columns + 1), dtype=np.int32)
+        np.add.at(steps, (pitches, first), 1)
+        np.add.at(steps, (pitches, last + 1), -1)
+        self.builds += 1
+        return np.cumsum(steps, axis=1, dtype=np.int32)[:, :columns]
+
+    def grid(self, column_ticks: int) -> 'np.ndarray':
+        """Cached grid for a zoom bucket, built if missing"""
+        counts = self._grids.get(column_ticks)
+        if counts is None:
+            counts = self._grids[column_ticks] = self._build(column_ticks)
+            while len(self._grids) > MAX_ZOOM_BUCKETS:
+                self._grids.popitem(last=False)
+        else:
+            self._grids.move_to_end(column_ticks)
+        return counts
+
+    def _color_table(self, color: str) -> 'np.ndarray':
+        """Premultiplied ARGB pixel per occupancy level (0 is transparent)"""
+        if color != self._lut_color:
+            base = QColor(color)
+            table = np.zeros(DENSITY_LEVELS + 1, dtype=np.uint32)
+            for level in range(1, DENSITY_LEVELS + 1):
+                # One note is clearly visible; overlapping notes get more opaque
+                alpha = 255 - (95 * (DENSITY_LEVELS - level)) // max(1, DENSITY_LEVELS - 1)
+                red, green, blue = (channel * alpha // 255 for channel in (base.red(), base.green(), base.blue()))
+                table[level] = (alpha << 24) | (red << 16) | (green << 8) | blue
+            self._lut_color, self._lut = color, table
+        return self._lut
+
+    def draw(self, painter: QPainter, pixels_per_tick: float, pixels_per_pitch: float,
+             view_x: int, view_y: int, clip: QRect, color: str):
+        """Blit the occupancy of the area under clip; (view_x, view_y) is the content point at widget (0, 0)"""
+        if not self.project or clip.isEmpty():
+            return
+        column_ticks = ticks_per_column(pixels_per_tick)
+        counts = self.grid(column_ticks)
+        column_width = column_ticks * pixels_per_tick
+
+        first_column = max(0, int((clip.left() + view_x) / column_width))
+        last_column = min(counts.shape[1] - 1, int((clip.right() + 1 + view_x) / column_width))
+        # Row 0 is the top pitch, as in content coordinates
+        first_row = max(0, int((clip.top() + view_y) / pixels_per_pitch))
+        last_row = min(PITCHES - 1, int((clip.bottom() + 1 + view_y) / pixels_per_pitch))
+        if last_column < first_column or last_row < first_row:
+            return
+
+        block = counts[::-1][first_row:last_row + 1, first_column:last_column + 1]
+        pixels = np.ascontiguousarray(self._color_table(color)[np.clip(block, 0, DENSITY_LEVELS)])
+        height, width = pixels.shape
+        image = QImage(pixels.data, width, height, width * 4, QImage.Format_ARGB32_Premultiplied)
+
+        target = QRectF(first_column * column_width - view_x, first_row * pixels_per_pitch - view_y,
+                        width * column_width, height * pixels_per_pitch)
+        painter.drawImage(target, image)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cached grids and build count"""
+        return {
+            'grids': len(self._grids),
+            'cells': sum(counts.size for counts in self._grids.values()),
+            'builds': self.builds,
+        }
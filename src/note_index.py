@@ -0,0 +1,285 @@
+"""
+Note Index
+Spatial index over a project's notes for the piano roll. Each track's notes are
+filed into cells of (tick bucket, pitch band); a note is listed in every tick
+bucket it spans, so a query only visits the cells under the requested
+tick × pitch rectangle and costs what is visible rather than the project size.
+
+Commands keep the index current through apply_command (a CommandHistory
+listener). A track whose note list was replaced or changed length outside the
+command system is re-indexed on the next query.
+
+Listeners are told which track position and (start_tick, end_tick, pitch)
+extent was filed or unfiled (extent None: the whole track was re-indexed;
+position None: the track list changed), so caches derived from the notes can
+update only what an edit touched.
+"""
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.command_system import (Command, AddNoteCommand, DeleteNoteCommand, MoveNoteCommand, ResizeNoteCommand,
+                                DeleteMultipleNotesCommand, PasteNotesCommand, CutNotesCommand,
+                                MoveMultipleNotesCommand, ResizeMultipleNotesCommand)
+from src.midi_data_model import MidiNote, MidiProject, MidiTrack
+
+BUCKET_TICKS = 1920   # One 4/4 measure at 480 ticks per beat
+PITCH_BAND = 12       # One octave per cell
+PITCH_BANDS = 128 // PITCH_BAND + 1
+
+
+def note_changes(command: Command, action: str) -> Optional[Tuple[List[tuple], List[tuple], List[MidiNote]]]:
+    """(added (track, note) pairs, removed (track, note) pairs, moved notes) for a command step, None if unknown"""
+    kind = type(command)
+    if kind is MoveNoteCommand or kind is ResizeNoteCommand:
+        return [], [], [command.note]
+    if kind is MoveMultipleNotesCommand:
+        return [], [], [item[0] for item in command.notes_with_deltas]
+    if kind is ResizeMultipleNotesCommand:
+        return [], [], [item[0] for item in command.notes_with_resize_data]
+
+    if kind is AddNoteCommand or kind is DeleteNoteCommand:
+        pairs = [(command.track, command.note)]
+    elif kind is PasteNotesCommand:
+        pairs = [(command.track, note) for note in command.notes]
+    elif kind is DeleteMultipleNotesCommand or kind is CutNotesCommand:
+        pairs = list(command.track_note_pairs)
+    else:
+        return None
+
+    adds = kind is AddNoteCommand or kind is PasteNotesCommand
+    if action == 'undo':
+        adds = not adds
+    return (pairs, [], []) if adds else ([], pairs, [])
+
+
+class _TrackIndex:
+    """Cells of one track"""
+    __slots__ = ('track', 'position', 'cells', 'locations', 'signature')
+
+    def __init__(self, track: MidiTrack, position: int):
+        self.track = track
+        self.position = position                                   # Index in project.tracks
+        self.cells: Dict[int, List[MidiNote]] = {}               # bucket * PITCH_BANDS + band -> notes
+        self.locations: Dict[MidiNote, Tuple[int, int, int]] = {}  # note -> (start_tick, end_tick, pitch) as filed
+        self.signature = None                                      # (id(track.notes), len) when last in sync
+
+
+class NoteIndex:
+    """Tick × pitch bucket index answering "which notes intersect this rectangle" """
+
+    def __init__(self, bucket_ticks: int = BUCKET_TICKS):
+        self.bucket_ticks = bucket_ticks
+        self.project: Optional[MidiProject] = None
+        self._tracks: List[_TrackIndex] = []
+        self.listeners: List[Callable[[Optional[int], Optional[Tuple[int, int, int]], bool], None]] = []
+
+        # Statistics
+        self.rebuilds = 0
+        self.last_query_visited = 0
+
+    def add_listener(self, callback: Callable[[Optional[int], Optional[Tuple[int, int, int]], bool], None]):
+        """Call back with (track position, (start_tick, end_tick, pitch), filed) for each note filed or unfiled"""
+        self.listeners.append(callback)
+
+    def _notify(self, position: Optional[int], extent: Optional[Tuple[int, int, int]], filed: bool = True):
+        for listener in self.listeners:
+            listener(position, extent, filed)
+
+    def set_project(self, project: Optional[MidiProject]):
+        """Index a new project (tracks are indexed lazily on the first query)"""
+        self.project = project
+        self._tracks = []
+        self._notify(None, None)
+
+    def invalidate(self):
+        """Re-index every track on the next query"""
+        for track_index in self._tracks:
+            track_index.signature = None
+
+    def _cell_span(self, extent: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """(first bucket, last bucket, band) of a (start_tick, end_tick, pitch) extent"""
+        start_tick, end_tick, pitch = extent
+        first = start_tick // self.bucket_ticks
+        last = (max(end_tick, start_tick + 1) - 1) // self.bucket_ticks
+        return first, last, pitch // PITCH_BAND
+
+    def _insert(self, track_index: _TrackIndex, note: MidiNote):
+        extent = (note.start_tick, note.end_tick, note.pitch)
+        first, last, band = self._cell_span(extent)
+        cells = track_index.cells
+        for bucket in range(first, last + 1):
+            key = bucket * PITCH_BANDS + band
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [note]
+            else:
+                cell.append(note)
+        track_index.locations[note] = extent
+        self._notify(track_index.position, extent)
+
+    def _remove(self, track_index: _TrackIndex, note: MidiNote):
+        extent = track_index.locations.pop(note, None)
+        if extent is None:
+            return
+        first, last, band = self._cell_span(extent)
+        cells = track_index.cells
+        for bucket in range(first, last + 1):
+            key = bucket * PITCH_BANDS + band
+            cell = cells.get(key)
+            if cell is not None:
+                try:
+                    cell.remove(note)
+                except ValueError:
+                    pass
+                if not cell:
+                    del cells[key]
+        self._notify(track_index.position, extent, False)
+
+    def _rebuild(self, track_index: _TrackIndex):
+        cells: Dict[int, List[MidiNote]] = {}
+        locations: Dict[MidiNote, Tuple[int, int, int]] = {}
+        bucket_ticks = self.bucket_ticks
+        for note in track_index.track.notes:
+            start = note.start_tick
+            first = start // bucket_ticks
+            last = (max(note.end_tick, start + 1) - 1) // bucket_ticks
+            band = note.pitch // PITCH_BAND
+            locations[note] = (start, note.end_tick, note.pitch)
+            for bucket in range(first, last + 1):
+                key = bucket * PITCH_BANDS + band
+                cell = cells.get(key)
+                if cell is None:
+                    cells[key] = [note]
+                else:
+                    cell.append(note)
+        track_index.cells = cells
+        track_index.locations = locations
+        track_index.signature = (id(track_index.track.notes), len(track_index.track.notes))
+        self.rebuilds += 1
+        self._notify(track_index.position, None)
+
+    def sync(self):
+        """Follow track additions/removals and re-index tracks changed outside commands"""
+        if not self.project:
+            return
+        tracks = self.project.tracks
+        if len(tracks) != len(self._tracks) or any(index.track is not track
+                                                  for index, track in zip(self._tracks, tracks)):
+            known = {id(index.track): index for index in self._tracks}
+            self._tracks = [known.get(id(track)) or _TrackIndex(track, position) for position, track in enumerate(tracks)]
+            for position, track_index in enumerate(self._tracks):
+                track_index.position = position
+            self._notify(None, None)  # Track positions shifted
+        for track_index in self._tracks:
+            notes = track_index.track.notes
+            if track_index.signature != (id(notes), len(notes)):
+                self._rebuild(track_index)
+
+    def _track_index_of(self, track: MidiTrack) -> Optional[_TrackIndex]:
+        for track_index in self._tracks:
+            if track_index.track is track:
+                return track_index
+        return None
+
+    def apply_command(self, command: Command, action: str):
+        """CommandHistory listener: update the cells of the notes a command touched"""
+        if not self.project:
+            return
+        changes = note_changes(command, action)
+        if changes is None:
+            self.invalidate()
+            return
+        added, removed, moved = changes
+
+        # Expected note count change per track, so an out-of-band change isn't masked
+        deltas: Dict[int, int] = {}
+        for track, note in removed:
+            track_index = self._track_index_of(track)
+            if track_index:
+                self._remove(track_index, note)
+                deltas[id(track_index)] = deltas.get(id(track_index), 0) - 1
+        for track, note in added:
+            track_index = self._track_index_of(track)
+            if track_index:
+                self._remove(track_index, note)
+                self._insert(track_index, note)
+                deltas[id(track_index)] = deltas.get(id(track_index), 0) + 1
+        for track_index in self._tracks:
+            delta = deltas.get(id(track_index))
+            if delta is not None and track_index.signature is not None:
+                notes_id, count = track_index.signature
+                if notes_id == id(track_index.track.notes) and count + delta == len(track_index.track.notes):
+                    track_index.signature = (notes_id, count + delta)
+                else:
+                    track_index.signature = None
+        self.update_notes(moved)
+
+    def update_notes(self, notes: Iterable[MidiNote]):
+        """Re-file notes whose position changed in place (commands, or notes being dragged)"""
+        for note in notes:
+            for track_index in self._tracks:
+                extent = track_index.locations.get(note)
+                if extent is not None:
+                    if extent != (note.start_tick, note.end_tick, note.pitch):
+                        self._remove(track_index, note)
+                        self._insert(track_index, note)
+                    break
+
+    def extents(self, position: int) -> Iterable[Tuple[int, int, int]]:
+        """(start_tick, end_tick, pitch) of every note filed for a track, as listeners were told"""
+        self.sync()
+        if 0 <= position < len(self._tracks):
+            return self._tracks[position].locations.values()
+        return ()
+
+    def query(self, start_tick: int, end_tick: int, low_pitch: int = 0, high_pitch: int = 127,
+              track: Optional[int] = None) -> Iterator[Tuple[int, MidiNote]]:
+        """(track index, note) for every note overlapping [start_tick, end_tick) × [low_pitch, high_pitch]
+
+        With track set, only that track (by index in project.tracks) is searched.
+        """
+        if not self.project or end_tick <= start_tick or high_pitch < low_pitch:
+            return
+        self.sync()
+
+        bucket_ticks = self.bucket_ticks
+        first_bucket = max(0, start_tick // bucket_ticks)
+        last_bucket = (end_tick - 1) // bucket_ticks
+        low_band = max(0, low_pitch // PITCH_BAND)
+        high_band = min(PITCH_BANDS - 1, high_pitch // PITCH_BAND)
+        visited = 0
+        if track is None:
+            tracks = self._tracks
+        elif 0 <= track < len(self._tracks):
+            tracks = [self._tracks[track]]
+        else:
+            tracks = []
+
+        for track_index in tracks:
+            index = track_index.position
+            cells = track_index.cells
+            if not cells:
+                continue
+            for bucket in range(first_bucket, last_bucket + 1):
+                bucket_start = bucket * bucket_ticks
+                for band in range(low_band, high_band + 1):
+                    cell = cells.get(bucket * PITCH_BANDS + band)
+                    if not cell:
+                        continue
+                    visited += len(cell)
+                    for note in cell:
+                        # A note spanning several buckets is reported from the first visited one only
+                        if (note.start_tick < end_tick and note.end_tick > start_tick
+                                and low_pitch <= note.pitch <= high_pitch
+                                and (bucket == first_bucket or note.start_tick >= bucket_start)):
+                            yield index, note
+        self.last_query_visited = visited
+
+    def get_stats(self) -> Dict[str, int]:
+        """Index size and last query cost"""
+        return {
+            'tracks': len(self._tracks),
+            'notes': sum(len(index.locations) for index in self._tracks),
+            'cells': sum(len(index.cells) for index in self._tracks),
+            'rebuilds': self.rebuilds,
+            'last_query_visited': self.last_query_visited,
+        }
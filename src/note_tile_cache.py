@@ -0,0 +1,361 @@
+"""
+Note Tile Cache
+The piano roll's note layer rasterized into fixed-size QImage tiles laid out in
+content coordinates (x = tick * pixels per tick, y = (TOP_PITCH - pitch) *
+pixels per pitch), so scrolling only re-composites finished tiles.
+
+Every track is its own layer: a tile is identified by (zoom, tile x, tile y,
+layer) and stamped with the content version it was rendered from. The active
+track's tiles are drawn in full color; the other tracks are merged into one
+"ghost" tile per position (built from their cached track tiles) and drawn
+dimmed, so switching the active track re-composites cached layers instead of
+rasterizing notes again.
+
+Missing tiles are rasterized on a QThreadPool from a snapshot of their note
+rectangles taken on the GUI thread and fill in as they finish. An edit drops
+only the tiles of the edited track (and the ghosts containing it) that its
+tick/pitch extent covers; until their re-render arrives those tiles are drawn
+directly from the snapshot, so edits never show stale notes.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QPoint, QRect, QRectF, QRunnable, QThread, QThreadPool, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPainter
+
+TILE_SIZE = 256                       # Tile edge in logical pixels
+TOP_PITCH = 127                       # Content y = 0 is the top of this pitch's row
+MAX_CACHE_BYTES = 128 * 1024 * 1024   # Rasterized tiles kept; least recently used are dropped first
+MAX_ZOOM_LEVELS = 4                   # Zoom levels kept at once (zooming back reuses their tiles)
+GHOST_OPACITY = 0.35                  # Inactive tracks
+
+# Layers: (TRACK_LAYER, track position, color) or (GHOST_LAYER, active track position, track colors)
+TRACK_LAYER = 'track'
+GHOST_LAYER = 'ghost'
+
+# [(color, [(x, y, width, height), ...]), ...] in tile pixels, drawn in order
+TileRects = List[Tuple[str, List[Tuple[int, int, int, int]]]]
+
+
+def note_rect(note, pixels_per_tick: float, pixels_per_pitch: float) -> Tuple[int, int, int, int]:
+    """Content-pixel rectangle of a note (shared by tiles and anything drawn over them)"""
+    return extent_rect(note.start_tick, note.end_tick, note.pitch, pixels_per_tick, pixels_per_pitch)
+
+
+def extent_rect(start_tick: int, end_tick: int, pitch: int,
+                pixels_per_tick: float, pixels_per_pitch: float) -> Tuple[int, int, int, int]:
+    """Content-pixel rectangle a note would have at another extent (edit previews)"""
+    return (int(start_tick * pixels_per_tick), int((TOP_PITCH - pitch) * pixels_per_pitch),
+            int((end_tick - start_tick) * pixels_per_tick), int(pixels_per_pitch))
+
+
+def _new_tile(device_pixel_ratio: float) -> QImage:
+    size = int(TILE_SIZE * device_pixel_ratio)
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(device_pixel_ratio)
+    image.fill(Qt.transparent)
+    return image
+
+
+def render_tile(rects: TileRects, device_pixel_ratio: float) -> QImage:
+    """Rasterize one tile (safe off the GUI thread: QPainter on a QImage)"""
+    image = _new_tile(device_pixel_ratio)
+    painter = QPainter(image)
+    _draw_rects(painter, rects)
+    painter.end()
+    return image
+
+
+def merge_tiles(images: List[QImage], device_pixel_ratio: float) -> QImage:
+    """Stack track tiles into one (safe off the GUI thread)"""
+    image = _new_tile(device_pixel_ratio)
+    painter = QPainter(image)
+    for layer in images:
+        painter.drawImage(QPoint(0, 0), layer)
+    painter.end()
+    return image
+
+
+def _draw_rects(painter: QPainter, rects: TileRects):
+    painter.setPen(Qt.NoPen)
+    for color, color_rects in rects:
+        painter.setBrush(QColor(color))
+        painter.drawRects([QRectF(*rect) for rect in color_rects])
+
+
+class _TileJob(QRunnable):
+    """Builds one tile on the pool and hands it back through the cache's signal"""
+
+    def __init__(self, cache: 'NoteTileCache', key: tuple, version: int, build: Callable[[], QImage]):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.version = version
+        self.build = build
+
+    def run(self):
+        self.cache.tile_rendered.emit(self.key, self.version, self.build())
+
+
+class NoteTileCache(QObject):
+    """Per-track tiles of the note layer, rendered in the background and composited on the GUI thread"""
+
+    # Signals
+    tile_rendered = Signal(object, int, object)  # key, content version, QImage (emitted from a pool thread)
+    tile_ready = Signal()                        # a requested tile was stored, repaint to show it
+
+    def __init__(self, collect_rects: Callable[[tuple, int, str, int, int], TileRects], parent=None):
+        super().__init__(parent)
+        # (zoom, track position, color, tile x, tile y) -> that track's note rectangles in the tile;
+        # zoom is (pixels per tick, pixels per pitch, device pixel ratio)
+        self.collect_rects = collect_rects
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+
+        # Keys are (zoom, tile x, tile y, layer)
+        self._tiles: 'OrderedDict[tuple, Optional[QImage]]' = OrderedDict()  # key -> image (None: no notes), LRU order
+        self._pending: Dict[tuple, tuple] = {}      # key -> (content version, rects, job) being built
+        self._stale: Set[tuple] = set()             # Track tiles dropped by an edit, drawn directly until re-rendered
+        self._layers: Dict[tuple, Set[tuple]] = {}  # (zoom, tile x, tile y) -> layers stored or pending there
+        self._zooms: 'OrderedDict[tuple, None]' = OrderedDict()  # Zoom levels with tiles, least recent first
+        self._version = 0                           # Content version counter; every job gets a fresh one
+        self.cache_bytes = 0
+
+        # Statistics
+        self.tiles_rendered = 0
+        self.ghosts_merged = 0
+        self.tiles_drawn_directly = 0
+
+        self.tile_rendered.connect(self._on_tile_rendered)
+
+    def clear(self):
+        """Drop every tile (in-flight results are ignored when they arrive)"""
+        self.pool.clear()
+        self._tiles.clear()
+        self._pending.clear()
+        self._stale.clear()
+        self._layers.clear()
+        self._zooms.clear()
+        self.cache_bytes = 0
+
+    def shutdown(self):
+        """Stop queued jobs and wait for running ones"""
+        self.clear()
+        self.pool.waitForDone()
+
+    @staticmethod
+    def _contains_track(layer: tuple, position: int) -> bool:
+        if layer[0] == TRACK_LAYER:
+            return layer[1] == position
+        return layer[1] != position  # A ghost holds every track but the active one
+
+    def note_extent_changed(self, position: Optional[int], extent: Optional[Tuple[int, int, int]],
+                            filed: bool = True):
+        """NoteIndex listener: drop the tiles of a track that a (start_tick, end_tick, pitch) extent covers"""
+        if position is None:
+            self.clear()
+            return
+        if extent is None:
+            for key in [key for key in list(self._tiles) + list(self._pending)
+                        if self._contains_track(key[3], position)]:
+                self._drop(key)
+            return
+
+        start_tick, end_tick, pitch = extent
+        for zoom in self._zooms:
+            pixels_per_tick, pixels_per_pitch = zoom[0], zoom[1]
+            left = int(start_tick * pixels_per_tick)
+            top = int((TOP_PITCH - pitch) * pixels_per_pitch)
+            right = left + max(1, int((end_tick - start_tick) * pixels_per_tick))
+            bottom = top + max(1, int(pixels_per_pitch))
+            for tile_y in range(top // TILE_SIZE, (bottom - 1) // TILE_SIZE + 1):
+                for tile_x in range(left // TILE_SIZE, (right - 1) // TILE_SIZE + 1):
+                    layers = self._layers.get((zoom, tile_x, tile_y))
+                    if layers:
+                        for layer in [layer for layer in layers if self._contains_track(layer, position)]:
+                            self._drop((zoom, tile_x, tile_y, layer))
+
+    def _drop(self, key: tuple):
+        dropped = False
+        if key in self._tiles:
+            self._forget(key)
+            dropped = True
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            self.pool.tryTake(pending[2])
+            self._unlist(key)
+            dropped = True
+        if dropped and key[3][0] == TRACK_LAYER:
+            self._stale.add(key)
+
+    def _list(self, key: tuple):
+        self._layers.setdefault(key[:3], set()).add(key[3])
+
+    def _unlist(self, key: tuple):
+        if key in self._tiles or key in self._pending:
+            return
+        layers = self._layers.get(key[:3])
+        if layers is not None:
+            layers.discard(key[3])
+            if not layers:
+                del self._layers[key[:3]]
+
+    def _forget(self, key: tuple):
+        image = self._tiles.pop(key)
+        if image is not None:
+            self.cache_bytes -= image.sizeInBytes()
+        self._unlist(key)
+
+    def _use_zoom(self, zoom: tuple):
+        """Mark a zoom level as current, dropping the least recent ones beyond MAX_ZOOM_LEVELS"""
+        if zoom in self._zooms:
+            self._zooms.move_to_end(zoom)
+            return
+        self._zooms[zoom] = None
+        while len(self._zooms) > MAX_ZOOM_LEVELS:
+            old_zoom, _ = self._zooms.popitem(last=False)
+            for key in [key for key in self._tiles if key[0] == old_zoom]:
+                self._forget(key)
+            for key in [key for key in self._pending if key[0] == old_zoom]:
+                self.pool.tryTake(self._pending.pop(key)[2])
+                self._unlist(key)
+            self._stale = {key for key in self._stale if key[0] != old_zoom}
+
+    def _start(self, key: tuple, rects: Optional[TileRects], build: Callable[[], QImage]):
+        self._version += 1
+        job = _TileJob(self, key, self._version, build)
+        self._pending[key] = (self._version, rects, job)
+        self._list(key)
+        self.pool.start(job)
+
+    def _request_track(self, key: tuple) -> Optional[TileRects]:
+        """Start rasterizing a track tile unless it is already underway; returns its rects while pending"""
+        pending = self._pending.get(key)
+        if pending is not None:
+            return pending[1]
+        zoom, tile_x, tile_y, (_, position, color) = key
+        rects = self.collect_rects(zoom, position, color, tile_x, tile_y)
+        if not rects:
+            self._store(key, None)
+            return None
+        self._start(key, rects, lambda: render_tile(rects, zoom[2]))
+        return rects
+
+    def _request_ghost(self, key: tuple, images: List[QImage]):
+        """Merge the inactive tracks' tiles of a position into one ghost tile"""
+        if key in self._pending:
+            return
+        if len(images) <= 1:
+            self._store(key, images[0] if images else None)
+            return
+        self._start(key, None, lambda: merge_tiles(images, key[0][2]))
+
+    def _store(self, key: tuple, image: Optional[QImage]):
+        self._tiles[key] = image
+        self._list(key)
+        self._stale.discard(key)
+        if image is not None:
+            self.cache_bytes += image.sizeInBytes()
+            while self.cache_bytes > MAX_CACHE_BYTES and len(self._tiles) > 1:
+                self._forget(next(iter(self._tiles)))
+
+    def _on_tile_rendered(self, key: tuple, version: int, image: QImage):
+        """Keep a finished tile unless an edit or a clear superseded it meanwhile"""
+        pending = self._pending.get(key)
+        if pending is None or pending[0] != version:
+            return
+        del self._pending[key]
+        self._store(key, image)
+        if key[3][0] == TRACK_LAYER:
+            self.tiles_rendered += 1
+        else:
+            self.ghosts_merged += 1
+        self.tile_ready.emit()
+
+    def _draw_track(self, painter: QPainter, key: tuple, x: int, y: int, visible: bool) -> Optional[QImage]:
+        """Draw a track tile if it is visible (requesting it when missing); returns it once rendered"""
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            image = self._tiles[key]
+            if visible and image is not None:
+                painter.drawImage(QPoint(x, y), image)
+            return image
+
+        rects = self._request_track(key)
+        if visible and rects and key in self._stale:
+            # Edited tile: draw its snapshot now rather than show the old notes or a gap
+            painter.save()
+            painter.translate(x, y)
+            _draw_rects(painter, rects)
+            painter.restore()
+            self.tiles_drawn_directly += 1
+        return None
+
+    def draw(self, painter: QPainter, zoom: tuple, palette: Tuple[str, ...], active: int,
+             view_x: int, view_y: int, clip: QRect):
+        """Composite the tiles under clip: inactive tracks dimmed, then the active track
+
+        palette holds the track colors, active the active track position (-1: none,
+        every track is drawn at full strength). (view_x, view_y) is the content point
+        at widget (0, 0). Tiles one step beyond clip are requested too, so scrolling
+        finds them ready.
+        """
+        if clip.isEmpty():
+            return
+        self._use_zoom(zoom)
+        has_active = 0 <= active < len(palette)
+        ghost_layer = (GHOST_LAYER, active, palette)
+        ghost_opacity = GHOST_OPACITY if has_active else 1.0
+        opacity = painter.opacity()
+
+        last_row = int((TOP_PITCH + 1) * zoom[1]) // TILE_SIZE
+        first_x = max(0, (clip.left() + view_x) // TILE_SIZE - 1)
+        last_x = (clip.right() + view_x) // TILE_SIZE + 1
+        first_y = max(0, (clip.top() + view_y) // TILE_SIZE - 1)
+        last_y = min(last_row, (clip.bottom() + view_y) // TILE_SIZE + 1)
+
+        for tile_y in range(first_y, last_y + 1):
+            y = tile_y * TILE_SIZE - view_y
+            for tile_x in range(first_x, last_x + 1):
+                x = tile_x * TILE_SIZE - view_x
+                visible = x < clip.right() + 1 and x + TILE_SIZE > clip.left() and \
+                    y < clip.bottom() + 1 and y + TILE_SIZE > clip.top()
+
+                # Inactive tracks: the merged ghost tile, or the track tiles one by one until it is built
+                painter.setOpacity(opacity * ghost_opacity)
+                ghost_key = (zoom, tile_x, tile_y, ghost_layer)
+                if ghost_key in self._tiles:
+                    self._tiles.move_to_end(ghost_key)
+                    ghost = self._tiles[ghost_key]
+                    if visible and ghost is not None:
+                        painter.drawImage(QPoint(x, y), ghost)
+                else:
+                    images, complete = [], True
+                    for position, color in enumerate(palette):
+                        if position == active:
+                            continue
+                        key = (zoom, tile_x, tile_y, (TRACK_LAYER, position, color))
+                        image = self._draw_track(painter, key, x, y, visible)
+                        if key not in self._tiles:
+                            complete = False
+                        elif image is not None:
+                            images.append(image)
+                    if complete:
+                        self._request_ghost(ghost_key, images)
+
+                painter.setOpacity(opacity)
+                if has_active:
+                    key = (zoom, tile_x, tile_y, (TRACK_LAYER, active, palette[active]))
+                    self._draw_track(painter, key, x, y, visible)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache size and activity"""
+        return {
+            'tiles': len(self._tiles),
+            'pending': len(self._pending),
+            'cache_bytes': self.cache_bytes,
+            'tiles_rendered': self.tiles_rendered,
+            'ghosts_merged': self.ghosts_merged,
+            'tiles_drawn_directly': self.tiles_drawn_directly,
+        }
@@ -3,13 +3,13 @@ Per-Track Audio Router
 Routes MIDI notes to different audio sources based on track assignment
 """
 import os
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from dataclasses import dataclass
 from PySide6.QtCore import QObject, Signal
 
 from src.midi_data_model import MidiNote
 from src.audio_source_manager import AudioSource, AudioSourceType, get_audio_source_manager
-from src.audio_system import get_audio_manager
+from src.audio_system import get_audio_manager, send_fluidsynth_messages
 from src.midi_routing import get_midi_routing_manager
 
 try:
@@ -298,6 +298,8 @@ class PerTrackAudioRouter(QObject):
         """Play a note using the track's assigned audio source"""
         instance = self.track_instances.get(track_index)
         if not instance:
+            if self._plays_from_freeze(track_index):
+                return False  # Previews and live input don't bring a frozen track's synth back
             print(f"PerTrackRouter: No instance for track {track_index}, attempting to initialize...")
             # Try to initialize if not done yet
             if not self.initialize_track_audio(track_index):
@@ -342,6 +344,79 @@ class PerTrackAudioRouter(QObject):
         
         return False
     
+    def stop_notes(self, track_index: int, notes: List[MidiNote]) -> int:
+        """Stop several notes on a track in one pass; returns the number stopped"""
+        return len(notes) if self.send_notes(track_index, [(note, False) for note in notes]) else 0
+    
+    def send_notes(self, track_index: int, note_events: List[Tuple[MidiNote, bool]]) -> bool:
+        """Send a batch of simultaneous (note, is_note_on) events to a track's source in one burst"""
+        if not note_events:
+            return False
+        
+        instance = self.track_instances.get(track_index)
+        if not instance:
+            # Only note-ons justify bringing a track's audio up, and not while its freeze buffer plays
+            if not any(is_note_on for _, is_note_on in note_events) or self._plays_from_freeze(track_index) or \
+                    not self.initialize_track_audio(track_index):
+                return False
+            instance = self.track_instances.get(track_index)
+            if not instance:
+                return False
+        
+        try:
+            if instance.source.source_type == AudioSourceType.SOUNDFONT and instance.fluidsynth_instance:
+                fs = instance.fluidsynth_instance
+                for note, is_note_on in note_events:
+                    if is_note_on:
+                        fs.noteon(note.channel, note.pitch, note.velocity)
+                    else:
+                        fs.noteoff(note.channel, note.pitch)
+                return True
+            
+            if instance.source.source_type == AudioSourceType.EXTERNAL_MIDI:
+                messages = [[0x90 | note.channel, note.pitch, note.velocity] if is_note_on
+                            else [0x80 | note.channel, note.pitch, 0]
+                            for note, is_note_on in note_events]
+                if self.midi_routing_manager:
+                    # Use MIDI routing system to respect enable_external_routing setting
+                    self.midi_routing_manager.send_midi_messages(messages)
+                    return True
+                if instance.midi_out_port:
+                    send = instance.midi_out_port.send_message
+                    for message in messages:
+                        send(message)
+                    return True
+        
+        except Exception as e:
+            print(f"Error sending notes on track {track_index}: {e}")
+        
+        return False
+    
+    def send_messages(self, track_index: int, messages: List[List[int]]) -> bool:
+        """Send raw channel messages (CC, program, pitch bend, aftertouch) to an active track instance"""
+        instance = self.track_instances.get(track_index)
+        if not instance or not messages:
+            return False
+        
+        try:
+            if instance.source.source_type == AudioSourceType.SOUNDFONT and instance.fluidsynth_instance:
+                return send_fluidsynth_messages(instance.fluidsynth_instance, messages) > 0
+            
+            if instance.source.source_type == AudioSourceType.EXTERNAL_MIDI:
+                if self.midi_routing_manager:
+                    self.midi_routing_manager.send_midi_messages(messages)
+                    return True
+                if instance.midi_out_port:
+                    send = instance.midi_out_port.send_message
+                    for message in messages:
+                        send(message[:2] if message[0] & 0xE0 == 0xC0 else message)
+                    return True
+        
+        except Exception as e:
+            print(f"Error sending messages on track {track_index}: {e}")
+        
+        return False
+    
     def _play_soundfont_note(self, instance: TrackAudioInstance, note: MidiNote) -> bool:
         """Play note using dedicated FluidSynth instance"""
         if not instance.fluidsynth_instance:
@@ -439,6 +514,29 @@ class PerTrackAudioRouter(QObject):
         except Exception as e:
             print(f"Error cleaning up track {track_index} audio: {e}")
     
+    def _plays_from_freeze(self, track_index: int) -> bool:
+        """A frozen track with a current buffer keeps its synth released (stale or
+        other-tempo buffers fall back to the synth)"""
+        from src.track_manager import get_track_manager
+        track_manager = get_track_manager()
+        return bool(track_manager and track_manager.is_freeze_playable(track_index))
+    
+    def release_track_audio(self, track_index: int):
+        """Silence and tear down a track's synth instance (used when a track is frozen)"""
+        instance = self.track_instances.get(track_index)
+        if not instance:
+            return
+
+        if instance.fluidsynth_instance:
+            try:
+                for channel in range(16):
+                    instance.fluidsynth_instance.cc(channel, 123, 0)  # All Notes Off
+            except Exception as e:
+                print(f"Error silencing track {track_index} before release: {e}")
+
+        self.cleanup_track_audio(track_index)
+        print(f"PerTrackRouter: Released synth for frozen track {track_index}")
+
     def initialize_all_tracks(self, max_tracks: int = 16):
         """Initialize audio for all tracks"""
         success_count = 0
@@ -0,0 +1,524 @@
+"""
+Headless playback core
+Event compilation, scheduling and voice accounting with an injectable clock.
+Pure Python (no Qt) so the sequencer can run in batch jobs, servers and tests.
+"""
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from src.midi_data_model import MidiNote, MidiProject
+from src.voice_table import VoiceTable
+from src.playback_stats import PlaybackStats
+from src.logger import print_debug
+
+# Dispatch order of simultaneous events
+EVENT_ORDER = {"note_off": 0, "control": 1, "note_on": 2}
+
+
+class PlaybackState(Enum):
+    """Playback state enumeration"""
+    STOPPED = "stopped"
+    PLAYING = "playing"
+    PAUSED = "paused"
+
+
+@dataclass
+class PlaybackEvent:
+    """Represents a MIDI event to be played"""
+    timestamp: float  # Absolute time in seconds
+    tick: int        # MIDI tick position
+    note: Optional[MidiNote]  # The note to play (None for control events)
+    event_type: str  # "note_on", "note_off" or "control"
+    track_index: int = 0  # Track index for per-track routing
+    message: Optional[Tuple[int, int, int]] = None  # (status, data1, data2) for control events
+
+
+# Clocks
+
+class SystemClock:
+    """Wall clock used for live playback"""
+
+    def now(self) -> float:
+        return time.time()
+
+
+class VirtualClock:
+    """Manually advanced clock; lets tests and offline renders run instantly"""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float):
+        self._now += seconds
+
+    def set(self, value: float):
+        self._now = value
+
+
+# Sinks
+
+class RecordingSink:
+    """Note sink that records dispatched events instead of producing sound"""
+
+    def __init__(self, clock=None):
+        self.clock = clock
+        self.events: List[Tuple[float, int, MidiNote, bool]] = []  # (time, track_index, note, is_note_on)
+        self.controls: List[Tuple[float, int, int, int, int]] = []  # (time, track_index, status, data1, data2)
+        self.last_dispatch_sinks: List[Tuple[str, float, List[int]]] = []
+
+    def dispatch_notes(self, events: List[Tuple[int, MidiNote, bool]]) -> List[bool]:
+        now = self.clock.now() if self.clock else 0.0
+        for track_index, note, is_note_on in events:
+            self.events.append((now, track_index, note, is_note_on))
+        self.last_dispatch_sinks = [("recording", 0.0, list(range(len(events))))]
+        return [True] * len(events)
+
+    def stop_notes(self, voices: List[Tuple[int, MidiNote]]) -> int:
+        return sum(self.dispatch_notes([(track_index, note, False) for track_index, note in voices]))
+
+    def dispatch_controls(self, events: List[Tuple[int, int, int, int]]) -> int:
+        now = self.clock.now() if self.clock else 0.0
+        self.controls.extend((now,) + event for event in events)
+        return len(events)
+
+
+def compile_events(project: MidiProject, ticks_per_second: float,
+                   skip_tracks: Iterable[int] = ()) -> List[PlaybackEvent]:
+    """Compile a project's notes and channel events into time-sorted playback events"""
+    skip = set(skip_tracks)
+    events = []
+    for track_index, track in enumerate(project.tracks):
+        if track_index in skip:
+            continue
+        for note in track.notes:
+            events.append(PlaybackEvent(
+                timestamp=note.start_tick / ticks_per_second,
+                tick=note.start_tick,
+                note=note,
+                event_type="note_on",
+                track_index=track_index
+            ))
+            events.append(PlaybackEvent(
+                timestamp=note.end_tick / ticks_per_second,
+                tick=note.end_tick,
+                note=note,
+                event_type="note_off",
+                track_index=track_index
+            ))
+        for tick, status, data1, data2 in track.events.channel_events():
+            events.append(PlaybackEvent(
+                timestamp=tick / ticks_per_second,
+                tick=tick,
+                note=None,
+                event_type="control",
+                track_index=track_index,
+                message=(status, data1, data2)
+            ))
+
+    # Sort by time; at equal times note-offs go first so retriggers are released
+    # before they sound, then controls so they apply to the notes that follow
+    events.sort(key=lambda event: (event.timestamp, EVENT_ORDER[event.event_type]))
+    return events
+
+
+def control_chase_key(track_index: int, status: int, data1: int) -> Tuple[int, int, int]:
+    """Key under which a control event's latest value is remembered (per controller for CC)"""
+    kind = status & 0xF0
+    return (track_index, status, data1 if kind in (0xA0, 0xB0) else -1)
+
+
+class PlaybackCore:
+    """
+    Qt-free sequencer core.
+
+    The owner calls update() periodically (a QTimer in the app, a loop over a
+    VirtualClock in tests and renders). Notes go to the sink returned by
+    sink_provider, which must offer dispatch_notes() and stop_notes(), and
+    optionally dispatch_controls() for CC/program/pitch bend/aftertouch.
+    """
+
+    def __init__(self, clock=None, sink_provider: Callable[[], object] = None,
+                 is_track_audible: Callable[[int], bool] = None):
+        self.clock = clock or SystemClock()
+        self.sink_provider = sink_provider or (lambda: None)
+        self.is_track_audible = is_track_audible  # Mute/solo check at dispatch time
+
+        # Playback state
+        self.state = PlaybackState.STOPPED
+        self.current_tick = 0
+        self.start_time = 0.0
+        self.pause_tick = 0
+
+        # Tempo and timing
+        self.tempo_bpm = 120.0  # Default tempo
+        self.ticks_per_beat = 480  # Default MIDI resolution
+        self.ticks_per_second = self.tempo_bpm * self.ticks_per_beat / 60.0
+
+        # Project and events
+        self.project: Optional[MidiProject] = None
+        self.events: List[PlaybackEvent] = []
+        self.next_event_index = 0
+        self.end_tick = 0  # Last note-off tick, computed when events are compiled
+        self.skip_tracks: Set[int] = set()  # Tracks played by other means (e.g. frozen audio)
+        self.voices = VoiceTable()  # Sounding voices keyed by (track, channel, pitch)
+        self.control_channels: Set[Tuple[int, int]] = set()  # (track, channel) pairs that received controls
+
+        # Scheduling
+        self.early_tolerance = 0.02  # Dispatch events up to 20ms early
+
+        # Jitter/latency instrumentation
+        self.stats = PlaybackStats()
+        self.timer_interval_ms = 10.0
+        self._last_update_time: Optional[float] = None
+
+        # Position reports while playing are rate limited; the UI interpolates in between
+        self.position_interval = 0.1  # Seconds
+        self._last_position_time: Optional[float] = None
+
+        # Observers (the Qt adapter maps these onto signals)
+        self.on_state_changed: Optional[Callable[[PlaybackState], None]] = None
+        self.on_position_changed: Optional[Callable[[int], None]] = None
+        self.on_finished: Optional[Callable[[], None]] = None
+
+    # Project and tempo
+
+    def set_project(self, project: Optional[MidiProject], preserve_position: bool = False,
+                    skip_tracks: Iterable[int] = ()):
+        """Set the MIDI project to play"""
+        old_tick = self.current_tick if preserve_position else 0
+
+        self.project = project
+        self.stop()
+
+        self.skip_tracks = set(skip_tracks)
+        if project:
+            self.set_ticks_per_beat(project.ticks_per_beat)
+        self.prepare_events()
+
+        self.current_tick = old_tick
+        self.pause_tick = old_tick
+        self._notify_position()
+
+    def set_skip_tracks(self, skip_tracks: Iterable[int]):
+        """Change which tracks are left out of scheduling, keeping the position"""
+        skip_tracks = set(skip_tracks)
+        newly_skipped = skip_tracks - self.skip_tracks
+        self.skip_tracks = skip_tracks
+        self.release_track_voices(newly_skipped)  # Their note-offs are no longer scheduled
+        self.prepare_events()
+        self._find_next_event_index()
+
+    def set_tempo(self, bpm: float):
+        """Set playback tempo in BPM, re-timing events around the current position"""
+        self.tempo_bpm = max(1.0, min(300.0, bpm))  # Clamp between 1-300 BPM
+        self._update_ticks_per_second()
+
+        for event in self.events:
+            event.timestamp = event.tick / self.ticks_per_second
+        if self.state == PlaybackState.PLAYING:
+            self.start_time = self.clock.now() - (self.current_tick / self.ticks_per_second)
+
+    def set_ticks_per_beat(self, ticks_per_beat: int):
+        """Set the project resolution (ticks_per_second follows)"""
+        self.ticks_per_beat = ticks_per_beat
+        self._update_ticks_per_second()
+
+    def _update_ticks_per_second(self):
+        """Update ticks per second based on current tempo"""
+        self.ticks_per_second = self.tempo_bpm * self.ticks_per_beat / 60.0
+
+    def prepare_events(self):
+        """Compile playback events from the project"""
+        if not self.project:
+            self.events = []
+            self.end_tick = 0
+        else:
+            self.events = compile_events(self.project, self.ticks_per_second, self.skip_tracks)
+            self.end_tick = max((note.end_tick for track in self.project.tracks for note in track.notes), default=0)
+        self.next_event_index = 0
+
+        print_debug(f"Prepared {len(self.events)} playback events. First event: {self.events[0] if self.events else 'N/A'}")
+
+    # Transport
+
+    def play(self) -> bool:
+        """Start or resume playback; returns False if there is nothing to play"""
+        if self.state == PlaybackState.PLAYING:
+            return True
+
+        if not self.project or (not self.events and not self.skip_tracks):
+            print_debug("No project or events to play")
+            return False
+
+        if self.state == PlaybackState.STOPPED:
+            # Start from beginning
+            self.current_tick = 0
+            self.next_event_index = 0
+            self.release_all_voices()
+        else:
+            # Resume from pause position
+            self.current_tick = self.pause_tick
+            self._find_next_event_index()
+            self._chase_controls()
+
+        self.start_time = self.clock.now() - (self.current_tick / self.ticks_per_second)
+        self._last_update_time = None
+        self._last_position_time = None
+        self._set_state(PlaybackState.PLAYING)
+
+        print_debug(f"Playback started from tick {self.current_tick}. start_time: {self.start_time}")
+        return True
+
+    def pause(self):
+        """Pause playback"""
+        if self.state != PlaybackState.PLAYING:
+            return
+
+        self.pause_tick = self.current_tick
+        self.release_all_voices()
+        self._set_state(PlaybackState.PAUSED)
+
+        print_debug(f"Playback paused at tick {self.current_tick}")
+
+    def stop(self):
+        """Stop playback and return to beginning"""
+        if self.state == PlaybackState.STOPPED:
+            return
+
+        self.current_tick = 0
+        self.pause_tick = 0
+        self.next_event_index = 0
+        self.release_all_voices()
+        self._set_state(PlaybackState.STOPPED)
+        self._notify_position()
+
+        print_debug("Playback stopped")
+
+    def seek_to_tick(self, tick: int):
+        """Seek to a specific tick position"""
+        was_playing = self.state == PlaybackState.PLAYING
+
+        if was_playing:
+            self.pause()
+
+        self.current_tick = max(0, tick)
+        self.pause_tick = self.current_tick
+        self._find_next_event_index()
+        self._notify_position()
+
+        if was_playing:
+            self.play()
+
+        print_debug(f"Seeked to tick {self.current_tick}")
+
+    def _find_next_event_index(self):
+        """Find the next event index for the current position (binary search)"""
+        current_time = self.current_tick / self.ticks_per_second
+        low, high = 0, len(self.events)
+        while low < high:
+            mid = (low + high) // 2
+            if self.events[mid].timestamp > current_time:
+                high = mid
+            else:
+                low = mid + 1
+        self.next_event_index = low
+
+    # Scheduling
+
+    def update(self):
+        """Advance the playback position and dispatch every due event"""
+        if self.state != PlaybackState.PLAYING:
+            return
+
+        current_time = self.clock.now()
+
+        # Log timer overruns (gaps between updates well beyond the interval)
+        if self._last_update_time is not None:
+            self.stats.record_timer_tick(current_time - self._last_update_time, self.timer_interval_ms)
+        self._last_update_time = current_time
+
+        elapsed_time = current_time - self.start_time
+        self.current_tick = int(elapsed_time * self.ticks_per_second)
+        if self._last_position_time is None or current_time - self._last_position_time >= self.position_interval:
+            self._last_position_time = current_time
+            self._notify_position()
+
+        # Collect every due event so simultaneous ones go out as one batch per sink
+        due_time = elapsed_time + self.early_tolerance
+        first_index = self.next_event_index
+        while self.next_event_index < len(self.events) and self.events[self.next_event_index].timestamp <= due_time:
+            self.next_event_index += 1
+
+        if self.next_event_index > first_index:
+            self.dispatch_events(self.events[first_index:self.next_event_index])
+
+        # Check if playback is finished
+        if self.next_event_index >= len(self.events) and self.current_tick >= self.end_tick:
+            self.stop()
+            if self.on_finished:
+                self.on_finished()
+
+    def dispatch_events(self, events: List[PlaybackEvent]):
+        """Execute simultaneous playback events as one batch per audio sink"""
+        sink = self.sink_provider()
+        if not sink:
+            print_debug(f"PlaybackCore: No note sink available")
+            return
+
+        batch = []  # (track_index, note, is_note_on)
+        batch_events = []  # PlaybackEvent for each batch entry
+
+        # Controllers first so they apply to the notes that follow. They are sent
+        # even on muted tracks so unmuting doesn't leave stale controller state
+        controls = [(event.track_index,) + event.message for event in events if event.event_type == "control"]
+        if controls:
+            self._send_controls(sink, controls)
+
+        # Note-offs first so a retriggered pitch is released before it sounds again.
+        # Only the last overlapping note on a voice sends the note-off; notes that
+        # never sounded (muted) or were already silenced send nothing
+        for event in events:
+            if event.event_type == "note_off" and self.voices.note_off(event.track_index, event.note):
+                batch.append((event.track_index, event.note, False))
+                batch_events.append(event)
+
+        # Mute/solo is checked here so toggling never requires re-preparing events
+        for event in events:
+            if event.event_type == "note_on":
+                if self.is_track_audible and not self.is_track_audible(event.track_index):
+                    continue
+                batch.append((event.track_index, event.note, True))
+                batch_events.append(event)
+
+        if not batch:
+            return
+
+        dispatch_time = self.clock.now()
+        try:
+            results = sink.dispatch_notes(batch)
+        except Exception as e:
+            print_debug(f"PlaybackCore: Error dispatching {len(batch)} events: {e}")
+            return
+
+        # Record scheduled vs. actual dispatch time and per-sink send latency
+        if self.stats.enabled:
+            for sink_name, sink_latency, indices in getattr(sink, 'last_dispatch_sinks', []):
+                for i in indices:
+                    event = batch_events[i]
+                    self.stats.record_dispatch(self.start_time + event.timestamp, dispatch_time,
+                                               sink_latency, sink_name, event.track_index, event.tick)
+
+        for (track_index, note, is_note_on), success in zip(batch, results):
+            if is_note_on and success:
+                self.voices.note_on(track_index, note)
+            elif not success:
+                print_debug(f"PlaybackCore: Routing failed for note {note.pitch} on track {track_index}")
+
+        print_debug(f"PlaybackCore: Dispatched {len(batch)} events at tick {events[0].tick}")
+
+    def run_until(self, tick: int, step_seconds: float = 0.01):
+        """Drive playback on a VirtualClock up to a tick (for tests and offline renders)"""
+        if not isinstance(self.clock, VirtualClock):
+            raise TypeError("run_until() requires a VirtualClock")
+        if self.state != PlaybackState.PLAYING and not self.play():
+            return
+
+        while self.state == PlaybackState.PLAYING and self.current_tick < tick:
+            self.clock.advance(step_seconds)
+            self.update()
+
+    # Voices
+
+    def release_track_voices(self, track_indices: Iterable[int]) -> int:
+        """Send note-offs for every sounding voice on the given tracks"""
+        released = []
+        for track_index in track_indices:
+            released.extend(self.voices.release_track(track_index))
+        self._send_note_offs(released)
+        return len(released)
+
+    def release_inaudible_voices(self) -> int:
+        """Silence sounding voices on tracks that are no longer audible"""
+        if not self.is_track_audible:
+            return 0
+        inaudible = [track_index for track_index in self.voices.sounding_tracks()
+                     if not self.is_track_audible(track_index)]
+        return self.release_track_voices(inaudible)
+
+    def release_all_voices(self) -> int:
+        """Stop all currently playing notes with the minimal set of note-offs"""
+        released = self.voices.release_all()
+        self._send_note_offs(released)
+        self._reset_controllers()
+        print_debug(f"PlaybackCore: Stop all notes ({len(released)} voices released)")
+        return len(released)
+
+    def _send_note_offs(self, voices: List[Tuple[int, MidiNote]]):
+        """Send note-offs for released voices, batched per audio sink"""
+        if not voices:
+            return
+        sink = self.sink_provider()
+        if not sink:
+            return
+        try:
+            sink.stop_notes(voices)
+        except Exception as e:
+            print_debug(f"PlaybackCore: Error sending note-offs for {len(voices)} voices: {e}")
+
+    # Controls
+
+    def _send_controls(self, sink, controls: List[Tuple[int, int, int, int]]):
+        """Send (track_index, status, data1, data2) channel events to the sink"""
+        dispatch_controls = getattr(sink, 'dispatch_controls', None)
+        if not dispatch_controls:
+            return
+        try:
+            dispatch_controls(controls)
+        except Exception as e:
+            print_debug(f"PlaybackCore: Error dispatching {len(controls)} control events: {e}")
+            return
+        for track_index, status, _, _ in controls:
+            self.control_channels.add((track_index, status & 0x0F))
+
+    def _chase_controls(self):
+        """Restore the controller state in effect at the current position"""
+        latest = {}
+        for event in self.events[:self.next_event_index]:
+            if event.event_type == "control":
+                latest[control_chase_key(event.track_index, *event.message[:2])] = event
+        if not latest:
+            return
+        sink = self.sink_provider()
+        if sink:
+            chased = sorted(latest.values(), key=lambda event: event.tick)
+            self._send_controls(sink, [(event.track_index,) + event.message for event in chased])
+
+    def _reset_controllers(self):
+        """Send Reset All Controllers where playback changed controllers (releases pedals and bends)"""
+        if not self.control_channels:
+            return
+        sink = self.sink_provider()
+        dispatch_controls = getattr(sink, 'dispatch_controls', None) if sink else None
+        if dispatch_controls:
+            try:
+                dispatch_controls([(track_index, 0xB0 | channel, 121, 0)
+                                   for track_index, channel in sorted(self.control_channels)])
+            except Exception as e:
+                print_debug(f"PlaybackCore: Error resetting controllers: {e}")
+        self.control_channels.clear()
+
+    # Notifications
+
+    def _set_state(self, state: PlaybackState):
+        self.state = state
+        if self.on_state_changed:
+            self.on_state_changed(state)
+
+    def _notify_position(self):
+        if self.on_position_changed:
+            self.on_position_changed(self.current_tick)
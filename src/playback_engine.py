@@ -1,32 +1,96 @@
 """
 Playback engine for MIDI sequencer
+Qt adapter over the headless PlaybackCore
 """
 import time
-from typing import List, Optional, Dict, Set
-from dataclasses import dataclass
-from enum import Enum
+from typing import Optional, Set
 
-from PySide6.QtCore import QObject, Signal, QTimer, QThread
-from src.midi_data_model import MidiNote, MidiProject
-from src.audio_system import get_audio_manager
-from src.midi_routing import get_midi_routing_manager
-from src.per_track_audio_router import get_per_track_audio_router
+from PySide6.QtCore import Qt, QObject, Signal, QTimer
+from src.midi_data_model import MidiProject
+from src.track_manager import get_track_manager
+from src.track_freeze import FrozenTrackPlayer
+from src.playback_core import PlaybackCore, PlaybackState, SystemClock
 from src.logger import print_debug
 
-class PlaybackState(Enum):
-    """Playback state enumeration"""
-    STOPPED = "stopped"
-    PLAYING = "playing"
-    PAUSED = "paused"
 
-@dataclass
-class PlaybackEvent:
-    """Represents a MIDI event to be played"""
-    timestamp: float  # Absolute time in seconds
-    tick: int        # MIDI tick position
-    note: MidiNote   # The note to play
-    event_type: str  # "note_on" or "note_off"
-    track_index: int = 0  # Track index for per-track routing
+def _get_note_sink():
+    """Get the audio routing coordinator used as the core's note sink"""
+    from src.audio_routing_coordinator import get_audio_routing_coordinator
+    return get_audio_routing_coordinator()
+
+
+def _is_track_audible(track_index: int) -> bool:
+    """Mute/solo check against the global track manager"""
+    track_manager = get_track_manager()
+    return track_manager.is_track_audible(track_index) if track_manager else True
+
+
+def _core_attribute(name: str, doc: str) -> property:
+    """Expose a PlaybackCore attribute on the adapter"""
+    return property(lambda self: getattr(self.core, name),
+                    lambda self, value: setattr(self.core, name, value), doc=doc)
+
+
+class PlayheadInterpolator(QObject):
+    """Display position of the playhead: extrapolates the engine's rate-limited position
+    reports with a monotonic clock and reports once per display frame while playing"""
+    
+    position_changed = Signal(int)
+    
+    FRAME_INTERVAL_MS = 16
+    
+    def __init__(self, engine: 'PlaybackEngine'):
+        super().__init__()
+        self.engine = engine
+        self._anchor_tick = 0
+        self._anchor_time = time.monotonic()
+        self._playing = False
+        self._last_tick: Optional[int] = None
+        
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._on_frame)
+        
+        engine.position_changed.connect(self._on_engine_position)
+        engine.state_changed.connect(self._on_engine_state)
+        engine.tempo_changed.connect(lambda bpm: self._anchor(self.current_tick()))
+    
+    def current_tick(self) -> int:
+        """Interpolated playhead position"""
+        if not self._playing:
+            return self._anchor_tick
+        return self._anchor_tick + int((time.monotonic() - self._anchor_time) * self.engine.ticks_per_second)
+    
+    def _anchor(self, tick: int):
+        self._anchor_tick = tick
+        self._anchor_time = time.monotonic()
+    
+    def _on_engine_position(self, tick: int):
+        # Small corrections don't move the playhead backwards; seeks (large jumps) do
+        if self._playing and self._last_tick is not None:
+            if 0 < self._last_tick - tick < self.engine.ticks_per_second * 0.25:
+                tick = self._last_tick
+        self._anchor(tick)
+        if not self._playing:
+            self._report(tick)
+    
+    def _on_engine_state(self, state: PlaybackState):
+        self._playing = state == PlaybackState.PLAYING
+        self._anchor(self.engine.current_tick)
+        if self._playing:
+            self.timer.start(self.FRAME_INTERVAL_MS)
+        else:
+            self.timer.stop()
+        self._report(self._anchor_tick)
+    
+    def _on_frame(self):
+        self._report(self.current_tick())
+    
+    def _report(self, tick: int):
+        if tick != self._last_tick:
+            self._last_tick = tick
+            self.position_changed.emit(tick)
+
 
 class PlaybackEngine(QObject):
     """Core playback engine for MIDI sequences"""
@@ -37,165 +101,95 @@ class PlaybackEngine(QObject):
     tempo_changed = Signal(float)          # Tempo changed (BPM)
     playback_finished = Signal()           # Playback reached the end
     
-    def __init__(self):
+    # Playback state lives in the core
+    state = _core_attribute('state', "Current playback state")
+    current_tick = _core_attribute('current_tick', "Current position in ticks")
+    start_time = _core_attribute('start_time', "Clock time at tick 0")
+    pause_tick = _core_attribute('pause_tick', "Position to resume from")
+    tempo_bpm = _core_attribute('tempo_bpm', "Tempo in BPM")
+    ticks_per_beat = _core_attribute('ticks_per_beat', "MIDI resolution")
+    ticks_per_second = _core_attribute('ticks_per_second', "Ticks per second at the current tempo")
+    project = _core_attribute('project', "Project being played")
+    events = _core_attribute('events', "Compiled playback events")
+    next_event_index = _core_attribute('next_event_index', "Index of the next event to dispatch")
+    voices = _core_attribute('voices', "Sounding voices keyed by (track, channel, pitch)")
+    stats = _core_attribute('stats', "Jitter/latency instrumentation")
+    
+    def __init__(self, clock=None):
         super().__init__()
         
-        # Playback state
-        self.state = PlaybackState.STOPPED
-        self.current_tick = 0
-        self.start_time = 0.0
-        self.pause_tick = 0
-        
-        # Tempo and timing
-        self.tempo_bpm = 120.0  # Default tempo
-        self.ticks_per_beat = 480  # Default MIDI resolution
-        self.ticks_per_second = self.tempo_bpm * self.ticks_per_beat / 60.0
+        self.core = PlaybackCore(clock or SystemClock(), _get_note_sink, _is_track_audible)
+        self.core.on_state_changed = self._on_core_state_changed
+        self.core.on_position_changed = self.position_changed.emit
+        self.core.on_finished = self.playback_finished.emit
         
-        # Project and events
-        self.project: Optional[MidiProject] = None
-        self.events: List[PlaybackEvent] = []
-        self.active_notes: Set[int] = set()  # Currently playing note pitches
+        # Frozen tracks are streamed from their rendered buffers instead of scheduled
+        self.frozen_player = FrozenTrackPlayer()
+        self.frozen_tracks = []
+        self.streamed_track_indices: Set[int] = set()
         
-        # Playback timer
+        # Playback timer drives the core
         self.timer = QTimer()
-        self.timer.timeout.connect(self._update_playback)
+        self.timer.timeout.connect(self.core.update)
         self.timer_interval = 10  # Update every 10ms for smooth playback
+        self.core.timer_interval_ms = self.timer_interval
         # Timer will be started/stopped as needed
         
-        # Lookahead for scheduling
-        self.lookahead_ms = 100  # Schedule events 100ms ahead
-        self.next_event_index = 0
+        # Views follow the interpolated playhead instead of position_changed
+        self.playhead = PlayheadInterpolator(self)
     
     def set_project(self, project: Optional[MidiProject], preserve_position: bool = False):
         """Set the MIDI project to play"""
-        old_tick = self.current_tick if preserve_position else 0
-        
-        self.project = project
-        self.stop()
-        
-        if not preserve_position:
-            self.current_tick = 0
-        
+        self.frozen_player.stop()
         if project:
-            self.ticks_per_beat = project.ticks_per_beat
-            self._update_ticks_per_second()
-            self._prepare_events()
-        else:
-            self.events = []
-        
-        if preserve_position:
-            self.current_tick = old_tick
-        
-        self.position_changed.emit(self.current_tick)
+            self.core.set_ticks_per_beat(project.ticks_per_beat)
+        self._update_frozen_tracks(project)
+        self.core.set_project(project, preserve_position, self.streamed_track_indices)
     
     def set_tempo(self, bpm: float):
         """Set playback tempo in BPM"""
-        self.tempo_bpm = max(1.0, min(300.0, bpm))  # Clamp between 1-300 BPM
-        self._update_ticks_per_second()
+        self.core.set_tempo(bpm)
+        self._retime_frozen_tracks()
         self.tempo_changed.emit(self.tempo_bpm)
     
-    def _update_ticks_per_second(self):
-        """Update ticks per second based on current tempo"""
-        self.ticks_per_second = self.tempo_bpm * self.ticks_per_beat / 60.0
-    
-    def _prepare_events(self):
-        """Prepare playback events from the project"""
-        self.events = []
-        
-        if not self.project:
+    def _retime_frozen_tracks(self):
+        """Buffers play only at the tempo they were rendered at; re-pick them after a tempo change"""
+        streamed = self.streamed_track_indices
+        self._update_frozen_tracks(self.core.project)
+        if self.streamed_track_indices == streamed:
             return
-        
-        # Collect all notes from all tracks with track information
-        all_notes_with_tracks = []
-        for track_index, track in enumerate(self.project.tracks):
-            for note in track.notes:
-                all_notes_with_tracks.append((note, track_index))
-        
-        # Sort notes by start time
-        all_notes_with_tracks.sort(key=lambda item: item[0].start_tick)
-        
-        # Create note on/off events
-        for note, track_index in all_notes_with_tracks:
-            # Note on event
-            note_on_time = note.start_tick / self.ticks_per_second
-            self.events.append(PlaybackEvent(
-                timestamp=note_on_time,
-                tick=note.start_tick,
-                note=note,
-                event_type="note_on",
-                track_index=track_index
-            ))
-            
-            # Note off event
-            note_off_time = note.end_tick / self.ticks_per_second
-            self.events.append(PlaybackEvent(
-                timestamp=note_off_time,
-                tick=note.end_tick,
-                note=note,
-                event_type="note_off",
-                track_index=track_index
-            ))
-        
-        # Sort events by timestamp
-        self.events.sort(key=lambda event: event.timestamp)
-        self.next_event_index = 0
-        
-        print_debug(f"Prepared {len(self.events)} playback events. First event: {self.events[0] if self.events else 'N/A'}")
+        # Tracks whose buffer no longer fits are scheduled through their synth again (and back)
+        self.core.set_skip_tracks(self.streamed_track_indices)
+        if self.state == PlaybackState.PLAYING and self.frozen_tracks:
+            self.frozen_player.start(self.frozen_tracks, self.current_tick / self.ticks_per_second,
+                                     _is_track_audible)
+        else:
+            self.frozen_player.stop()
+    
+    def _update_frozen_tracks(self, project: Optional[MidiProject]):
+        """Pick up frozen tracks with an up-to-date buffer; they are streamed, not scheduled"""
+        self.frozen_tracks = []
+        self.streamed_track_indices = set()
+        
+        track_manager = get_track_manager()
+        if project and track_manager and track_manager.project is project:
+            self.frozen_tracks = track_manager.get_playable_frozen_tracks(self.ticks_per_second)
+            self.streamed_track_indices = {frozen.track_index for frozen in self.frozen_tracks}
     
     def play(self):
         """Start or resume playback"""
         if self.state == PlaybackState.PLAYING:
             return
         
-        if not self.project or not self.events:
-            print_debug("No project or events to play")
-            return
-        
-        if self.state == PlaybackState.STOPPED:
-            # Start from beginning
-            self.current_tick = 0
-            self.next_event_index = 0
-            self._stop_all_notes()
-        elif self.state == PlaybackState.PAUSED:
-            # Resume from pause position
-            self.current_tick = self.pause_tick
-            self._find_next_event_index()
-        
-        self.start_time = time.time() - (self.current_tick / self.ticks_per_second)
-        self.state = PlaybackState.PLAYING
-        self.timer.start(self.timer_interval)
-        self.state_changed.emit(self.state)
-        
-        print_debug(f"Playback started from tick {self.current_tick}. start_time: {self.start_time}")
+        self.core.play()
     
     def pause(self):
         """Pause playback"""
-        if self.state != PlaybackState.PLAYING:
-            return
-        
-        self.timer.stop()
-        self.pause_tick = self.current_tick
-        self.state = PlaybackState.PAUSED
-        self._stop_all_notes()
-        self.state_changed.emit(self.state)
-        
-        print_debug(f"Playback paused at tick {self.current_tick}")
+        self.core.pause()
     
     def stop(self):
         """Stop playback and return to beginning"""
-        if self.state == PlaybackState.STOPPED:
-            return
-        
-        self.timer.stop()
-        self.current_tick = 0
-        self.pause_tick = 0
-        self.next_event_index = 0
-        self.state = PlaybackState.STOPPED
-        self._stop_all_notes()
-        self.state_changed.emit(self.state)
-        self.position_changed.emit(self.current_tick)
-        
-        print_debug("Playback stopped")
+        self.core.stop()
     
     def toggle_play_pause(self):
         """Toggle between play and pause"""
@@ -206,157 +200,30 @@ class PlaybackEngine(QObject):
     
     def seek_to_tick(self, tick: int):
         """Seek to a specific tick position"""
-        was_playing = self.state == PlaybackState.PLAYING
-        
-        if was_playing:
-            self.pause()
-        
-        self.current_tick = max(0, tick)
-        self.pause_tick = self.current_tick
-        self._find_next_event_index()
-        self.position_changed.emit(self.current_tick)
-        
-        if was_playing:
-            self.play()
-        
-        print_debug(f"Seeked to tick {self.current_tick}")
+        self.core.seek_to_tick(tick)
     
     def seek_to_beginning(self):
         """Seek to the beginning"""
         self.seek_to_tick(0)
     
-    def _find_next_event_index(self):
-        """Find the next event index for current position"""
-        current_time = self.current_tick / self.ticks_per_second
-        
-        for i, event in enumerate(self.events):
-            if event.timestamp > current_time:
-                self.next_event_index = i
-                return
-        
-        self.next_event_index = len(self.events)
+    def _on_core_state_changed(self, state: PlaybackState):
+        """Start/stop the timer and frozen stream, then forward the state"""
+        if state == PlaybackState.PLAYING:
+            self.timer.start(self.timer_interval)
+            # Every way into PLAYING (play, a seek while playing) restarts the stream at the playhead
+            if self.frozen_tracks:
+                self.frozen_player.start(self.frozen_tracks, self.current_tick / self.ticks_per_second,
+                                         _is_track_audible)
+        else:
+            self.timer.stop()
+            self.frozen_player.stop()
+        self.state_changed.emit(state)
     
-    def _update_playback(self):
-        """Update playback position and schedule events"""
-        if self.state != PlaybackState.PLAYING:
-            return
-        
-        # Calculate current position
-        current_time = time.time()
-        elapsed_time = current_time - self.start_time
-        self.current_tick = int(elapsed_time * self.ticks_per_second)
-        
-        # Emit position update
-        self.position_changed.emit(self.current_tick)
-        
-        # Schedule events within lookahead window
-        lookahead_time = current_time + (self.lookahead_ms / 1000.0)
-        
-        while (self.next_event_index < len(self.events) and 
-               self.events[self.next_event_index].timestamp <= lookahead_time):
-            
-            event = self.events[self.next_event_index]
-            
-            # Calculate absolute event time
-            event_absolute_time = self.start_time + event.timestamp
-            
-            # Only schedule if event time has arrived (within tolerance)
-            if current_time >= event_absolute_time - 0.02:  # 20ms early tolerance
-                self._schedule_event(event)
-                self.next_event_index += 1
-            else:
-                # Event is not ready yet, stop processing
-                break
-        
-        # Check if playback is finished
-        if self.next_event_index >= len(self.events):
-            # Check if all notes have finished
-            max_end_tick = 0
-            if self.project:
-                for track in self.project.tracks:
-                    for note in track.notes:
-                        max_end_tick = max(max_end_tick, note.end_tick)
-            
-            if self.current_tick >= max_end_tick:
-                self.stop()
-                self.playback_finished.emit()
-    
-    def _schedule_event(self, event: PlaybackEvent):
-        """Execute a playback event using unified audio routing coordinator"""
-        from src.audio_routing_coordinator import get_audio_routing_coordinator
-        
-        # Get the unified audio routing coordinator
-        coordinator = get_audio_routing_coordinator()
-        
-        if event.event_type == "note_on":
-            success = False
-            
-            if coordinator:
-                # Use unified audio routing coordinator
-                try:
-                    success = coordinator.play_note(event.track_index, event.note)
-                    if success:
-                        self.active_notes.add(event.note.pitch)
-                        print_debug(f"PlaybackEngine: Playing note {event.note.pitch} on track {event.track_index} at tick {event.tick}")
-                    else:
-                        print_debug(f"PlaybackEngine: Audio routing coordinator failed for note {event.note.pitch} on track {event.track_index}")
-                except Exception as e:
-                    print_debug(f"PlaybackEngine: Audio routing coordinator error for note {event.note.pitch}: {e}")
-            else:
-                print_debug(f"PlaybackEngine: Audio routing coordinator not available")
-        
-        elif event.event_type == "note_off":
-            if event.note.pitch in self.active_notes:
-                success = False
-                
-                if coordinator:
-                    # Use unified audio routing coordinator
-                    try:
-                        success = coordinator.stop_note(event.track_index, event.note)
-                        if success:
-                            self.active_notes.discard(event.note.pitch)
-                            print_debug(f"PlaybackEngine: Stopping note {event.note.pitch} on track {event.track_index}")
-                        else:
-                            print_debug(f"PlaybackEngine: Audio routing coordinator stop failed for note {event.note.pitch}")
-                    except Exception as e:
-                        print_debug(f"PlaybackEngine: Audio routing coordinator error stopping note {event.note.pitch}: {e}")
-                
-                # Always remove from tracking to prevent stuck notes
-                if not success:
-                    self.active_notes.discard(event.note.pitch)
-                    print_debug(f"PlaybackEngine: Force removed note {event.note.pitch} from tracking")
-    
-    def _stop_all_notes(self):
-        """Stop all currently playing notes"""
-        # First try per-track audio routing with all-notes-off
-        per_track_router = get_per_track_audio_router()
-        per_track_success = False
-        
-        if per_track_router:
-            # Use efficient all-notes-off for per-track routing
-            per_track_success = per_track_router.stop_all_notes()
-        
-        # Also try MIDI routing as fallback
-        midi_router = get_midi_routing_manager()
-        if midi_router:
-            # Use MIDI routing system
-            for pitch in list(self.active_notes):
-                try:
-                    midi_router.stop_note(0, pitch)  # Channel 0
-                except Exception as e:
-                    print_debug(f"PlaybackEngine: Error stopping note {pitch} via MIDI routing: {e}")
-        
-        # Final fallback to direct audio manager
-        audio_manager = get_audio_manager()
-        if audio_manager:
-            for pitch in list(self.active_notes):
-                try:
-                    audio_manager.stop_note_immediate(pitch)
-                except Exception as e:
-                    print_debug(f"PlaybackEngine: Error stopping note {pitch} via audio manager: {e}")
-        
-        print_debug(f"PlaybackEngine: Stop all notes (per-track: {'✅' if per_track_success else '❌'}, active notes: {len(self.active_notes)})")
-        self.active_notes.clear()
+    def apply_track_audibility(self):
+        """Silence sounding notes on tracks that were just muted or excluded by solo"""
+        released = self.core.release_inaudible_voices()
+        if released:
+            print_debug(f"PlaybackEngine: Silenced {released} voices on muted tracks")
     
     def get_state(self) -> PlaybackState:
         """Get current playback state"""
@@ -378,6 +245,8 @@ class PlaybackEngine(QObject):
         """Clean up resources"""
         self.stop()
         self.timer.stop()
+        self.playhead.timer.stop()
+        self.frozen_player.stop()
         print_debug("Playback engine cleaned up")
 
 # Global playback engine instance
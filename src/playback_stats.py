@@ -0,0 +1,169 @@
+"""
+Playback Statistics
+Jitter and latency instrumentation for dispatched playback events
+"""
+import csv
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from src.logger import print_debug
+
+# Samples kept per rolling window
+STATS_WINDOW_SIZE = 2048
+
+# Raw events kept for CSV export
+STATS_EVENT_LOG_SIZE = 20000
+
+
+@dataclass
+class DispatchSample:
+    """Timing of one dispatched event"""
+    scheduled_time: float   # When the event was due (seconds, engine clock)
+    dispatch_time: float    # When it was handed to the sink (seconds, engine clock)
+    sink_latency: float     # Time spent in the sink's send call (seconds)
+    sink: str
+    track_index: int
+    tick: int
+
+    @property
+    def lateness(self) -> float:
+        """Dispatch time minus scheduled time (negative means early)"""
+        return self.dispatch_time - self.scheduled_time
+
+
+class RollingWindow:
+    """Fixed-size window of samples with percentile summaries"""
+
+    def __init__(self, size: int = STATS_WINDOW_SIZE):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.total_count = 0
+        self.max_value = float('-inf')  # Max over the whole session, not just the window
+
+    def add(self, value: float):
+        self.samples.append(value)
+        self.total_count += 1
+        if value > self.max_value:
+            self.max_value = value
+
+    def percentile(self, sorted_samples: List[float], fraction: float) -> float:
+        """Nearest-rank percentile of pre-sorted samples"""
+        if not sorted_samples:
+            return 0.0
+        index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples))) - 1))
+        return sorted_samples[index]
+
+    def summary(self) -> Dict[str, float]:
+        """Get p50/p95/p99/max in milliseconds"""
+        ordered = sorted(self.samples)
+        return {
+            'count': self.total_count,
+            'p50_ms': self.percentile(ordered, 0.50) * 1000.0,
+            'p95_ms': self.percentile(ordered, 0.95) * 1000.0,
+            'p99_ms': self.percentile(ordered, 0.99) * 1000.0,
+            'max_ms': (self.max_value if self.total_count else 0.0) * 1000.0,
+        }
+
+
+class PlaybackStats:
+    """
+    Collects lateness and sink latency for every dispatched event,
+    per sink and per track, plus late-event counts and timer overruns.
+    """
+
+    def __init__(self, late_threshold_ms: float = 10.0, overrun_threshold_ms: float = 10.0):
+        self.enabled = True
+        self.late_threshold_ms = late_threshold_ms          # Events later than this count as late
+        self.overrun_threshold_ms = overrun_threshold_ms    # Timer ticks later than interval + this are overruns
+        self.reset()
+
+    def reset(self):
+        """Clear all collected statistics"""
+        self.lateness_by_sink: Dict[str, RollingWindow] = {}
+        self.lateness_by_track: Dict[int, RollingWindow] = {}
+        self.latency_by_sink: Dict[str, RollingWindow] = {}
+        self.late_by_sink: Dict[str, int] = {}
+        self.late_by_track: Dict[int, int] = {}
+        self.events: Deque[DispatchSample] = deque(maxlen=STATS_EVENT_LOG_SIZE)
+        self.timer_overruns = 0
+        self.worst_timer_gap = 0.0
+        self.timer_gaps = RollingWindow()
+
+    def record_dispatch(self, scheduled_time: float, dispatch_time: float, sink_latency: float,
+                        sink: str, track_index: int, tick: int = 0):
+        """Record the timing of one dispatched event"""
+        if not self.enabled:
+            return
+
+        sample = DispatchSample(scheduled_time, dispatch_time, sink_latency, sink, track_index, tick)
+        self.events.append(sample)
+
+        lateness = sample.lateness
+        self.lateness_by_sink.setdefault(sink, RollingWindow()).add(lateness)
+        self.lateness_by_track.setdefault(track_index, RollingWindow()).add(lateness)
+        self.latency_by_sink.setdefault(sink, RollingWindow()).add(sink_latency)
+
+        if lateness * 1000.0 > self.late_threshold_ms:
+            self.late_by_sink[sink] = self.late_by_sink.get(sink, 0) + 1
+            self.late_by_track[track_index] = self.late_by_track.get(track_index, 0) + 1
+
+    def record_timer_tick(self, gap: float, interval_ms: float):
+        """Record the time between two timer callbacks and log overruns"""
+        if not self.enabled:
+            return
+
+        self.timer_gaps.add(gap)
+        overrun_ms = gap * 1000.0 - interval_ms
+        if overrun_ms > self.overrun_threshold_ms:
+            self.timer_overruns += 1
+            self.worst_timer_gap = max(self.worst_timer_gap, gap)
+            print_debug(f"PlaybackStats: Timer overrun - tick came {gap * 1000.0:.1f}ms after the last one "
+                        f"(interval {interval_ms:.0f}ms)")
+
+    def get_summary_rows(self) -> List[Dict[str, object]]:
+        """Get one summary row per sink and per track"""
+        rows = []
+        for sink, window in sorted(self.lateness_by_sink.items()):
+            latency = self.latency_by_sink[sink].summary()
+            rows.append(dict(scope='sink', key=sink, **window.summary(),
+                             late_count=self.late_by_sink.get(sink, 0),
+                             latency_p50_ms=latency['p50_ms'], latency_p95_ms=latency['p95_ms'],
+                             latency_p99_ms=latency['p99_ms'], latency_max_ms=latency['max_ms']))
+        for track_index, window in sorted(self.lateness_by_track.items()):
+            rows.append(dict(scope='track', key=str(track_index), **window.summary(),
+                             late_count=self.late_by_track.get(track_index, 0),
+                             latency_p50_ms='', latency_p95_ms='', latency_p99_ms='', latency_max_ms=''))
+        timer = self.timer_gaps.summary()
+        rows.append(dict(scope='timer', key='tick_gap', **timer, late_count=self.timer_overruns,
+                         latency_p50_ms='', latency_p95_ms='', latency_p99_ms='', latency_max_ms=''))
+        return rows
+
+    def export_csv(self, file_path: str) -> bool:
+        """Export the per-sink/per-track summary as CSV"""
+        fields = ['scope', 'key', 'count', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'late_count',
+                  'latency_p50_ms', 'latency_p95_ms', 'latency_p99_ms', 'latency_max_ms']
+        try:
+            with open(file_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                for row in self.get_summary_rows():
+                    writer.writerow({k: (f"{v:.3f}" if isinstance(v, float) else v) for k, v in row.items()})
+            return True
+        except Exception as e:
+            print(f"Error exporting playback stats: {e}")
+            return False
+
+    def export_events_csv(self, file_path: str) -> bool:
+        """Export the raw per-event timings as CSV"""
+        try:
+            with open(file_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['tick', 'track', 'sink', 'scheduled_s', 'dispatched_s', 'lateness_ms', 'sink_latency_ms'])
+                for sample in self.events:
+                    writer.writerow([sample.tick, sample.track_index, sample.sink,
+                                     f"{sample.scheduled_time:.6f}", f"{sample.dispatch_time:.6f}",
+                                     f"{sample.lateness * 1000.0:.3f}", f"{sample.sink_latency * 1000.0:.3f}"])
+            return True
+        except Exception as e:
+            print(f"Error exporting playback events: {e}")
+            return False
@@ -0,0 +1,163 @@
+"""
+Progressive MIDI Loader
+Shows a large file right after its header and tempo map are read,
+then parses the remaining tracks in the background.
+"""
+import mmap
+import os
+import threading
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from src.midi_data_model import MidiProject, MidiTrack
+from src.smf_reader import (ParsedMidiFile, ParsedTrack, read_header, find_track_chunks,
+                            parse_track, read_track_name)
+from src.import_cache import get_import_cache
+
+# Files at least this large (with more than one track) load progressively
+PROGRESSIVE_MIN_BYTES = 2 * 1024 * 1024
+
+
+def should_load_progressively(file_path: str) -> bool:
+    """Check whether a file is large enough to open progressively"""
+    try:
+        if os.path.getsize(file_path) < PROGRESSIVE_MIN_BYTES:
+            return False
+        with open(file_path, 'rb') as f:
+            return read_header(f.read(14))[1] > 1
+    except (OSError, ValueError):
+        return False
+
+
+class ProgressiveMidiLoader(QObject):
+    """Loads the first (tempo) track synchronously and the rest on a worker thread"""
+
+    # Signals (emitted from the worker thread; delivered queued to the GUI thread)
+    track_loaded = Signal(object, object, object)  # placeholder MidiTrack, List[MidiNote], TrackEvents
+    progress = Signal(int, int)          # tracks loaded, total tracks
+    finished = Signal()                  # every track parsed
+    cancelled = Signal()                 # stopped before every track was parsed
+    failed = Signal(str)                 # error message
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.project: Optional[MidiProject] = None
+        self.track_base = 0           # Project index of the file's first track
+        self.total_tracks = 0
+        self.loaded_tracks = 0
+
+        self._data = None
+        self._parsed: Optional[ParsedMidiFile] = None  # Placeholders are replaced as tracks are parsed
+        self._chunks = []
+        self._pending: List[int] = []  # File track indices, front is parsed next
+        self._placeholders: Dict[int, MidiTrack] = {}  # File track index -> placeholder (tracks can move)
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def open(self) -> MidiProject:
+        """Read the header, tempo map and track names; returns a project with placeholder tracks"""
+        with open(self.file_path, 'rb') as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Empty MIDI file: {self.file_path}")
+
+        try:
+            smf_format, _, ticks_per_beat = read_header(self._data)
+            self._chunks = find_track_chunks(self._data)
+            if not self._chunks:
+                raise ValueError("MIDI file contains no tracks")
+
+            # The first track carries the tempo map; parse it now
+            first = parse_track(self._data, *self._chunks[0])
+            placeholders = [ParsedTrack(name=read_track_name(self._data, *chunk)) for chunk in self._chunks[1:]]
+        except IndexError:
+            self._close()
+            raise ValueError("Truncated MIDI track data")
+        except Exception:
+            self._close()
+            raise
+
+        self._parsed = ParsedMidiFile(smf_format, ticks_per_beat, [first] + placeholders)
+        self.project = self._parsed.to_project()
+        self.track_base = len(self.project.tracks) - len(self._chunks)
+        for file_index, track in enumerate(self.project.tracks[self.track_base + 1:], 1):
+            track.loading = True
+            self._placeholders[file_index] = track
+
+        self.total_tracks = len(self._chunks)
+        self.loaded_tracks = 1
+        self._pending = list(range(1, len(self._chunks)))
+        return self.project
+
+    def start(self):
+        """Parse the remaining tracks in the background"""
+        if not self._pending:
+            self._close()
+            self.finished.emit()
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def prioritize(self, track: MidiTrack):
+        """Move a placeholder track to the front of the queue if it hasn't been parsed yet"""
+        file_index = next((index for index, placeholder in self._placeholders.items() if placeholder is track), None)
+        with self._lock:
+            if file_index in self._pending and self._pending[0] != file_index:
+                self._pending.remove(file_index)
+                self._pending.insert(0, file_index)
+
+    def is_loading(self) -> bool:
+        """Check if tracks are still being parsed"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def cancel(self):
+        """Stop after the track currently being parsed"""
+        self._cancel_event.set()
+
+    def _run(self):
+        """Worker thread body"""
+        try:
+            while not self._cancel_event.is_set():
+                with self._lock:
+                    if not self._pending:
+                        break
+                    file_index = self._pending.pop(0)
+
+                parsed = parse_track(self._data, *self._chunks[file_index], tempo_as_events=True)
+                notes = parsed.to_notes()
+                if self._cancel_event.is_set():
+                    break
+
+                self._parsed.tracks[file_index] = parsed
+                self.loaded_tracks += 1
+                self.track_loaded.emit(self._placeholders[file_index], notes, parsed.events)
+                self.progress.emit(self.loaded_tracks, self.total_tracks)
+        except Exception as e:
+            self._close()
+            self.failed.emit(str(e))
+            return
+
+        self._close()
+        if self._cancel_event.is_set():
+            self.cancelled.emit()
+        else:
+            self._store_in_import_cache()
+            self.finished.emit()
+
+    def _store_in_import_cache(self):
+        """Cache the fully parsed file so reopening it skips parsing"""
+        import_cache = get_import_cache()
+        if import_cache:
+            try:
+                import_cache.store(self.file_path, self._parsed)
+            except OSError as e:
+                print(f"Error caching parsed MIDI file: {e}")
+
+    def _close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
@@ -0,0 +1,342 @@
+"""
+DominoPy project file (.pydomino)
+Binary project format: fixed header, aligned typed-array sections and a JSON
+description. Sections can be mapped zero-copy with mmap + numpy.frombuffer.
+
+Layout:
+    header   '<8sIIQQ'  magic, format version, flags, JSON offset, JSON length
+    sections typed arrays, each starting on a SECTION_ALIGNMENT boundary
+    JSON     project settings, track metadata, edit state and the section table
+
+Readers ignore unknown JSON keys and sections, so newer minor additions stay
+loadable; a higher major version is rejected.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.midi_data_model import (MidiNote, MidiTrack, MidiProject, TempoChange, TimeSignatureChange,
+                                 TrackEvents, AutomationPoint, reserve_note_ids)
+from src.atomic_file import atomic_write
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+PROJECT_FILE_EXTENSION = ".pydomino"
+PROJECT_MAGIC = b'PYDOMINO'
+PROJECT_FORMAT_VERSION = 1
+HEADER_FORMAT = '<8sIIQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SECTION_ALIGNMENT = 64
+
+# Section dtypes (numpy notation, little-endian) and matching array typecodes
+DTYPE_TYPECODES = {'<i4': 'i', '<u4': 'I', 'u1': 'B'}
+
+NOTE_COLUMNS = [('id', '<u4'), ('start_tick', '<i4'), ('end_tick', '<i4'), ('pitch', 'u1'), ('velocity', 'u1'),
+                ('channel', 'u1'), ('volume', 'u1'), ('expression', 'u1')]
+EVENT_COLUMNS = [('ticks', '<u4'), ('types', 'u1'), ('channels', 'u1'), ('data1', 'u1'), ('data2', 'u1')]
+AUTOMATION_KINDS = ['velocity', 'volume', 'expression']
+
+
+def is_project_file(file_path: str) -> bool:
+    """Check whether a file starts with the project magic"""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(PROJECT_MAGIC)) == PROJECT_MAGIC
+    except OSError:
+        return False
+
+
+def _typed_array(dtype: str, values) -> array:
+    """Build a little-endian typed array for a section"""
+    data = array(DTYPE_TYPECODES[dtype], values)
+    if sys.byteorder == 'big' and data.itemsize > 1:
+        data.byteswap()
+    return data
+
+
+class _SectionWriter:
+    """Writes aligned sections and records them in the section table"""
+
+    def __init__(self, f):
+        self.f = f
+        self.position = HEADER_SIZE
+        self.table: Dict[str, Dict[str, Any]] = {}
+
+    def write(self, name: str, dtype: str, values):
+        """Write values (an iterable, or raw bytes for 'u1') as an aligned section"""
+        if isinstance(values, (bytes, bytearray)):
+            data, count, nbytes = values, len(values), len(values)
+        else:
+            data = _typed_array(dtype, values)
+            count, nbytes = len(data), len(data) * data.itemsize
+
+        padding = -self.position % SECTION_ALIGNMENT
+        if padding:
+            self.f.write(b'\x00' * padding)
+            self.position += padding
+        self.f.write(data)
+        self.table[name] = {'dtype': dtype, 'offset': self.position, 'count': count}
+        self.position += nbytes
+
+
+def _write_array_sections(writer: _SectionWriter, prefix: str, arrays):
+    """Note sections straight from parsed typed arrays (ParsedTrack); other columns keep their defaults"""
+    writer.write(f"{prefix}/notes/start_tick", '<i4', arrays.start_ticks)
+    writer.write(f"{prefix}/notes/end_tick", '<i4', arrays.end_ticks)
+    writer.write(f"{prefix}/notes/pitch", 'u1', bytes(arrays.pitches))
+    writer.write(f"{prefix}/notes/velocity", 'u1', bytes(arrays.velocities))
+    writer.write(f"{prefix}/notes/channel", 'u1', bytes(arrays.channels))
+
+
+class NoteColumns:
+    """
+    A track's notes copied into section-ready typed arrays. Commands edit
+    MidiNote objects in place, so a writer on another thread needs this copy
+    rather than the notes themselves.
+    """
+
+    def __init__(self, notes: List[MidiNote]):
+        self.columns: Dict[str, array] = {name: array(DTYPE_TYPECODES[dtype], map(attrgetter(name), notes))
+                                          for name, dtype in NOTE_COLUMNS}
+        # kind -> (note indices, tick offsets, values); one row per automation point
+        self.automation: Dict[str, Tuple[array, array, array]] = {}
+        automated = [(index, note) for index, note in enumerate(notes)
+                     if note.velocity_automation or note.volume_automation or note.expression_automation]
+        for kind in AUTOMATION_KINDS:
+            rows = [(index, point.tick_offset, point.value)
+                    for index, note in automated
+                    for point in (getattr(note, f"{kind}_automation") or ())]
+            if rows:
+                self.automation[kind] = (array('I', (row[0] for row in rows)),
+                                         array('i', (row[1] for row in rows)),
+                                         array('B', (row[2] for row in rows)))
+
+    def __len__(self) -> int:
+        return len(self.columns['start_tick'])
+
+
+def _write_note_columns(writer: _SectionWriter, prefix: str, note_columns: NoteColumns):
+    for name, dtype in NOTE_COLUMNS:
+        writer.write(f"{prefix}/notes/{name}", dtype, note_columns.columns[name])
+
+    # Automation tables: one row per point, keyed by note index
+    for kind, (note_indices, tick_offsets, values) in note_columns.automation.items():
+        writer.write(f"{prefix}/automation/{kind}/note", '<u4', note_indices)
+        writer.write(f"{prefix}/automation/{kind}/tick_offset", '<i4', tick_offsets)
+        writer.write(f"{prefix}/automation/{kind}/value", 'u1', values)
+
+
+def _write_track_sections(writer: _SectionWriter, prefix: str, track: MidiTrack, arrays=None):
+    if arrays is None:
+        arrays = NoteColumns(track.notes)
+    if isinstance(arrays, NoteColumns):
+        _write_note_columns(writer, prefix, arrays)
+    else:
+        _write_array_sections(writer, prefix, arrays)
+
+    events = track.events
+    if len(events):
+        for column, dtype in EVENT_COLUMNS:
+            writer.write(f"{prefix}/events/{column}", dtype, getattr(events, column))
+        writer.write(f"{prefix}/events/payload_lengths", '<u4', (len(payload) for payload in events.payloads))
+        writer.write(f"{prefix}/events/payload_data", 'u1', b''.join(events.payloads))
+
+
+def write_project(f, project: MidiProject, edit_state: Optional[Dict[str, Any]] = None,
+                  note_arrays: Optional[Dict[int, Any]] = None):
+    """
+    Write a project to a seekable binary file object.
+    note_arrays maps track indices to parsed note arrays (ParsedTrack) or
+    NoteColumns written in place of those tracks' MidiNote lists.
+    """
+    note_arrays = note_arrays or {}
+    description = {
+        'format_version': PROJECT_FORMAT_VERSION,
+        'ticks_per_beat': project.ticks_per_beat,
+        'tempo_changes': [[change.tick, change.microseconds_per_beat] for change in project.tempo_changes],
+        'time_signatures': [[change.tick, change.numerator, change.denominator,
+                             change.clocks_per_click, change.notes_per_quarter]
+                            for change in project.time_signature_changes],
+        'tracks': [{'name': track.name, 'channel': track.channel, 'program': track.program,
+                    'color': track.color,
+                    'note_count': len(note_arrays[index]) if index in note_arrays else len(track.notes)}
+                   for index, track in enumerate(project.tracks)],
+        'edit_state': edit_state or {},
+    }
+
+    f.write(b'\x00' * HEADER_SIZE)  # Patched once the JSON offset is known
+    writer = _SectionWriter(f)
+    for index, track in enumerate(project.tracks):
+        _write_track_sections(writer, f"tracks/{index}", track, note_arrays.get(index))
+    description['sections'] = writer.table
+
+    json_bytes = json.dumps(description, ensure_ascii=False).encode('utf-8')
+    f.write(json_bytes)
+    f.seek(0)
+    f.write(struct.pack(HEADER_FORMAT, PROJECT_MAGIC, PROJECT_FORMAT_VERSION, 0,
+                        writer.position, len(json_bytes)))
+
+
+def save_project_file(project: MidiProject, file_path: str, edit_state: Optional[Dict[str, Any]] = None,
+                      atomic: bool = True):
+    """Write a project (and optional edit state) to a .pydomino file"""
+    if atomic:
+        with atomic_write(file_path) as f:
+            write_project(f, project, edit_state)
+    else:
+        with open(file_path, 'wb') as f:
+            write_project(f, project, edit_state)
+
+
+class ProjectFile:
+    """
+    Memory-mapped .pydomino file. Sections are returned as zero-copy views
+    (numpy arrays, or memoryviews without numpy); call close() when done.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Empty project file: {file_path}")
+
+        try:
+            if len(self._data) < HEADER_SIZE:
+                raise ValueError("Not a DominoPy project file")
+            magic, version, _, json_offset, json_length = struct.unpack_from(HEADER_FORMAT, self._data, 0)
+            if magic != PROJECT_MAGIC:
+                raise ValueError("Not a DominoPy project file")
+            if version > PROJECT_FORMAT_VERSION:
+                raise ValueError(f"Project file version {version} is newer than supported ({PROJECT_FORMAT_VERSION})")
+            self.version = version
+            self.description: Dict[str, Any] = json.loads(self._data[json_offset:json_offset + json_length])
+        except Exception:
+            self._data.close()
+            raise
+
+        self.sections: Dict[str, Dict[str, Any]] = self.description.get('sections', {})
+        self._buffer = None if NUMPY_AVAILABLE else memoryview(self._data)
+        self._views = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def has_section(self, name: str) -> bool:
+        return name in self.sections
+
+    def section(self, name: str):
+        """Zero-copy view of a section"""
+        entry = self.sections[name]
+        dtype, offset, count = entry['dtype'], entry['offset'], entry['count']
+        if NUMPY_AVAILABLE:
+            view = np.frombuffer(self._data, dtype=dtype, count=count, offset=offset)
+        else:
+            typecode = DTYPE_TYPECODES[dtype]
+            itemsize = array(typecode).itemsize
+            view = self._buffer[offset:offset + count * itemsize].cast(typecode)
+            if sys.byteorder == 'big' and itemsize > 1:
+                view = _typed_array(dtype, view)  # Byte-swapped copy
+        self._views.append(view)
+        return view
+
+    def _column(self, name: str) -> List[int]:
+        """Section values as a Python list"""
+        view = self.section(name)
+        return view.tolist()
+
+    def to_project(self) -> Tuple[MidiProject, Dict[str, Any]]:
+        """Materialize the MidiProject; returns (project, edit state)"""
+        description = self.description
+        project = MidiProject()
+        project.tracks = []
+        project.ticks_per_beat = description.get('ticks_per_beat', 480)
+        if description.get('tempo_changes'):
+            project.tempo_changes = [TempoChange.from_microseconds(tick, tempo)
+                                     for tick, tempo in description['tempo_changes']]
+        if description.get('time_signatures'):
+            project.time_signature_changes = [TimeSignatureChange(*values)
+                                              for values in description['time_signatures']]
+
+        for index, info in enumerate(description.get('tracks', [])):
+            track = MidiTrack(name=info.get('name', f"Track {index + 1}"), channel=info.get('channel', 0),
+                              program=info.get('program'), color=info.get('color', "#FF6B6B"))
+            self._read_track(f"tracks/{index}", track)
+            project.add_track(track)
+
+        return project, description.get('edit_state', {})
+
+    def _read_track(self, prefix: str, track: MidiTrack):
+        columns = {name: self._column(f"{prefix}/notes/{name}")
+                   for name, _ in NOTE_COLUMNS if self.has_section(f"{prefix}/notes/{name}")}
+        notes = [MidiNote(pitch, start, end, velocity, channel)
+                 for start, end, pitch, velocity, channel in zip(columns['start_tick'], columns['end_tick'],
+                                                                 columns['pitch'], columns['velocity'],
+                                                                 columns['channel'])]
+        for name, default in (('id', None), ('volume', 100), ('expression', 127)):
+            values = columns.get(name)
+            if values is None or values.count(default) == len(values):
+                continue  # Column missing, or every note has the MidiNote default
+            for note, value in zip(notes, values):
+                setattr(note, name, value)
+        if 'id' in columns and notes:
+            reserve_note_ids(max(columns['id']))
+
+        for kind in AUTOMATION_KINDS:
+            base = f"{prefix}/automation/{kind}"
+            if not self.has_section(f"{base}/note"):
+                continue
+            attribute = f"{kind}_automation"
+            for note_index, tick_offset, value in zip(self._column(f"{base}/note"),
+                                                      self._column(f"{base}/tick_offset"),
+                                                      self._column(f"{base}/value")):
+                note = notes[note_index]
+                if getattr(note, attribute) is None:
+                    setattr(note, attribute, [])
+                getattr(note, attribute).append(AutomationPoint(tick_offset, value))
+        track.notes = notes
+
+        if self.has_section(f"{prefix}/events/ticks"):
+            events = TrackEvents()
+            for column, dtype in EVENT_COLUMNS:
+                setattr(events, column, array(DTYPE_TYPECODES[dtype], self._column(f"{prefix}/events/{column}")))
+            blob = bytes(self.section(f"{prefix}/events/payload_data"))
+            position = 0
+            for length in self._column(f"{prefix}/events/payload_lengths"):
+                events.payloads.append(blob[position:position + length])
+                position += length
+            track.events = events
+
+    def close(self):
+        """Release the views and unmap the file"""
+        for view in self._views:
+            if isinstance(view, memoryview):
+                view.release()
+        self._views = []
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+        if self._data is not None:
+            try:
+                self._data.close()
+            except BufferError:
+                pass  # A caller still holds a numpy view; the map closes when it is collected
+            self._data = None
+
+
+def load_project_file(file_path: str) -> Tuple[MidiProject, Dict[str, Any]]:
+    """Load a .pydomino file; returns (project, edit state)"""
+    with ProjectFile(file_path) as project_file:
+        return project_file.to_project()
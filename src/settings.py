@@ -5,7 +5,7 @@ import json
 import os
 from typing import Dict, Any
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 class OctaveStandard(Enum):
     """MIDI octave naming standards"""
@@ -18,6 +18,12 @@ class Theme(Enum):
     DARK = "dark"
     LIGHT = "light"
 
+class FollowMode(Enum):
+    """How the piano roll follows the playhead during playback"""
+    OFF = "off"
+    PAGE = "page"      # Jump a page when the playhead reaches the right edge
+    SMOOTH = "smooth"  # Scroll continuously with the playhead held mid-view
+
 @dataclass
 class ThemeColors:
     """Color scheme for a theme"""
@@ -107,6 +113,7 @@ class DisplaySettings:
     show_note_names: bool = True
     show_grid_lines: bool = True
     snap_to_grid: bool = True
+    follow_mode: str = FollowMode.PAGE.value
     
     # Theme setting
     theme: str = Theme.DARK.value
@@ -126,11 +133,26 @@ class AudioSettings:
     soundfont_path: str = ""
     midi_device_id: int = -1
 
+@dataclass
+class AutosaveSettings:
+    """Background autosave settings"""
+    enabled: bool = True
+    interval_seconds: int = 60     # Save at most this often while there are unsaved edits
+    edits_threshold: int = 50      # ... or as soon as this many edits accumulate
+
+@dataclass
+class ImportCacheSettings:
+    """Cache of parsed MIDI imports"""
+    enabled: bool = True
+    max_megabytes: int = 1024
+
 @dataclass
 class AppSettings:
     """Main application settings"""
     display: DisplaySettings
     audio: AudioSettings
+    autosave: AutosaveSettings = field(default_factory=AutosaveSettings)
+    import_cache: ImportCacheSettings = field(default_factory=ImportCacheSettings)
     
     # Window state
     window_width: int = 1200
@@ -167,10 +189,16 @@ class SettingsManager:
                 audio_data = data.get('audio', {})
                 audio = AudioSettings(**audio_data)
                 
+                # Parse autosave settings
+                autosave = AutosaveSettings(**data.get('autosave', {}))
+                import_cache = ImportCacheSettings(**data.get('import_cache', {}))
+                
                 # Parse main settings
                 self.settings = AppSettings(
                     display=display,
                     audio=audio,
+                    autosave=autosave,
+                    import_cache=import_cache,
                     window_width=data.get('window_width', 1200),
                     window_height=data.get('window_height', 800),
                     window_maximized=data.get('window_maximized', False)
@@ -187,6 +215,8 @@ class SettingsManager:
             data = {
                 'display': asdict(self.settings.display),
                 'audio': asdict(self.settings.audio),
+                'autosave': asdict(self.settings.autosave),
+                'import_cache': asdict(self.settings.import_cache),
                 'window_width': self.settings.window_width,
                 'window_height': self.settings.window_height,
                 'window_maximized': self.settings.window_maximized
@@ -0,0 +1,400 @@
+"""
+Standard MIDI File reader
+Single-pass byte-level SMF parser that pairs notes straight into typed arrays.
+Does not depend on mido.
+"""
+import mmap
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from src.midi_data_model import (MidiNote, MidiTrack, MidiProject, TempoChange, TimeSignatureChange,
+                                  TrackEvents, EVENT_META)
+
+# Bump when parsing results change; import cache entries from other versions are discarded
+SMF_READER_VERSION = 1
+
+# Parallel loading kicks in for files with at least this many tracks and bytes
+PARALLEL_MIN_TRACKS = 4
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Workers are spawned, not forked: the app is multi-threaded (Qt, autosave, the
+# progressive loader) and a forked child can deadlock on a lock another thread held
+PARALLEL_START_METHOD = "spawn"
+
+# Smallest possible note: a note-on and a note-off of 3 bytes each
+# (1-byte delta + 2 bytes under running status); notes are emitted on the off
+MIN_NOTE_BYTES = 6
+
+
+@dataclass
+class ParsedTrack:
+    """Notes and other events of one MTrk chunk as parallel arrays"""
+    pitches: array = field(default_factory=lambda: array('B'))
+    channels: array = field(default_factory=lambda: array('B'))
+    velocities: array = field(default_factory=lambda: array('B'))
+    start_ticks: array = field(default_factory=lambda: array('i'))  # Same width as the .pydomino '<i4' columns
+    end_ticks: array = field(default_factory=lambda: array('i'))
+    tempo_changes: List[Tuple[int, int]] = field(default_factory=list)   # (tick, microseconds per beat)
+    time_signatures: List[Tuple[int, int, int, int, int]] = field(default_factory=list)  # (tick, nn, dd, cc, bb)
+    end_tick: int = 0
+    name: Optional[str] = None  # First track name meta event
+    events: TrackEvents = field(default_factory=TrackEvents)  # Everything except notes, tempo map and end of track
+
+    def __len__(self) -> int:
+        return len(self.pitches)
+
+    def to_notes(self) -> List[MidiNote]:
+        """Build MidiNote objects from the arrays"""
+        return [MidiNote(pitch, start, end, velocity, channel)
+                for pitch, start, end, velocity, channel
+                in zip(self.pitches, self.start_ticks, self.end_ticks, self.velocities, self.channels)]
+
+
+@dataclass
+class ParsedMidiFile:
+    """Header and per-track results of a parsed SMF"""
+    format: int
+    ticks_per_beat: int
+    tracks: List[ParsedTrack]
+
+    def to_project(self, with_notes: bool = True) -> MidiProject:
+        """Assemble a MidiProject (tempo/time signature are taken from the first track)"""
+        project = MidiProject()
+        project.ticks_per_beat = self.ticks_per_beat
+
+        if self.tracks:
+            # The file's tempo map replaces the project defaults
+            if self.tracks[0].tempo_changes:
+                project.tempo_changes.clear()
+            if self.tracks[0].time_signatures:
+                project.time_signature_changes.clear()
+            for tick, tempo in self.tracks[0].tempo_changes:
+                project.tempo_changes.append(TempoChange.from_microseconds(tick, tempo))
+            for tick, numerator, dd, clocks, notated in self.tracks[0].time_signatures:
+                project.time_signature_changes.append(
+                    TimeSignatureChange(tick, numerator, 2 ** dd, clocks, notated))
+
+        for i, parsed in enumerate(self.tracks):
+            track = MidiTrack(name=parsed.name or f"Track {i}")
+            if with_notes:
+                track.notes = parsed.to_notes()
+            track.events = parsed.events
+            project.add_track(track)
+        return project
+
+
+def read_header(data) -> Tuple[int, int, int]:
+    """Read the MThd chunk; returns (format, track count, ticks per beat)"""
+    if len(data) < 14 or data[0:4] != b'MThd':
+        raise ValueError("Not a Standard MIDI File (missing MThd header)")
+    header_length, smf_format, track_count, division = struct.unpack_from('>IHHH', data, 4)
+    if division & 0x8000:
+        raise ValueError("SMPTE time division is not supported")
+    return smf_format, track_count, division
+
+
+def find_track_chunks(data) -> List[Tuple[int, int]]:
+    """Locate every MTrk chunk; returns (data offset, length) pairs"""
+    header_length = struct.unpack_from('>I', data, 4)[0]
+    position = 8 + header_length
+    chunks = []
+    size = len(data)
+    while position + 8 <= size:
+        chunk_type = data[position:position + 4]
+        length = struct.unpack_from('>I', data, position + 4)[0]
+        start = position + 8
+        if chunk_type == b'MTrk':
+            chunks.append((start, min(length, size - start)))  # Tolerate truncated final chunks
+        position = start + length  # Skip unknown chunk types
+    return chunks
+
+
+def parse_track(data, offset: int, length: int, tempo_as_events: bool = False) -> ParsedTrack:
+    """
+    Decode one MTrk chunk in a single pass (VLQ deltas, running status, note pairing).
+    Tempo and time signature go to the track's tempo map lists, and are also kept
+    as meta events when tempo_as_events is set (tracks other than the first).
+    """
+    # Preallocate for the worst case and trim at the end
+    capacity = length // MIN_NOTE_BYTES + 1
+    pitches = array('B', bytes(capacity))
+    channels = array('B', bytes(capacity))
+    velocities = array('B', bytes(capacity))
+    start_ticks = array('i', [0]) * capacity
+    end_ticks = array('i', [0]) * capacity
+    count = 0
+
+    tempo_changes = []
+    time_signatures = []
+    sounding = {}  # (channel << 7 | pitch) -> (start tick, velocity)
+    name = None
+
+    events = TrackEvents()
+    event_ticks = events.ticks.append
+    event_types = events.types.append
+    event_channels = events.channels.append
+    event_data1 = events.data1.append
+    event_data2 = events.data2.append
+    event_payloads = events.payloads.append
+
+    position = offset
+    end = offset + length
+    tick = 0
+    status = 0
+
+    while position < end:
+        # Delta time (VLQ)
+        byte = data[position]
+        position += 1
+        delta = byte & 0x7F
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            delta = (delta << 7) | (byte & 0x7F)
+        tick += delta
+
+        byte = data[position]
+        if byte & 0x80:
+            position += 1
+            if byte >= 0xF0:
+                if byte == 0xFF:
+                    meta_type = data[position]
+                    position += 1
+                    meta_length = 0
+                    while True:
+                        byte = data[position]
+                        position += 1
+                        meta_length = (meta_length << 7) | (byte & 0x7F)
+                        if not byte & 0x80:
+                            break
+                    if meta_type == 0x2F:
+                        break
+                    keep = True
+                    if meta_type == 0x51 and meta_length >= 3:
+                        tempo_changes.append((tick, (data[position] << 16) | (data[position + 1] << 8) | data[position + 2]))
+                        keep = tempo_as_events
+                    elif meta_type == 0x58 and meta_length >= 4:
+                        time_signatures.append((tick, data[position], data[position + 1],
+                                                data[position + 2], data[position + 3]))
+                        keep = tempo_as_events
+                    elif meta_type == 0x03 and name is None:
+                        name = _decode_text(data[position:position + meta_length])
+                        keep = False
+                    if keep:
+                        event_ticks(tick)
+                        event_types(EVENT_META)
+                        event_channels(0)
+                        event_data1(meta_type)
+                        event_data2(0)
+                        event_payloads(data[position:position + meta_length])
+                    position += meta_length
+                elif byte == 0xF0 or byte == 0xF7:
+                    sysex_type = byte
+                    sysex_length = 0
+                    while True:
+                        byte = data[position]
+                        position += 1
+                        sysex_length = (sysex_length << 7) | (byte & 0x7F)
+                        if not byte & 0x80:
+                            break
+                    event_ticks(tick)
+                    event_types(sysex_type)
+                    event_channels(0)
+                    event_data1(0)
+                    event_data2(0)
+                    event_payloads(data[position:position + sysex_length])
+                    position += sysex_length
+                # System common/real-time bytes carry no running status
+                continue
+            status = byte
+        elif not status:
+            raise ValueError(f"Running status without a prior status byte at offset {position}")
+
+        kind = status >> 4
+        if kind == 0x9 or kind == 0x8:
+            pitch = data[position]
+            velocity = data[position + 1]
+            position += 2
+            key = ((status & 0x0F) << 7) | pitch
+            if kind == 0x9 and velocity:
+                sounding[key] = (tick, velocity)
+            else:
+                started = sounding.pop(key, None)
+                if started is not None:
+                    pitches[count] = pitch
+                    channels[count] = status & 0x0F
+                    velocities[count] = started[1]
+                    start_ticks[count] = started[0]
+                    end_ticks[count] = tick
+                    count += 1
+        elif kind == 0xC or kind == 0xD:
+            event_ticks(tick)
+            event_types(status & 0xF0)
+            event_channels(status & 0x0F)
+            event_data1(data[position])
+            event_data2(0)
+            position += 1
+        else:
+            event_ticks(tick)
+            event_types(status & 0xF0)
+            event_channels(status & 0x0F)
+            event_data1(data[position])
+            event_data2(data[position + 1])
+            position += 2
+
+    del pitches[count:], channels[count:], velocities[count:], start_ticks[count:], end_ticks[count:]
+    return ParsedTrack(pitches, channels, velocities, start_ticks, end_ticks,
+                       tempo_changes, time_signatures, tick, name, events)
+
+
+def read_track_name(data, offset: int, length: int) -> Optional[str]:
+    """Find a track's name by scanning only the leading meta events of its chunk"""
+    position = offset
+    end = offset + length
+    try:
+        while position < end:
+            byte = data[position]
+            position += 1
+            while byte & 0x80:  # Skip the delta time
+                byte = data[position]
+                position += 1
+            if data[position] != 0xFF:
+                return None  # Names come before the first channel/sysex event
+            meta_type = data[position + 1]
+            position += 2
+            meta_length = 0
+            while True:
+                byte = data[position]
+                position += 1
+                meta_length = (meta_length << 7) | (byte & 0x7F)
+                if not byte & 0x80:
+                    break
+            if meta_type == 0x03:
+                return _decode_text(data[position:position + meta_length])
+            if meta_type == 0x2F:
+                return None
+            position += meta_length
+    except IndexError:
+        pass
+    return None
+
+
+def _decode_text(raw: bytes) -> Optional[str]:
+    """Decode SMF text (no declared encoding; tries UTF-8, then Shift_JIS, then Latin-1)"""
+    for encoding in ('utf-8', 'cp932'):
+        try:
+            return raw.decode(encoding).strip() or None
+        except UnicodeDecodeError:
+            continue
+    return raw.decode('latin-1').strip() or None
+
+
+def parse_smf_bytes(data) -> ParsedMidiFile:
+    """Parse SMF data from any buffer supporting indexing and slicing"""
+    smf_format, _, ticks_per_beat = read_header(data)
+    try:
+        tracks = [parse_track(data, offset, length, tempo_as_events=index > 0)
+                  for index, (offset, length) in enumerate(find_track_chunks(data))]
+    except IndexError:
+        raise ValueError("Truncated MIDI track data")
+    return ParsedMidiFile(smf_format, ticks_per_beat, tracks)
+
+
+def parse_smf_file(file_path: str) -> ParsedMidiFile:
+    """Parse a Standard MIDI File through a read-only memory map"""
+    with open(file_path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Empty MIDI file: {file_path}")
+        try:
+            return parse_smf_bytes(data)
+        finally:
+            data.close()
+
+
+# Per-process memory map of the file being loaded (set by the pool initializer)
+_worker_data = None
+
+
+def _init_parse_worker(file_path: str):
+    """Map the file once per worker process; all workers share the page cache"""
+    global _worker_data
+    with open(file_path, 'rb') as f:
+        _worker_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _parse_track_worker(chunk: Tuple[int, int, bool]) -> ParsedTrack:
+    """Decode one track chunk in a worker process"""
+    offset, length, tempo_as_events = chunk
+    try:
+        return parse_track(_worker_data, offset, length, tempo_as_events)
+    except IndexError:
+        raise ValueError("Truncated MIDI track data")
+
+
+def parse_smf_file_parallel(file_path: str, max_workers: Optional[int] = None) -> ParsedMidiFile:
+    """Parse a multi-track SMF with one task per MTrk chunk in a process pool"""
+    with open(file_path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Empty MIDI file: {file_path}")
+        try:
+            smf_format, _, ticks_per_beat = read_header(data)
+            chunks = find_track_chunks(data)
+        finally:
+            data.close()
+
+    max_workers = min(max_workers or os.cpu_count() or 1, max(1, len(chunks)))
+
+    # Submit the longest chunks first so one big track doesn't finish last
+    order = sorted(range(len(chunks)), key=lambda i: chunks[i][1], reverse=True)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(PARALLEL_START_METHOD),
+                             initializer=_init_parse_worker, initargs=(file_path,)) as executor:
+        futures = {i: executor.submit(_parse_track_worker, (*chunks[i], i > 0)) for i in order}
+        tracks = [futures[i].result() for i in range(len(chunks))]
+
+    return ParsedMidiFile(smf_format, ticks_per_beat, tracks)
+
+
+def should_parse_in_parallel(file_path: str) -> bool:
+    """Check whether a file is large enough for the process pool to pay off"""
+    if (os.cpu_count() or 1) < 2 or os.path.getsize(file_path) < PARALLEL_MIN_BYTES:
+        return False
+    with open(file_path, 'rb') as f:
+        header = f.read(14)
+    try:
+        return read_header(header)[1] >= PARALLEL_MIN_TRACKS
+    except ValueError:
+        return False
+
+
+def parse_midi_file(file_path: str, parallel: Optional[bool] = None) -> ParsedMidiFile:
+    """
+    Parse a Standard MIDI File into typed arrays.
+    parallel=None decides from the file size and track count.
+    """
+    if parallel is None:
+        parallel = should_parse_in_parallel(file_path)
+
+    if parallel:
+        try:
+            return parse_smf_file_parallel(file_path)
+        except ValueError:
+            raise
+        except Exception as e:
+            # Process pools can be unavailable (restricted sandboxes, some frozen builds)
+            print(f"Parallel MIDI parsing failed, falling back to serial: {e}")
+
+    return parse_smf_file(file_path)
+
+
+def read_midi_file(file_path: str, parallel: Optional[bool] = None) -> MidiProject:
+    """Load a Standard MIDI File into a MidiProject without mido"""
+    return parse_midi_file(file_path, parallel).to_project()
@@ -0,0 +1,180 @@
+"""
+Standard MIDI File writer
+Encodes tracks straight into bytearrays (VLQ deltas, running status) without mido.
+"""
+import struct
+from typing import List, Optional
+
+from src.midi_data_model import MidiProject, MidiTrack, EVENT_SYSEX, EVENT_META
+from src.atomic_file import atomic_write
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Order of simultaneous events: note-offs, then meta/sysex, then channel controls, then note-ons
+ORDER_NOTE_OFF = 0
+ORDER_META = 1
+ORDER_CONTROL = 2
+ORDER_NOTE_ON = 3
+ORDER_OWN_NOTE_OFF = 4  # A zero-length note's off must follow its own on
+ORDER_COUNT = 5
+
+# Note-offs are written as note-on velocity 0 so they share running status with note-ons
+NOTE_ON = 0x90
+
+
+def encode_vlq(value: int) -> bytes:
+    """Encode a variable-length quantity"""
+    if value < 0x80:
+        return bytes((value,))
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def _new_chunk() -> bytearray:
+    """Start an MTrk chunk; the length is filled in by _finish_chunk"""
+    return bytearray(b'MTrk\x00\x00\x00\x00')
+
+
+def _finish_chunk(chunk: bytearray) -> bytearray:
+    """Append End of Track and fill in the chunk length"""
+    chunk += b'\x00\xff\x2f\x00'
+    struct.pack_into('>I', chunk, 4, len(chunk) - 8)
+    return chunk
+
+
+def _append_meta(chunk: bytearray, delta: int, meta_type: int, payload: bytes):
+    chunk += encode_vlq(delta)
+    chunk.append(0xFF)
+    chunk.append(meta_type)
+    chunk += encode_vlq(len(payload))
+    chunk += payload
+
+
+def encode_conductor_track(project: MidiProject) -> bytearray:
+    """Encode the tempo map (tempo and time signature changes) as the first track"""
+    entries = []
+    for tempo_change in project.tempo_changes:
+        entries.append((tempo_change.tick, 0x51, tempo_change.microseconds_per_beat.to_bytes(3, 'big')))
+    for ts_change in project.time_signature_changes:
+        dd = max(0, ts_change.denominator.bit_length() - 1)  # Denominator as a power of two
+        entries.append((ts_change.tick, 0x58, bytes((ts_change.numerator, dd, ts_change.clocks_per_click,
+                                                    ts_change.notes_per_quarter))))
+    entries.sort(key=lambda entry: entry[0])
+
+    chunk = _new_chunk()
+    last_tick = 0
+    for tick, meta_type, payload in entries:
+        _append_meta(chunk, tick - last_tick, meta_type, payload)
+        last_tick = tick
+    return _finish_chunk(chunk)
+
+
+def _sorted_event_order(ticks: List[int], orders: List[int]):
+    """Stable sort by (tick, order); returns (event indices, delta times)"""
+    if NUMPY_AVAILABLE:
+        tick_array = np.asarray(ticks, dtype=np.int64)
+        keys = tick_array * ORDER_COUNT + np.asarray(orders, dtype=np.int64)
+        order = np.argsort(keys, kind='stable')
+        sorted_ticks = tick_array[order]
+        deltas = np.diff(sorted_ticks, prepend=0)
+        return order.tolist(), deltas.tolist()
+
+    order = sorted(range(len(ticks)), key=lambda i: (ticks[i], orders[i]))
+    deltas = []
+    last_tick = 0
+    for i in order:
+        deltas.append(ticks[i] - last_tick)
+        last_tick = ticks[i]
+    return order, deltas
+
+
+def encode_track(track: MidiTrack) -> bytearray:
+    """Encode a track's name, notes and events as one MTrk chunk"""
+    notes = track.notes
+    events = track.events
+
+    # Columns: notes as on/off pairs, then the track's other events
+    ticks = [note.start_tick for note in notes]
+    ticks += [note.end_tick for note in notes]
+    ticks += events.ticks
+    orders = [ORDER_NOTE_ON] * len(notes)
+    orders += [ORDER_OWN_NOTE_OFF if note.end_tick == note.start_tick else ORDER_NOTE_OFF for note in notes]
+    orders += [ORDER_META if event_type >= EVENT_SYSEX else ORDER_CONTROL for event_type in events.types]
+    statuses = [NOTE_ON | note.channel for note in notes] * 2
+    statuses += [event_type if event_type >= EVENT_SYSEX else event_type | channel
+                 for event_type, channel in zip(events.types, events.channels)]
+    data1 = [note.pitch for note in notes] * 2
+    data1 += events.data1
+    data2 = [max(1, note.velocity) for note in notes] + [0] * len(notes)
+    data2 += events.data2
+
+    # Sysex/meta payloads follow event order within the TrackEvents arrays
+    payloads: List[Optional[bytes]] = [None] * (2 * len(notes))
+    payload_iter = iter(events.payloads)
+    payloads += [next(payload_iter) if event_type >= EVENT_SYSEX else None for event_type in events.types]
+
+    order, deltas = _sorted_event_order(ticks, orders)
+
+    chunk = _new_chunk()
+    _append_meta(chunk, 0, 0x03, track.name.encode('utf-8'))
+    append = chunk.append
+    running = None
+    for i, delta in zip(order, deltas):
+        if delta < 0x80:
+            append(delta)
+        else:
+            chunk += encode_vlq(delta)
+
+        status = statuses[i]
+        if status < EVENT_SYSEX:
+            if status != running:
+                append(status)
+                running = status
+            append(data1[i])
+            if status & 0xE0 != 0xC0:  # Program change / channel pressure have one data byte
+                append(data2[i])
+        else:
+            # Sysex and meta events cancel running status
+            running = None
+            payload = payloads[i]
+            if status == EVENT_META:
+                append(0xFF)
+                append(data1[i])
+            else:
+                append(status)
+            chunk += encode_vlq(len(payload))
+            chunk += payload
+
+    return _finish_chunk(chunk)
+
+
+def write_midi_file(project: MidiProject, file_path: str, atomic: bool = True):
+    """Write a format 1 SMF: tempo map track plus one track per non-empty project track"""
+    chunks = [encode_conductor_track(project)]
+    for track in project.tracks:
+        if not track.notes and not len(track.events):
+            continue  # Skip empty tracks
+        chunks.append(encode_track(track))
+
+    header = b'MThd' + struct.pack('>IHHH', 6, 1, len(chunks), project.ticks_per_beat)
+    if atomic:
+        with atomic_write(file_path) as f:
+            _write_chunks(f, header, chunks)
+    else:
+        with open(file_path, 'wb') as f:
+            _write_chunks(f, header, chunks)
+
+
+def _write_chunks(f, header: bytes, chunks: List[bytearray]):
+    """One write per chunk"""
+    f.write(header)
+    for chunk in chunks:
+        f.write(chunk)
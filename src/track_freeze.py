@@ -0,0 +1,273 @@
+"""
+Track Freeze
+Renders tracks offline to cached audio buffers and streams them during playback
+"""
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QObject, QIODevice
+from src.midi_data_model import MidiTrack
+from src.audio_source_manager import AudioSource, AudioSourceType
+from src.audio_system import AudioSettings, send_fluidsynth_messages
+from src.logger import print_debug
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import fluidsynth
+    FLUIDSYNTH_AVAILABLE = True
+except ImportError:
+    FLUIDSYNTH_AVAILABLE = False
+
+try:
+    from PySide6.QtMultimedia import QAudioFormat, QAudioSink, QMediaDevices
+    QT_MULTIMEDIA_AVAILABLE = True
+except ImportError:
+    QT_MULTIMEDIA_AVAILABLE = False
+
+# Directory for memory-mapped freeze buffers
+FREEZE_CACHE_DIR = os.path.expanduser("~/.pydomino_cache/freeze")
+
+# Seconds rendered after the last note-off so release tails are kept
+FREEZE_TAIL_SECONDS = 2.0
+
+# Frames rendered per get_samples() call between events
+RENDER_BLOCK_FRAMES = 4096
+
+# Order of simultaneous render events, as in live playback: note-offs, then
+# controls, then note-ons, then the offs of zero-length notes (which must
+# follow their own note-on)
+RENDER_ORDER_NOTE_OFF = 0
+RENDER_ORDER_CONTROL = 1
+RENDER_ORDER_NOTE_ON = 2
+RENDER_ORDER_OWN_NOTE_OFF = 3
+
+
+@dataclass
+class FrozenTrack:
+    """Rendered audio for a frozen track"""
+    track_index: int
+    samples: Optional[object]      # int16 array of shape (frames, 2), in RAM or np.memmap
+    sample_rate: int
+    ticks_per_second: float        # Tempo the buffer was rendered at
+    signature: int                 # Note content signature at render time
+    cache_path: Optional[str] = None
+    stale: bool = False
+
+    @property
+    def frame_count(self) -> int:
+        return 0 if self.samples is None else len(self.samples)
+
+    def matches_tempo(self, ticks_per_second: float) -> bool:
+        """Check if the buffer was rendered at the given tempo"""
+        return abs(self.ticks_per_second - ticks_per_second) < 1e-6
+
+    def release(self):
+        """Drop the buffer and remove its cache file"""
+        self.samples = None
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                os.remove(self.cache_path)
+            except OSError as e:
+                print(f"TrackFreeze: Could not remove cache file {self.cache_path}: {e}")
+        self.cache_path = None
+
+
+def compute_track_signature(track: MidiTrack) -> int:
+    """Hash the audible content of a track (notes and channel events) to detect edits after freezing"""
+    return hash((track.program, tuple(sorted(
+        (note.start_tick, note.end_tick, note.pitch, note.velocity, note.channel)
+        for note in track.notes
+    )), tuple(track.events.channel_events())))
+
+
+def can_freeze_source(source: Optional[AudioSource]) -> bool:
+    """Check if a track's audio source can be rendered offline"""
+    return (source is not None and
+            source.source_type == AudioSourceType.SOUNDFONT and
+            bool(source.file_path) and os.path.exists(source.file_path))
+
+
+def render_track_offline(track: MidiTrack, source: AudioSource, ticks_per_second: float,
+                         sample_rate: int = None, cancel_event: threading.Event = None):
+    """Render a track's notes and channel events (CC, program, pitch bend, aftertouch)
+    through a driverless FluidSynth instance.
+
+    Returns an int16 array of shape (frames, 2), or None on failure or cancellation.
+    """
+    if not NUMPY_AVAILABLE or not FLUIDSYNTH_AVAILABLE:
+        print("TrackFreeze: numpy and FluidSynth are required to freeze tracks")
+        return None
+
+    settings = AudioSettings()
+    sample_rate = sample_rate or settings.sample_rate
+
+    # No driver is started, so get_samples() pulls audio faster than real time
+    fs = fluidsynth.Synth(samplerate=float(sample_rate), gain=settings.gain)
+    try:
+        sfid = fs.sfload(source.file_path)
+        if sfid == -1:
+            print(f"TrackFreeze: Failed to load soundfont: {source.file_path}")
+            return None
+
+        program_number = max(0, min(127, source.program - 1))  # Same mapping as PerTrackAudioRouter
+        channels = {note.channel for note in track.notes} or {source.channel}
+        for channel in channels:
+            fs.program_select(channel, sfid, 0, program_number)
+
+        # Build (frame, order, message) events in RENDER_ORDER_* order
+        frames_per_tick = sample_rate / ticks_per_second
+        events = []
+        for note in track.notes:
+            off_order = RENDER_ORDER_OWN_NOTE_OFF if note.end_tick == note.start_tick else RENDER_ORDER_NOTE_OFF
+            events.append((int(note.start_tick * frames_per_tick), RENDER_ORDER_NOTE_ON,
+                           [0x90 | note.channel, note.pitch, note.velocity]))
+            events.append((int(note.end_tick * frames_per_tick), off_order, [0x90 | note.channel, note.pitch, 0]))
+        for tick, status, data1, data2 in track.events.channel_events():
+            events.append((int(tick * frames_per_tick), RENDER_ORDER_CONTROL, [status, data1, data2]))
+        events.sort(key=lambda event: event[:2])
+
+        total_frames = (events[-1][0] if events else 0) + int(FREEZE_TAIL_SECONDS * sample_rate)
+        output = np.zeros((total_frames, 2), dtype=np.int16)
+
+        position = 0
+        event_index = 0
+        while position < total_frames:
+            if cancel_event is not None and cancel_event.is_set():
+                print_debug(f"TrackFreeze: Render of '{track.name}' cancelled")
+                return None
+
+            # Fire every event due at the current frame
+            due = []
+            while event_index < len(events) and events[event_index][0] <= position:
+                due.append(events[event_index][2])
+                event_index += 1
+            if due:
+                send_fluidsynth_messages(fs, due)
+
+            # Render up to the next event or block boundary
+            next_frame = events[event_index][0] if event_index < len(events) else total_frames
+            block = max(1, min(RENDER_BLOCK_FRAMES, next_frame - position, total_frames - position))
+            chunk = np.asarray(fs.get_samples(block), dtype=np.int16).reshape(-1, 2)
+            output[position:position + len(chunk)] = chunk[:total_frames - position]
+            position += block
+
+        return output
+    except Exception as e:
+        print(f"TrackFreeze: Error rendering track '{track.name}': {e}")
+        return None
+    finally:
+        fs.delete()
+
+
+def store_freeze_buffer(samples, track_index: int, signature: int, use_disk_cache: bool = True):
+    """Move a rendered buffer into a memory-mapped cache file.
+
+    Returns (buffer, cache_path); falls back to the in-memory buffer if the file cannot be written.
+    """
+    if not use_disk_cache:
+        return samples, None
+
+    try:
+        os.makedirs(FREEZE_CACHE_DIR, exist_ok=True)
+        cache_path = os.path.join(FREEZE_CACHE_DIR, f"track{track_index:02d}_{signature & 0xFFFFFFFF:08x}.pcm")
+        mapped = np.memmap(cache_path, dtype=np.int16, mode='w+', shape=samples.shape)
+        mapped[:] = samples
+        mapped.flush()
+        del mapped
+        return np.memmap(cache_path, dtype=np.int16, mode='r', shape=samples.shape), cache_path
+    except Exception as e:
+        print(f"TrackFreeze: Could not write freeze cache, keeping buffer in memory: {e}")
+        return samples, None
+
+
+class FrozenMixDevice(QIODevice):
+    """Pull-mode QIODevice that mixes frozen track buffers from a frame position"""
+
+    def __init__(self, frozen_tracks: List[FrozenTrack], start_frame: int = 0,
+                 is_audible: Optional[Callable[[int], bool]] = None):
+        super().__init__()
+        self.frozen_tracks = frozen_tracks
+        self.is_audible = is_audible  # Checked per read so mute/solo applies immediately
+        self.position = start_frame
+        self.end_frame = max((frozen.frame_count for frozen in frozen_tracks), default=0)
+
+    def readData(self, maxlen: int) -> bytes:
+        frames = min(maxlen // 4, self.end_frame - self.position)  # 2 channels x int16
+        if frames <= 0:
+            return b""
+
+        start = self.position
+        mix = np.zeros((frames, 2), dtype=np.int32)
+        for frozen in self.frozen_tracks:
+            if frozen.samples is None or start >= frozen.frame_count:
+                continue
+            if self.is_audible and not self.is_audible(frozen.track_index):
+                continue
+            segment = frozen.samples[start:start + frames]
+            mix[:len(segment)] += segment
+
+        self.position += frames
+        return np.clip(mix, -32768, 32767).astype(np.int16).tobytes()
+
+    def writeData(self, data) -> int:
+        return -1
+
+    def bytesAvailable(self) -> int:
+        return max(0, self.end_frame - self.position) * 4 + super().bytesAvailable()
+
+    def isSequential(self) -> bool:
+        return True
+
+
+class FrozenTrackPlayer(QObject):
+    """Streams frozen track buffers to the default audio output"""
+
+    def __init__(self):
+        super().__init__()
+        self.sink = None
+        self.device: Optional[FrozenMixDevice] = None
+
+    def start(self, frozen_tracks: List[FrozenTrack], start_seconds: float,
+              is_audible: Optional[Callable[[int], bool]] = None) -> bool:
+        """Start streaming the given buffers from a position in seconds"""
+        self.stop()
+
+        if not frozen_tracks:
+            return False
+        if not QT_MULTIMEDIA_AVAILABLE or not NUMPY_AVAILABLE:
+            print("TrackFreeze: QtMultimedia and numpy are required to play frozen tracks")
+            return False
+
+        sample_rate = frozen_tracks[0].sample_rate
+        audio_format = QAudioFormat()
+        audio_format.setSampleRate(sample_rate)
+        audio_format.setChannelCount(2)
+        audio_format.setSampleFormat(QAudioFormat.Int16)
+
+        try:
+            self.device = FrozenMixDevice(frozen_tracks, int(start_seconds * sample_rate), is_audible)
+            self.device.open(QIODevice.ReadOnly)
+            self.sink = QAudioSink(QMediaDevices.defaultAudioOutput(), audio_format)
+            self.sink.start(self.device)
+            print_debug(f"TrackFreeze: Streaming {len(frozen_tracks)} frozen track(s) from {start_seconds:.3f}s")
+            return True
+        except Exception as e:
+            print(f"TrackFreeze: Could not start frozen track playback: {e}")
+            self.stop()
+            return False
+
+    def stop(self):
+        """Stop streaming"""
+        if self.sink:
+            self.sink.stop()
+            self.sink = None
+        if self.device:
+            self.device.close()
+            self.device = None
@@ -2,11 +2,14 @@
 Track Manager for Multi-Track Support
 Handles track management, active track selection, and track operations
 """
+import threading
 from typing import List, Optional, Dict, Any
 from PySide6.QtCore import QObject, Signal
 from src.midi_data_model import MidiProject, MidiTrack, MidiNote
 from src.audio_source_manager import get_audio_source_manager
 from src.gm_instruments import get_gm_instrument_name
+from src.track_freeze import (FrozenTrack, compute_track_signature, can_freeze_source,
+                              render_track_offline, store_freeze_buffer)
 
 # Default color palette for tracks (16 colors with good contrast)
 DEFAULT_TRACK_COLORS = [
@@ -108,6 +111,11 @@ class TrackManager(QObject):
     track_color_changed = Signal(int, str)      # track_index, new_color
     track_settings_changed = Signal(int)        # track_index
     project_changed = Signal()                  # project updated
+    track_freeze_changed = Signal(int, bool)    # track_index, is_frozen
+    track_freeze_stale = Signal(int)            # track_index (notes edited after freezing)
+    track_mute_changed = Signal(int, bool)      # track_index, is_muted
+    track_solo_changed = Signal(int, bool)      # track_index, is_soloed
+    _freeze_render_finished = Signal(object, object)  # samples, render job
     
     def __init__(self, project: Optional[MidiProject] = None):
         super().__init__()
@@ -115,6 +123,17 @@ class TrackManager(QObject):
         self.active_track_index = 0
         self.track_colors: Dict[int, str] = {}  # track_index -> color
         
+        # Mute/solo bitmasks (bit N = track N), read by the playback scheduler at dispatch time
+        self.mute_mask = 0
+        self.solo_mask = 0
+        self.audible_mask = -1  # All bits set: every track audible
+        
+        # Track freeze state
+        self.frozen_tracks: Dict[int, FrozenTrack] = {}  # track_index -> rendered buffer
+        self.freeze_use_disk_cache = True  # Memory-map buffers from disk instead of keeping them in RAM
+        self._freeze_jobs: Dict[int, Dict[str, Any]] = {}  # track_index -> running render job
+        self._freeze_render_finished.connect(self._on_freeze_render_finished)
+        
         # Initialize with project if provided
         if project:
             self.set_project(project)
@@ -124,6 +143,10 @@ class TrackManager(QObject):
         self.project = project
         self.active_track_index = 0
         self.track_colors.clear()
+        self.mute_mask = 0
+        self.solo_mask = 0
+        self.audible_mask = -1
+        self._clear_freeze_state()
         
         if self.project:
             self._initialize_track_colors()
@@ -315,6 +338,27 @@ class TrackManager(QObject):
                 new_colors[i - 1] = color
         self.track_colors = new_colors
         
+        # Update mute/solo masks (shift bits down)
+        self.mute_mask = self._remove_mask_bit(self.mute_mask, track_index)
+        self.solo_mask = self._remove_mask_bit(self.solo_mask, track_index)
+        self._update_audible_mask()
+        
+        # Update freeze state (shift indices down)
+        self._cancel_freeze_job(track_index)
+        removed_freeze = self.frozen_tracks.pop(track_index, None)
+        if removed_freeze:
+            removed_freeze.release()
+        self.frozen_tracks = {
+            (i - 1 if i > track_index else i): frozen for i, frozen in self.frozen_tracks.items()
+        }
+        for frozen_index, frozen in self.frozen_tracks.items():
+            frozen.track_index = frozen_index
+        self._freeze_jobs = {
+            (i - 1 if i > track_index else i): job for i, job in self._freeze_jobs.items()
+        }
+        for job_index, job in self._freeze_jobs.items():
+            job['track_index'] = job_index
+        
         # Adjust active track index
         if self.active_track_index >= track_index:
             self.active_track_index = max(0, self.active_track_index - 1)
@@ -361,6 +405,9 @@ class TrackManager(QObject):
                         channel=new_track.channel
                     )
                     new_track.notes.append(new_note)
+                
+                # Copy controllers, program changes and meta events onto the new channel
+                new_track.events = source_track.events.copy(channel=new_track.channel)
         
         return new_track_index
     
@@ -415,12 +462,241 @@ class TrackManager(QObject):
             'is_active': track_index == self.active_track_index,
             'audio_source': audio_source,
             'audio_source_name': audio_source_name,
-            'gm_instrument_name': gm_instrument_name
+            'gm_instrument_name': gm_instrument_name,
+            'is_muted': self.is_track_muted(track_index),
+            'is_soloed': self.is_track_soloed(track_index),
+            'is_frozen': track_index in self.frozen_tracks,
+            'freeze_stale': track_index in self.frozen_tracks and self.frozen_tracks[track_index].stale
         }
     
     def get_all_tracks_info(self) -> List[Dict[str, Any]]:
         """Get information for all tracks"""
         return [self.get_track_info(i) for i in range(self.get_track_count())]
+    
+    # Mute / solo
+    
+    def is_track_muted(self, track_index: int) -> bool:
+        """Check if a track is muted"""
+        return bool((self.mute_mask >> track_index) & 1)
+    
+    def is_track_soloed(self, track_index: int) -> bool:
+        """Check if a track is soloed"""
+        return bool((self.solo_mask >> track_index) & 1)
+    
+    def is_track_audible(self, track_index: int) -> bool:
+        """Check if a track should sound"""
+        return bool((self.audible_mask >> track_index) & 1)
+    
+    def set_track_muted(self, track_index: int, muted: bool) -> bool:
+        """Mute or unmute a track"""
+        if not self.get_track(track_index):
+            return False
+        if self.is_track_muted(track_index) == muted:
+            return True
+        
+        self.mute_mask ^= 1 << track_index
+        self._update_audible_mask()
+        self.track_mute_changed.emit(track_index, muted)
+        return True
+    
+    def set_track_soloed(self, track_index: int, soloed: bool) -> bool:
+        """Solo or unsolo a track"""
+        if not self.get_track(track_index):
+            return False
+        if self.is_track_soloed(track_index) == soloed:
+            return True
+        
+        self.solo_mask ^= 1 << track_index
+        self._update_audible_mask()
+        self.track_solo_changed.emit(track_index, soloed)
+        return True
+    
+    def toggle_track_mute(self, track_index: int) -> bool:
+        """Toggle a track's mute state"""
+        return self.set_track_muted(track_index, not self.is_track_muted(track_index))
+    
+    def toggle_track_solo(self, track_index: int) -> bool:
+        """Toggle a track's solo state"""
+        return self.set_track_soloed(track_index, not self.is_track_soloed(track_index))
+    
+    def _update_audible_mask(self):
+        """Precompute the audible mask: any solo overrides mute"""
+        self.audible_mask = self.solo_mask if self.solo_mask else ~self.mute_mask
+    
+    @staticmethod
+    def _remove_mask_bit(mask: int, track_index: int) -> int:
+        """Drop a track's bit from a mask, shifting higher tracks down"""
+        low = mask & ((1 << track_index) - 1)
+        return low | ((mask >> (track_index + 1)) << track_index)
+    
+    # Track freeze
+    
+    def is_track_frozen(self, track_index: int) -> bool:
+        """Check if a track is frozen (rendered, with its synth released)"""
+        return track_index in self.frozen_tracks
+    
+    def is_freeze_stale(self, track_index: int) -> bool:
+        """Check if a frozen track was edited after its buffer was rendered"""
+        frozen = self.frozen_tracks.get(track_index)
+        return frozen is not None and frozen.stale
+    
+    def is_freeze_rendering(self, track_index: int) -> bool:
+        """Check if a freeze render is running for a track"""
+        return track_index in self._freeze_jobs
+    
+    def freeze_track(self, track_index: int) -> bool:
+        """Render a track offline in the background, then release its synth"""
+        track = self.get_track(track_index)
+        if not track:
+            return False
+        
+        audio_source_manager = get_audio_source_manager()
+        source = audio_source_manager.get_track_source(track_index) if audio_source_manager else None
+        if not can_freeze_source(source):
+            print(f"TrackManager: Track {track_index} cannot be frozen (only soundfont sources can be rendered offline)")
+            return False
+        
+        self._cancel_freeze_job(track_index)
+        
+        # Snapshot the notes so editing can continue while rendering
+        snapshot = MidiTrack(name=track.name, channel=track.channel, program=track.program, color=track.color)
+        snapshot.notes = [
+            MidiNote(pitch=note.pitch, start_tick=note.start_tick, end_tick=note.end_tick,
+                     velocity=note.velocity, channel=note.channel)
+            for note in track.notes
+        ]
+        
+        job = {
+            'track_index': track_index,
+            'signature': compute_track_signature(track),
+            'ticks_per_second': self._get_playback_ticks_per_second(),
+            'cancel': threading.Event(),
+        }
+        self._freeze_jobs[track_index] = job
+        
+        def render():
+            samples = render_track_offline(snapshot, source, job['ticks_per_second'], cancel_event=job['cancel'])
+            if samples is not None and not job['cancel'].is_set():
+                samples, job['cache_path'] = store_freeze_buffer(
+                    samples, job['track_index'], job['signature'], self.freeze_use_disk_cache)
+            # Emitted from the worker thread; delivered on the GUI thread
+            self._freeze_render_finished.emit(samples, job)
+        
+        threading.Thread(target=render, name=f"freeze-track-{track_index}", daemon=True).start()
+        print(f"TrackManager: Freezing track {track_index} in background")
+        return True
+    
+    def unfreeze_track(self, track_index: int) -> bool:
+        """Drop a track's rendered buffer and bring its synth back"""
+        self._cancel_freeze_job(track_index)
+        frozen = self.frozen_tracks.pop(track_index, None)
+        if not frozen:
+            return False
+        
+        frozen.release()
+        
+        from src.per_track_audio_router import get_per_track_audio_router
+        router = get_per_track_audio_router()
+        if router:
+            router.initialize_track_audio(track_index)
+        
+        self.track_freeze_changed.emit(track_index, False)
+        self.track_settings_changed.emit(track_index)
+        return True
+    
+    def rerender_frozen_track(self, track_index: int) -> bool:
+        """Re-render a stale frozen track in the background"""
+        if track_index not in self.frozen_tracks:
+            return False
+        return self.freeze_track(track_index)
+    
+    def refresh_freeze_state(self) -> List[int]:
+        """Mark frozen tracks whose notes changed as stale and return their indices"""
+        newly_stale = []
+        for track_index, frozen in self.frozen_tracks.items():
+            if frozen.stale:
+                continue
+            track = self.get_track(track_index)
+            if track is None or compute_track_signature(track) != frozen.signature:
+                frozen.stale = True
+                newly_stale.append(track_index)
+        
+        for track_index in newly_stale:
+            print(f"TrackManager: Frozen track {track_index} was edited - freeze is stale")
+            self.track_freeze_stale.emit(track_index)
+        return newly_stale
+    
+    def is_freeze_playable(self, track_index: int) -> bool:
+        """Check if a frozen track plays from its buffer at the current tempo (its synth stays released)"""
+        frozen = self.frozen_tracks.get(track_index)
+        return (frozen is not None and not frozen.stale and frozen.samples is not None
+                and frozen.matches_tempo(self._get_playback_ticks_per_second()))
+    
+    def get_playable_frozen_tracks(self, ticks_per_second: float) -> List[FrozenTrack]:
+        """Get frozen buffers that are current for the given tempo"""
+        return [frozen for frozen in self.frozen_tracks.values()
+                if not frozen.stale and frozen.samples is not None and frozen.matches_tempo(ticks_per_second)]
+    
+    def _on_freeze_render_finished(self, samples, job: Dict[str, Any]):
+        """Install a finished render and release the track's synth"""
+        if self._freeze_jobs.get(job['track_index']) is not job:
+            return  # Cancelled or superseded
+        track_index = job['track_index']
+        del self._freeze_jobs[track_index]
+        
+        if samples is None:
+            print(f"TrackManager: Freeze render failed for track {track_index}")
+            return
+        
+        from src.audio_system import AudioSettings
+        old_freeze = self.frozen_tracks.get(track_index)
+        if old_freeze and old_freeze.cache_path != job.get('cache_path'):
+            old_freeze.release()
+        
+        self.frozen_tracks[track_index] = FrozenTrack(
+            track_index=track_index,
+            samples=samples,
+            sample_rate=AudioSettings().sample_rate,
+            ticks_per_second=job['ticks_per_second'],
+            signature=job['signature'],
+            cache_path=job.get('cache_path')
+        )
+        
+        # The buffer replaces the synth, so tear the synth instance down
+        from src.per_track_audio_router import get_per_track_audio_router
+        router = get_per_track_audio_router()
+        if router:
+            router.release_track_audio(track_index)
+        
+        # Edits made while rendering leave the new buffer stale right away
+        self.refresh_freeze_state()
+        
+        print(f"TrackManager: Track {track_index} frozen ({self.frozen_tracks[track_index].frame_count} frames)")
+        self.track_freeze_changed.emit(track_index, True)
+        self.track_settings_changed.emit(track_index)
+    
+    def _cancel_freeze_job(self, track_index: int):
+        """Cancel a running freeze render"""
+        job = self._freeze_jobs.pop(track_index, None)
+        if job:
+            job['cancel'].set()
+    
+    def _clear_freeze_state(self):
+        """Drop all freeze buffers and running renders"""
+        for track_index in list(self._freeze_jobs.keys()):
+            self._cancel_freeze_job(track_index)
+        for frozen in self.frozen_tracks.values():
+            frozen.release()
+        self.frozen_tracks.clear()
+    
+    def _get_playback_ticks_per_second(self) -> float:
+        """Get the tempo freeze buffers must be rendered at"""
+        from src.playback_engine import get_playback_engine
+        engine = get_playback_engine()
+        if engine:
+            return engine.ticks_per_second
+        ticks_per_beat = self.project.ticks_per_beat if self.project else 480
+        return 120.0 * ticks_per_beat / 60.0
 
 # Global track manager instance
 _track_manager: Optional[TrackManager] = None
@@ -438,4 +714,6 @@ def initialize_track_manager(project: Optional[MidiProject] = None) -> TrackMana
 def cleanup_track_manager():
     """Clean up the global track manager"""
     global _track_manager
+    if _track_manager:
+        _track_manager._clear_freeze_state()
     _track_manager = None
\ No newline at end of file
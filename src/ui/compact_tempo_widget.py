@@ -128,6 +128,7 @@ class CompactMusicInfoWidget(QWidget):
         self.setup_ui()
         self.current_notes = []
         self.current_project = None
+        self._last_playhead_tick = None  # Skip the note lookup while the playhead stands still
         
         # Update timer for playhead position
         self.update_timer = QTimer()
@@ -236,6 +237,9 @@ class CompactMusicInfoWidget(QWidget):
         if is_playing:
             # During playback, show playhead info
             current_tick = engine.get_current_tick()
+            if current_tick == self._last_playhead_tick:
+                return
+            self._last_playhead_tick = current_tick
             
             # Get notes currently playing at this position
             playing_notes = self.current_project.get_notes_at_tick(current_tick)
@@ -248,6 +252,7 @@ class CompactMusicInfoWidget(QWidget):
                 # No notes playing, show "Playing..." 
                 self.music_label.setText("♪ Playing...")
         else:
+            self._last_playhead_tick = None
             # Not playing - check if we need to revert to "No notes" state
             if self.music_label.text() == "♪ Playing...":
                 self.music_label.setText("♪ No notes")
@@ -295,7 +300,10 @@ class CompactPlaybackInfoWidget(QWidget):
         minutes = int(beats / tempo_bpm)
         seconds = int((beats / tempo_bpm * 60) % 60)
         
-        self.position_label.setText(f"{minutes}:{seconds:02d}")
+        # Only touch the label when the text changes (setText relayouts and repaints)
+        text = f"{minutes}:{seconds:02d}"
+        if text != self.position_label.text():
+            self.position_label.setText(text)
 
 
 class ToolbarSeparator(QFrame):
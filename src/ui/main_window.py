@@ -1,7 +1,7 @@
 
 from PySide6.QtWidgets import (QMainWindow, QFileDialog, QWidget, QHBoxLayout, QToolBar, 
                               QScrollArea, QVBoxLayout, QScrollBar, QDockWidget, QMessageBox, QDialog, QApplication, QComboBox, QLabel)
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction, QActionGroup, QIcon
 from PySide6.QtCore import Qt, QTimer
 from src.ui.piano_roll_widget import PianoRollWidget
 from src.ui.status_bar import DominoPyStatusBar
@@ -10,6 +10,11 @@ from src.ui.compact_tempo_widget import (CompactTempoWidget, CompactTimeSignatur
                                        CompactMusicInfoWidget, CompactPlaybackInfoWidget, 
                                        ToolbarSeparator)
 from src.midi_parser import load_midi_file, save_midi_file
+from src.progressive_midi_loader import ProgressiveMidiLoader, should_load_progressively
+from src.import_cache import initialize_import_cache, cleanup_import_cache, get_import_cache
+from src.project_file import load_project_file, save_project_file, PROJECT_FILE_EXTENSION
+from src.autosave import (initialize_autosave_service, cleanup_autosave_service, get_autosave_service,
+                          collect_crashed_sessions, recover_session, discard_session)
 from src.edit_modes import EditMode
 from src.audio_system import initialize_audio_manager, cleanup_audio_manager, AudioSettings
 from src.playback_engine import initialize_playback_engine, cleanup_playback_engine, get_playback_engine, PlaybackState
@@ -20,6 +25,7 @@ from src.per_track_audio_router import initialize_per_track_audio_router, cleanu
 from src.ui.track_list_widget import TrackListWidget
 from src.ui.virtual_keyboard_widget import VirtualKeyboardWidget
 from src.ui.measure_bar_widget import MeasureBarWidget
+from src.ui.overview_widget import TrackOverviewWidget
 from src.ui.grid_subdivision_widget import GridSubdivisionWidget
 from src.logger import get_logger, print_debug
 
@@ -27,6 +33,7 @@ class DominoPyMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.logger = get_logger(__name__)
+        self.progressive_loader = None  # Set while a large file's tracks load in the background
         self.setWindowTitle("DominoPy")
         self.setGeometry(100, 100, 800, 600) # x, y, width, height
 
@@ -46,11 +53,18 @@ class DominoPyMainWindow(QMainWindow):
         # Create measure bar widget
         self.measure_bar = MeasureBarWidget()
         
+        # Overview strip: note density per track and measure, click to jump
+        self.overview = TrackOverviewWidget()
+        self.overview.set_summary(self.piano_roll.measure_summary)
+        self.piano_roll.note_index.add_listener(self.overview.notes_changed)
+        self.overview.position_requested.connect(self._on_overview_position_requested)
+        
         # Create container widget with scrollbars
         piano_roll_container = QWidget()
         piano_roll_layout = QVBoxLayout(piano_roll_container)
         piano_roll_layout.setContentsMargins(0, 0, 0, 0)
         piano_roll_layout.setSpacing(0)  # Remove spacing between widgets
+        piano_roll_layout.addWidget(self.overview)
         
         # Add measure bar at the top
         measure_bar_layout = QHBoxLayout()
@@ -103,12 +117,16 @@ class DominoPyMainWindow(QMainWindow):
         self._create_toolbar()
         self._create_music_toolbar()
         
+        # Parsed MIDI import cache (needed before the first file is opened)
+        self._initialize_import_cache()
+        
         # Initialize systems (delayed to ensure QApplication is ready)
         QTimer.singleShot(50, self._initialize_audio_system)
         QTimer.singleShot(75, self._initialize_audio_source_manager)
         QTimer.singleShot(90, self._initialize_per_track_router)
         QTimer.singleShot(100, self._initialize_midi_routing)
         QTimer.singleShot(125, self._initialize_track_manager)
+        QTimer.singleShot(140, self._initialize_autosave)
         QTimer.singleShot(150, self._initialize_playback_engine)
         QTimer.singleShot(175, self._initialize_virtual_keyboard)
         QTimer.singleShot(200, self._connect_ui_signals)
@@ -123,8 +141,20 @@ class DominoPyMainWindow(QMainWindow):
         open_action = file_menu.addAction("&Open...")
         open_action.triggered.connect(self._open_midi_file)
         
+        self.cancel_load_action = file_menu.addAction("&Cancel Loading")
+        self.cancel_load_action.setEnabled(False)
+        self.cancel_load_action.triggered.connect(self._cancel_progressive_load)
+        
+        open_project_action = file_menu.addAction("Open &Project...")
+        open_project_action.setShortcut("Ctrl+Shift+O")
+        open_project_action.triggered.connect(self._open_project_file)
+        
         file_menu.addSeparator()
         
+        save_project_action = file_menu.addAction("Save P&roject As...")
+        save_project_action.setShortcut("Ctrl+Shift+S")
+        save_project_action.triggered.connect(self._save_project_file)
+        
         save_action = file_menu.addAction("&Save As...")
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self._save_midi_file)
@@ -215,6 +245,27 @@ class DominoPyMainWindow(QMainWindow):
         play_pause_action.setToolTip("Toggle playback (Space key)")
         play_pause_action.triggered.connect(self._toggle_playback)
         
+        playback_menu.addSeparator()
+        
+        # Follow playhead: how the piano roll scrolls along during playback
+        follow_menu = playback_menu.addMenu("&Follow Playhead")
+        follow_group = QActionGroup(self)
+        from src.settings import FollowMode, get_settings
+        current_follow_mode = get_settings().display.follow_mode
+        for follow_mode, label in ((FollowMode.OFF, "&Off"), (FollowMode.PAGE, "&Page"),
+                                   (FollowMode.SMOOTH, "&Smooth")):
+            follow_action = follow_menu.addAction(label)
+            follow_action.setCheckable(True)
+            follow_action.setChecked(follow_mode.value == current_follow_mode)
+            follow_action.triggered.connect(lambda checked, mode=follow_mode.value: self.piano_roll.set_follow_mode(mode))
+            follow_group.addAction(follow_action)
+        
+        playback_menu.addSeparator()
+        
+        playback_stats_action = playback_menu.addAction("Playback &Statistics...")
+        playback_stats_action.setToolTip("Show playback jitter and latency statistics")
+        playback_stats_action.triggered.connect(self._show_playback_stats)
+        
         # Settings Menu
         settings_menu = menu_bar.addMenu("&Settings")
         
@@ -260,36 +311,163 @@ class DominoPyMainWindow(QMainWindow):
             selected_files = file_dialog.selectedFiles()
             if selected_files:
                 file_path = selected_files[0]
+                self._abandon_progressive_load()
                 try:
-                    midi_project = load_midi_file(file_path)
-                    self.piano_roll.set_midi_project(midi_project)
-                    
-                    # Set project in playback engine
-                    engine = get_playback_engine()
-                    if engine:
-                        engine.set_project(midi_project)
-                    
-                    # Set project in track manager
-                    track_manager = get_track_manager()
-                    if track_manager:
-                        track_manager.set_project(midi_project)
-                    
-                    # Update UI with project settings
-                    self._update_project_ui(midi_project)
-                    
-                    # Set project in music info widget
-                    self.music_info_widget.set_project(midi_project)
-                    
-                    # Update horizontal scrollbar maximum based on project length
-                    self.h_scrollbar.setMaximum(self.piano_roll.visible_end_tick)
-                    self.h_scrollbar.setValue(0) # Reset horizontal scroll to beginning
-                    
-                    self.setWindowTitle(f"DominoPy - {file_path}")
-                    self.status_bar.update_project_name(file_path.split('/')[-1])
+                    import_cache = get_import_cache()
+                    cached = import_cache is not None and import_cache.contains(file_path)
+                    if should_load_progressively(file_path) and not cached:
+                        self._open_midi_file_progressively(file_path)
+                    else:
+                        self._set_loaded_project(load_midi_file(file_path), file_path)
+                        if cached:
+                            stats = import_cache.get_stats()
+                            self.status_bar.show_message(
+                                f"Loaded from import cache ({stats['hits']} hits, {stats['misses']} misses)", 3000)
                 except Exception as e:
                     self.logger.info(f"Error loading MIDI file: {e}")
                     # TODO: Show error message to user
     
+    def _set_loaded_project(self, midi_project, file_path: str):
+        """Show a newly opened project in every view"""
+        self.piano_roll.set_midi_project(midi_project)
+        
+        # Set project in playback engine
+        engine = get_playback_engine()
+        if engine:
+            engine.set_project(midi_project)
+        
+        # Set project in track manager
+        track_manager = get_track_manager()
+        if track_manager:
+            track_manager.set_project(midi_project)
+        
+        # Update UI with project settings
+        self._update_project_ui(midi_project)
+        
+        # Set project in music info widget
+        self.music_info_widget.set_project(midi_project)
+        
+        # Update horizontal scrollbar maximum based on project length
+        self.h_scrollbar.setMaximum(self.piano_roll.visible_end_tick)
+        self.h_scrollbar.setValue(0) # Reset horizontal scroll to beginning
+        
+        self.setWindowTitle(f"DominoPy - {file_path}")
+        self.status_bar.update_project_name(file_path.split('/')[-1])
+        self._attach_autosave(midi_project, file_path)
+    
+    def _open_midi_file_progressively(self, file_path: str):
+        """Show the tempo map and track placeholders now, parse the remaining tracks in the background"""
+        loader = ProgressiveMidiLoader(file_path)
+        midi_project = loader.open()
+        self.progressive_loader = loader
+        
+        loader.track_loaded.connect(self._on_progressive_track_loaded)
+        loader.progress.connect(self._on_progressive_load_progress)
+        loader.finished.connect(self._on_progressive_load_finished)
+        loader.cancelled.connect(self._on_progressive_load_cancelled)
+        loader.failed.connect(self._on_progressive_load_failed)
+        
+        self._set_loaded_project(midi_project, file_path)
+        self.cancel_load_action.setEnabled(True)
+        self.status_bar.show_message(f"Loading tracks: 1/{loader.total_tracks}", 0)
+        loader.start()
+    
+    def _is_current_loader(self) -> bool:
+        """Ignore results from a loader whose project has since been replaced"""
+        loader = self.sender()
+        return loader is not None and loader is self.progressive_loader
+    
+    def _on_progressive_track_loaded(self, track, notes, events):
+        """Swap a placeholder track for its parsed notes and events"""
+        if not self._is_current_loader():
+            return
+        project = self.progressive_loader.project
+        if not any(existing is track for existing in project.tracks):
+            return  # The placeholder was removed while it was loading
+        track.notes = notes + track.notes  # Keep anything added while it was loading
+        track.events = events
+        track.loading = False
+        
+        # Extend the scrollable range if this track runs past it
+        if notes:
+            end_tick = max(note.end_tick for note in notes) + project.ticks_per_beat * 32
+            if end_tick > self.piano_roll.visible_end_tick:
+                self.piano_roll.visible_end_tick = end_tick
+                self.h_scrollbar.setMaximum(end_tick)
+        
+        self.piano_roll.update()
+        self.track_list.update_track_info()
+    
+    def _on_progressive_load_progress(self, loaded: int, total: int):
+        if self._is_current_loader():
+            self.status_bar.show_message(f"Loading tracks: {loaded}/{total}", 0)
+    
+    def _on_progressive_load_finished(self):
+        """Every track is parsed; recompile playback with the full project"""
+        if not self._is_current_loader():
+            return
+        project = self.progressive_loader.project
+        self.progressive_loader = None
+        self.cancel_load_action.setEnabled(False)
+        
+        engine = get_playback_engine()
+        if engine and engine.project is project:
+            engine.set_project(project, preserve_position=True)
+        self.status_bar.show_message("All tracks loaded", 3000)
+    
+    def _on_progressive_load_cancelled(self):
+        if not self._is_current_loader():
+            return
+        self._finish_cancelled_load("Loading cancelled")
+    
+    def _on_progressive_load_failed(self, message: str):
+        if not self._is_current_loader():
+            return
+        self.logger.info(f"Error loading MIDI file: {message}")
+        self._finish_cancelled_load(f"Loading failed: {message}")
+    
+    def _finish_cancelled_load(self, message: str):
+        """Leave unparsed tracks empty and keep what was loaded"""
+        loader = self.progressive_loader
+        self.progressive_loader = None
+        self.cancel_load_action.setEnabled(False)
+        
+        skipped = 0
+        for track in loader.project.tracks:
+            if track.loading:
+                track.loading = False
+                skipped += 1
+        
+        engine = get_playback_engine()
+        if engine and engine.project is loader.project:
+            engine.set_project(loader.project, preserve_position=True)
+        self.track_list.update_track_info()
+        self.status_bar.show_message(f"{message} ({skipped} tracks not loaded)", 5000)
+    
+    def _cancel_progressive_load(self):
+        """Stop a running progressive load, keeping the tracks parsed so far (File > Cancel Loading)"""
+        if self.progressive_loader:
+            self.progressive_loader.cancel()
+    
+    def _abandon_progressive_load(self):
+        """Stop a running progressive load whose project is about to be replaced.
+        The loader is disconnected and forgotten so its late signals can't touch the next project"""
+        loader = self.progressive_loader
+        if not loader:
+            return
+        self.progressive_loader = None
+        self.cancel_load_action.setEnabled(False)
+        loader.cancel()
+        for signal in (loader.track_loaded, loader.progress, loader.finished, loader.cancelled, loader.failed):
+            signal.disconnect()
+    
+    def _on_active_track_for_loading(self, track_index: int):
+        """Jumping to a track that isn't loaded yet moves it to the front of the queue"""
+        if self.progressive_loader:
+            tracks = self.progressive_loader.project.tracks
+            if 0 <= track_index < len(tracks):
+                self.progressive_loader.prioritize(tracks[track_index])
+    
     def _save_midi_file(self):
         """Save current project as MIDI file"""
         if not self.piano_roll.midi_project:
@@ -318,6 +496,105 @@ class DominoPyMainWindow(QMainWindow):
                     print(f"Error saving MIDI file: {e}")
                     QMessageBox.critical(self, "Save Error", f"Error saving MIDI file: {str(e)}")
     
+    def _open_project_file(self):
+        """Open a DominoPy project file with its track settings and edit state"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Open Project", "",
+                                                   f"DominoPy Projects (*{PROJECT_FILE_EXTENSION})")
+        if not file_path:
+            return
+        
+        self._abandon_progressive_load()
+        try:
+            midi_project, edit_state = load_project_file(file_path)
+        except Exception as e:
+            self.logger.info(f"Error loading project file: {e}")
+            QMessageBox.warning(self, "Open Error", f"Failed to open project:\n{e}")
+            return
+        
+        self._set_loaded_project(midi_project, file_path)
+        self._restore_edit_state(edit_state)
+        self.status_bar.show_message(f"Project opened: {file_path}", 3000)
+    
+    def _save_project_file(self):
+        """Save the project with track settings, automation and edit state"""
+        if not self.piano_roll.midi_project:
+            QMessageBox.warning(self, "No Project", "No project loaded to save.")
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Project", "",
+                                                   f"DominoPy Projects (*{PROJECT_FILE_EXTENSION})")
+        if not file_path:
+            return
+        if not file_path.endswith(PROJECT_FILE_EXTENSION):
+            file_path += PROJECT_FILE_EXTENSION
+        
+        try:
+            save_project_file(self.piano_roll.midi_project, file_path, self._collect_edit_state())
+        except Exception as e:
+            self.logger.info(f"Error saving project file: {e}")
+            QMessageBox.critical(self, "Save Error", f"Failed to save project:\n{e}")
+            return
+        
+        self.setWindowTitle(f"DominoPy - {file_path}")
+        self.status_bar.update_project_name(file_path.split('/')[-1])
+        self.status_bar.show_message(f"Project saved as {file_path}", 3000)
+    
+    def _collect_edit_state(self) -> dict:
+        """Track settings and editor state stored alongside the notes in project files"""
+        from src.audio_source_manager import get_audio_source_manager
+        
+        state = {'scroll_tick': self.h_scrollbar.value()}
+        
+        track_manager = get_track_manager()
+        if track_manager and track_manager.project:
+            track_count = len(track_manager.project.tracks)
+            state['active_track'] = track_manager.active_track_index
+            state['muted'] = [i for i in range(track_count) if track_manager.is_track_muted(i)]
+            state['soloed'] = [i for i in range(track_count) if track_manager.is_track_soloed(i)]
+            
+            audio_source_manager = get_audio_source_manager()
+            if audio_source_manager:
+                state['audio_sources'] = {str(i): audio_source_manager.get_track_source_id(i)
+                                          for i in range(track_count)
+                                          if audio_source_manager.get_track_source_id(i)}
+        
+        engine = get_playback_engine()
+        if engine:
+            state['tempo_bpm'] = engine.get_tempo()
+            state['playhead_tick'] = engine.get_current_tick()
+        return state
+    
+    def _restore_edit_state(self, state: dict):
+        """Apply edit state read from a project file"""
+        from src.audio_source_manager import get_audio_source_manager
+        from src.audio_routing_coordinator import get_audio_routing_coordinator
+        
+        track_manager = get_track_manager()
+        if track_manager:
+            for track_index in state.get('muted', []):
+                track_manager.set_track_muted(track_index, True)
+            for track_index in state.get('soloed', []):
+                track_manager.set_track_soloed(track_index, True)
+            if 'active_track' in state:
+                track_manager.set_active_track(state['active_track'])
+        
+        audio_source_manager = get_audio_source_manager()
+        coordinator = get_audio_routing_coordinator()
+        if audio_source_manager:
+            for track_index, source_id in state.get('audio_sources', {}).items():
+                if audio_source_manager.assign_source_to_track(int(track_index), source_id) and coordinator:
+                    coordinator.refresh_track_route(int(track_index))
+        self.track_list.refresh_tracks()
+        
+        engine = get_playback_engine()
+        if engine:
+            if 'tempo_bpm' in state:
+                engine.set_tempo(state['tempo_bpm'])
+            if state.get('playhead_tick'):
+                engine.seek_to_tick(state['playhead_tick'])
+        if 'scroll_tick' in state:
+            self.h_scrollbar.setValue(state['scroll_tick'])
+    
     def _export_midi_file(self):
         """Export current project as MIDI file (same as save for now)"""
         self._save_midi_file()
@@ -660,6 +937,17 @@ class DominoPyMainWindow(QMainWindow):
         # Connect track selection to piano roll
         self.track_list.track_selected.connect(self._on_track_selected)
         
+        # Track freeze: refresh playback when buffers change, offer re-render when stale
+        track_manager.track_freeze_changed.connect(self._on_track_freeze_changed)
+        track_manager.track_freeze_stale.connect(self._on_track_freeze_stale)
+        
+        # Mute/solo: only silence voices on tracks that just became inaudible
+        track_manager.track_mute_changed.connect(self._on_track_audibility_changed)
+        track_manager.track_solo_changed.connect(self._on_track_audibility_changed)
+        
+        # Progressive file loading: parse the track the user jumps to next
+        track_manager.active_track_changed.connect(self._on_active_track_for_loading)
+        
         # Set the default project in piano roll and measure bar
         self.piano_roll.set_midi_project(default_project)
         self.measure_bar.set_midi_project(default_project)
@@ -669,6 +957,83 @@ class DominoPyMainWindow(QMainWindow):
         
         print("Track manager initialized with 8 default tracks")
     
+    def _initialize_import_cache(self):
+        """Cache parsed MIDI imports so reopened files skip parsing"""
+        from src.settings import get_settings
+        settings = get_settings().import_cache
+        if settings.enabled:
+            import_cache = initialize_import_cache(settings.max_megabytes * 1024 * 1024)
+            if import_cache:
+                print(f"Import cache initialized ({import_cache.directory})")
+    
+    def _initialize_autosave(self):
+        """Start background autosave for the current project"""
+        from src.settings import get_settings
+        settings = get_settings().autosave
+        autosave = initialize_autosave_service(settings.interval_seconds, settings.edits_threshold)
+        autosave.enabled = settings.enabled
+        autosave.set_edit_state_provider(self._collect_edit_state)
+        autosave.saved.connect(self._on_autosaved)
+        autosave.failed.connect(self._on_autosave_failed)
+        
+        # Track edits made outside the piano roll's command history
+        track_manager = get_track_manager()
+        if track_manager:
+            for signal in (track_manager.track_added, track_manager.track_removed):
+                signal.connect(autosave.track_list_changed)
+            for signal in (track_manager.track_renamed, track_manager.track_color_changed,
+                           track_manager.track_settings_changed):
+                signal.connect(lambda *args: autosave.mark_dirty())
+        
+        # Move journals of a crashed session aside before this session starts its own
+        crashed_sessions = collect_crashed_sessions()
+        
+        self._attach_autosave(self.piano_roll.midi_project, "Untitled")
+        print(f"Autosave initialized ({autosave.get_autosave_path()})")
+        
+        if crashed_sessions:
+            QTimer.singleShot(500, lambda: self._offer_session_recovery(crashed_sessions))
+    
+    def _offer_session_recovery(self, sessions):
+        """Offer to replay the newest crashed session's edits; other sessions are discarded"""
+        session, older = sessions[0], sessions[1:]
+        for stale in older:
+            discard_session(stale)
+        
+        reply = QMessageBox.question(
+            self, "Recover Unsaved Edits",
+            f"DominoPy did not shut down cleanly while editing \"{session.display_name}\".\n"
+            "Recover the last autosave and the edits made after it?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if reply != QMessageBox.Yes:
+            discard_session(session)
+            return
+        
+        try:
+            midi_project, edit_state, replayed = recover_session(session)
+        except Exception as e:
+            self.logger.info(f"Error recovering session: {e}")
+            QMessageBox.warning(self, "Recovery Error", f"Failed to recover edits:\n{e}")
+            return
+        
+        self._abandon_progressive_load()
+        self._set_loaded_project(midi_project, edit_state.get('project_name', session.name))
+        self._restore_edit_state(edit_state)
+        discard_session(session)
+        self.status_bar.show_message(f"Recovered \"{session.display_name}\" ({replayed} edits replayed from the journal)", 5000)
+    
+    def _attach_autosave(self, project, project_name: str):
+        autosave = get_autosave_service()
+        if autosave and project:
+            autosave.attach(project, self.piano_roll.command_history, project_name)
+    
+    def _on_autosaved(self, file_path: str, gui_ms: float, write_seconds: float):
+        self.status_bar.show_message(f"Autosaved ({gui_ms:.2f} ms on UI thread, {write_seconds:.2f} s in background)", 2000)
+    
+    def _on_autosave_failed(self, message: str):
+        self.logger.info(f"Autosave failed: {message}")
+        self.status_bar.show_message(f"Autosave failed: {message}", 5000)
+    
     def _initialize_unified_audio_routing(self):
         """Initialize unified audio routing coordinator (called with delay to ensure managers are ready)"""
         from src.audio_routing_coordinator import initialize_audio_routing_coordinator
@@ -711,8 +1076,48 @@ class DominoPyMainWindow(QMainWindow):
         # Update virtual keyboard track info
         self._update_virtual_keyboard_track_info()
     
+    def _on_track_audibility_changed(self, track_index: int, enabled: bool):
+        """Apply a mute/solo change to the running playback"""
+        engine = get_playback_engine()
+        if engine:
+            engine.apply_track_audibility()
+    
+    def _on_track_freeze_changed(self, track_index: int, frozen: bool):
+        """Re-prepare playback so frozen tracks switch between streamed and scheduled"""
+        engine = get_playback_engine()
+        if engine and engine.project:
+            engine.set_project(engine.project, preserve_position=True)
+        state = "frozen" if frozen else "unfrozen"
+        self.status_bar.show_message(f"Track {track_index + 1} {state}", 3000)
+    
+    def _on_track_freeze_stale(self, track_index: int):
+        """Offer to re-render a frozen track after its notes were edited.
+        Emitted from inside the piano roll's mouse-release handlers, so the
+        offer goes to the status bar instead of a modal dialog"""
+        track_manager = get_track_manager()
+        if not track_manager:
+            return
+        
+        self.status_bar.show_action(
+            f"'{track_manager.get_track_name(track_index)}' was edited after it was frozen; "
+            "it plays live until re-rendered",
+            "Re-render", lambda: self._rerender_stale_track(track_index))
+    
+    def _rerender_stale_track(self, track_index: int):
+        """Re-render a frozen track if it is still stale"""
+        track_manager = get_track_manager()
+        if track_manager and track_manager.is_freeze_stale(track_index):
+            track_manager.rerender_frozen_track(track_index)
+    
     def closeEvent(self, event):
         """Handle window close event"""
+        # Stop background file loading
+        self._abandon_progressive_load()
+        
+        # Stop background autosave
+        cleanup_autosave_service()
+        cleanup_import_cache()
+        
         # Clean up playback engine
         cleanup_playback_engine()
         self.logger.info("Playback engine cleaned up")
@@ -760,6 +1165,15 @@ class DominoPyMainWindow(QMainWindow):
         else:
             self.logger.info("Test audio: Audio manager not available")
     
+    def _show_playback_stats(self):
+        """Show the playback jitter/latency debug panel"""
+        from src.ui.playback_stats_dialog import PlaybackStatsDialog
+        if not getattr(self, 'playback_stats_dialog', None):
+            self.playback_stats_dialog = PlaybackStatsDialog(self)
+        self.playback_stats_dialog.show()
+        self.playback_stats_dialog.raise_()
+        self.playback_stats_dialog.refresh_timer.start(500)
+    
     def _open_midi_routing(self):
         """Open MIDI output settings dialog"""
         try:
@@ -974,28 +1388,17 @@ class DominoPyMainWindow(QMainWindow):
             
     def _on_horizontal_scroll(self, value):
         """Handle horizontal scrollbar changes"""
-        # Convert scrollbar value to horizontal offset in ticks
-        self.piano_roll.visible_start_tick = value
-        
-        # Calculate visible end tick based on current window width
+        # Convert scrollbar value to horizontal offset in ticks; the piano roll shifts what it
+        # has drawn and brings the measure bar and overview along
+        self.piano_roll.scroll_to_tick(value)
+    
+    def _on_overview_position_requested(self, tick: int):
+        """Center the piano roll on a position picked in the overview"""
         grid_start_x = self.piano_roll.piano_width if self.piano_roll.show_piano_keyboard else 0
-        visible_width = self.piano_roll.width() - grid_start_x
-        visible_end_tick = self.piano_roll.visible_start_tick + int(visible_width / self.piano_roll.pixels_per_tick)
-        
-        # Check if we need to extend range when scrolling near the end
-        self.piano_roll.extend_range_if_needed(visible_end_tick)
-        
-        # Synchronize measure bar with piano roll scrolling (do this before update)
-        try:
-            self.measure_bar.sync_with_piano_roll(
-                self.piano_roll.visible_start_tick,
-                visible_end_tick,
-                self.piano_roll.pixels_per_tick
-            )
-        except Exception as e:
-            print(f"Warning: Measure bar sync failed: {e}")
-        
-        self.piano_roll.update()
+        visible_ticks = int((self.piano_roll.width() - grid_start_x) / self.piano_roll.pixels_per_tick)
+        start_tick = max(0, tick - visible_ticks // 2)
+        self.piano_roll.extend_range_if_needed(start_tick + visible_ticks)
+        self.h_scrollbar.setValue(start_tick)
             
     def _on_playback_state_changed(self, state: PlaybackState):
         """Handle playback state changes"""
@@ -1076,6 +1479,7 @@ class DominoPyMainWindow(QMainWindow):
             visible_end_tick,
             self.piano_roll.pixels_per_tick
         )
+        self.overview.set_visible_range(self.piano_roll.visible_start_tick, visible_end_tick)
     
     def _connect_ui_signals(self):
         """Connect UI signals after initialization"""
@@ -1161,7 +1565,7 @@ class DominoPyMainWindow(QMainWindow):
         engine = get_playback_engine()
         if engine:
             state = engine.get_state()
-            current_tick = engine.get_current_tick()
+            current_tick = engine.playhead.current_tick()
             tempo_bpm = engine.get_tempo()
             
             self.playback_info_widget.update_playback_info(state, current_tick, tempo_bpm)
@@ -1170,6 +1574,8 @@ class DominoPyMainWindow(QMainWindow):
         """Create a colorful test song to demonstrate track colors"""
         from src.midi_data_model import MidiProject, MidiTrack, MidiNote
         
+        self._abandon_progressive_load()
+        
         # Create new project
         project = MidiProject()
         project.ticks_per_beat = 480  # Standard MIDI resolution
@@ -1216,6 +1622,7 @@ class DominoPyMainWindow(QMainWindow):
         
         # Set project in piano roll
         self.piano_roll.set_midi_project(project)
+        self._attach_autosave(project, "Untitled")
         
         # Update playback engine with new project
         engine = get_playback_engine()
@@ -1,10 +1,12 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QRect
 from PySide6.QtGui import QPainter, QColor, QFont
 from typing import Optional
 
 from src.midi_data_model import MidiProject
 
+MIN_LABEL_SPACING = 40  # Pixels between measure numbers before some are skipped
+
 
 class MeasureBarWidget(QWidget):
     """
@@ -43,11 +45,23 @@ class MeasureBarWidget(QWidget):
     def sync_with_piano_roll(self, visible_start_tick: int, visible_end_tick: int, 
                            grid_width_pixels: float):
         """Synchronize display parameters with the piano roll"""
+        if (visible_start_tick, visible_end_tick, grid_width_pixels) == (
+                self.visible_start_tick, self.visible_end_tick, self.grid_width_pixels):
+            return  # Nothing moved, no repaint
+        # Scrolled at the same zoom: shift the drawn measures like the piano roll does
+        dx = 0
+        if grid_width_pixels == self.grid_width_pixels:
+            dx = (round(self.visible_start_tick * grid_width_pixels)
+                  - round(visible_start_tick * grid_width_pixels))
         self.visible_start_tick = visible_start_tick
         self.visible_end_tick = visible_end_tick
         self.grid_width_pixels = grid_width_pixels
         # grid_start_x is fixed to piano_width for alignment
-        self.update()
+        grid_width = self.width() - self.grid_start_x
+        if 0 < abs(dx) < grid_width:
+            self.scroll(dx, 0, QRect(self.grid_start_x, 0, grid_width, self.height()))
+        else:
+            self.update()
     
     def on_time_signature_changed(self):
         """Handle time signature changes - proper notification method"""
@@ -57,7 +71,7 @@ class MeasureBarWidget(QWidget):
     
     def _tick_to_x(self, tick: int) -> float:
         """Convert MIDI tick to X coordinate (same as piano roll)"""
-        return (tick - self.visible_start_tick) * self.grid_width_pixels
+        return tick * self.grid_width_pixels - round(self.visible_start_tick * self.grid_width_pixels)
     
     def paintEvent(self, event):
         """Draw measure numbers in horizontal bar"""
@@ -86,7 +100,9 @@ class MeasureBarWidget(QWidget):
         else:
             numerator, denominator = 4, 4
         
-        # Draw measure lines and numbers with time signature changes support
+        # Draw measure lines and numbers with time signature changes support; numbers
+        # are cut off at the grid edges, the same whether drawn whole or scrolled in
+        painter.setClipRect(QRect(self.grid_start_x, 0, self.width() - self.grid_start_x, self.height()))
         if self.midi_project and self.midi_project.time_signature_changes:
             self._draw_measures_with_time_signature_changes(painter, ticks_per_beat)
         else:
@@ -106,11 +122,12 @@ class MeasureBarWidget(QWidget):
                 beats_per_measure = numerator * (4 / denominator)
                 ticks_per_measure = int(ticks_per_beat * beats_per_measure)
         
-        # Calculate the range of measures to draw
-        start_measure_tick = (self.visible_start_tick // ticks_per_measure) * ticks_per_measure
+        # Calculate the range of measures to draw (every measure_step-th one when zoomed far out)
+        measure_step = self._measure_step(ticks_per_measure)
+        start_measure_tick = (self.visible_start_tick // measure_step) * measure_step
         end_tick = self.visible_end_tick + ticks_per_measure
         
-        for tick in range(start_measure_tick, end_tick, ticks_per_measure):
+        for tick in range(start_measure_tick, end_tick, measure_step):
             # Calculate the actual measure number (1-based)
             measure_number = (tick // ticks_per_measure) + 1
             
@@ -154,12 +171,19 @@ class MeasureBarWidget(QWidget):
                 measure_number = self._calculate_measure_number_at_tick(section_start_tick, ticks_per_beat)
             
             # Draw measures in this section
-            for tick in range(first_measure_tick, section_end_tick, ticks_per_measure):
+            for tick in range(first_measure_tick, section_end_tick, self._measure_step(ticks_per_measure)):
                 if tick >= self.visible_start_tick - ticks_per_measure and tick <= self.visible_end_tick + ticks_per_measure:
                     # Calculate correct measure number for this tick
                     actual_measure_number = self._calculate_measure_number_at_tick(tick, ticks_per_beat)
                     self._draw_measure_line_and_number(painter, tick, actual_measure_number)
     
+    def _measure_step(self, ticks_per_measure: int) -> int:
+        """Ticks between labelled measures: whole measures, doubled until the numbers fit"""
+        step = ticks_per_measure
+        while step * self.grid_width_pixels < MIN_LABEL_SPACING:
+            step *= 2
+        return step
+    
     def _calculate_measure_number_at_tick(self, target_tick: int, ticks_per_beat: int) -> int:
         """Calculate the measure number at a given tick, considering time signature changes"""
         if not self.midi_project or not self.midi_project.time_signature_changes:
@@ -203,21 +227,18 @@ class MeasureBarWidget(QWidget):
     def _draw_measure_line_and_number(self, painter: QPainter, tick: int, measure_number: int):
         """Draw a single measure line and number"""
         x = self._tick_to_x(tick) + self.grid_start_x
+        text_rect = painter.fontMetrics().boundingRect(str(measure_number))
         
-        # Only draw if the x position is within the visible area
-        if x >= self.grid_start_x and x <= self.width():
+        # Only draw if the line or its number reaches into the visible area
+        if x + 3 + text_rect.width() >= self.grid_start_x and x <= self.width():
             # Draw black vertical measure line
             painter.setPen(QColor("#000000"))  # Black line
             painter.drawLine(int(x), 0, int(x), self.height())
             
             # Draw measure number
             painter.setPen(QColor("#000000"))  # Black text
-            text_rect = painter.fontMetrics().boundingRect(str(measure_number))
             
             # Position text just to the right of the measure line
             text_x = int(x) + 3  # Small offset from the line
             text_y = (self.height() + text_rect.height()) // 2 - 2
-            
-            # Only draw text if it fits within the widget bounds
-            if text_x + text_rect.width() <= self.width():
-                painter.drawText(text_x, text_y, str(measure_number))
\ No newline at end of file
+            painter.drawText(text_x, text_y, str(measure_number))
\ No newline at end of file
@@ -0,0 +1,155 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRectF, Signal
+from PySide6.QtGui import QPainter, QColor, QPen, QPixmap
+from typing import Dict, List, Optional
+
+from src.measure_summary import MeasureSummary
+from src.track_manager import get_track_manager
+
+DENSITY_LEVELS = 4  # Shades between the emptiest and the busiest measure
+
+
+class TrackOverviewWidget(QWidget):
+    """
+    Strip above the measure bar showing every track's note density per measure
+    across the whole project, with the piano roll's visible range framed.
+    Clicking or dragging in it jumps the piano roll there.
+    """
+
+    # Signals
+    position_requested = Signal(int)  # Tick to bring into view
+
+    def __init__(self):
+        super().__init__()
+        self.setFixedHeight(36)
+        self.setMinimumWidth(800)
+        self.setCursor(Qt.PointingHandCursor)
+
+        self.summary: Optional[MeasureSummary] = None
+        self.piano_width = 80  # Width of piano keyboard (must match piano roll)
+        self.visible_start_tick = 0
+        self.visible_end_tick = 0
+
+        # Rendered density cells, redrawn only when the summary or the size changes
+        self._strip: Optional[QPixmap] = None
+        self._strip_key = None
+
+    def set_summary(self, summary: MeasureSummary):
+        """Show a measure summary"""
+        self.summary = summary
+        self.update()
+
+    def notes_changed(self, *args):
+        """NoteIndex listener: repaint after the summary changed"""
+        self.update()
+
+    def set_visible_range(self, visible_start_tick: int, visible_end_tick: int):
+        """Frame the piano roll's visible tick range"""
+        if (visible_start_tick, visible_end_tick) == (self.visible_start_tick, self.visible_end_tick):
+            return
+        old_frame = self._frame_rect()
+        self.visible_start_tick = visible_start_tick
+        self.visible_end_tick = visible_end_tick
+        new_frame = self._frame_rect()
+        if old_frame is None or new_frame is None:
+            self.update()
+        else:
+            # Only the old and new frame change while following playback
+            self.update(old_frame.united(new_frame).toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    def _measure_width(self) -> float:
+        return (self.width() - self.piano_width) / max(1, self.summary.measure_count)
+
+    def _track_colors(self, track_count: int) -> List[str]:
+        track_manager = get_track_manager()
+        if not track_manager:
+            return ["#61afef"] * track_count  # Default blue color
+        return [track_manager.get_track_color(index) for index in range(track_count)]
+
+    def paintEvent(self, event):
+        """Draw the density cells and the visible range frame"""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#F5F5F5"))
+        painter.setPen(QColor("#CCCCCC"))
+        painter.drawLine(self.piano_width - 1, 0, self.piano_width - 1, self.height())
+        painter.drawLine(0, self.height() - 1, self.width(), self.height() - 1)
+
+        if not self.summary:
+            return
+        self.summary.sync()
+        if not self.summary.measure_count:
+            return
+
+        colors = self._track_colors(len(self.summary.counts))
+        key = (self.summary.version, self.summary.measure_count, self.width(), self.height(),
+               self.devicePixelRatioF(), tuple(colors))
+        if self._strip is None or key != self._strip_key:
+            self._strip = self._render_strip(colors)
+            self._strip_key = key
+        painter.drawPixmap(self.piano_width, 0, self._strip)
+
+        # Visible range of the piano roll
+        frame = self._frame_rect()
+        if frame is not None:
+            painter.setPen(QPen(QColor("#333333"), 1))
+            painter.setBrush(QColor(0, 0, 0, 24))
+            painter.drawRect(frame)
+
+    def _frame_rect(self) -> Optional[QRectF]:
+        """Frame around the piano roll's visible range, if there is one to show"""
+        if not self.summary or not self.summary.measure_count or self.visible_end_tick <= self.visible_start_tick:
+            return None
+        measure_width = self._measure_width()
+        left = self.piano_width + self.summary.position_of(self.visible_start_tick) * measure_width
+        right = self.piano_width + self.summary.position_of(self.visible_end_tick) * measure_width
+        return QRectF(left, 0.5, max(2.0, right - left), self.height() - 2)
+
+    def _render_strip(self, colors: List[str]) -> QPixmap:
+        """One row per track, one cell per measure, shaded by its share of the busiest measure"""
+        width = self.width() - self.piano_width
+        height = self.height() - 1
+        device_pixel_ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, int(width * device_pixel_ratio)), max(1, int(height * device_pixel_ratio)))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        counts = self.summary.counts
+        busiest = max((max(row) for row in counts if len(row)), default=0)
+        if not counts or busiest <= 0:
+            return pixmap
+
+        measure_width = self._measure_width()
+        row_height = height / len(counts)
+        cells: Dict[tuple, List[QRectF]] = {}  # (color, level) -> cells
+        for position, row in enumerate(counts):
+            top = position * row_height
+            color = colors[position]
+            for measure, count in enumerate(row):
+                if count:
+                    level = min(DENSITY_LEVELS, -(-count * DENSITY_LEVELS // busiest))  # Round up: 1 note shows
+                    cells.setdefault((color, level), []).append(
+                        QRectF(measure * measure_width, top, max(1.0, measure_width), max(1.0, row_height)))
+
+        painter = QPainter(pixmap)
+        painter.setPen(Qt.NoPen)
+        for (color, level), rects in cells.items():
+            shade = QColor(color)
+            shade.setAlpha(64 + (191 * level) // DENSITY_LEVELS)
+            painter.setBrush(shade)
+            painter.drawRects(rects)
+        painter.end()
+        return pixmap
+
+    def _request_position(self, x: float):
+        if not self.summary or not self.summary.measure_count or x < self.piano_width:
+            return
+        measure = (x - self.piano_width) / self._measure_width()
+        self.position_requested.emit(self.summary.tick_at(measure))
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._request_position(event.position().x())
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton:
+            self._request_position(event.position().x())
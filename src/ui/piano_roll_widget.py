@@ -1,11 +1,16 @@
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
-from PySide6.QtCore import Qt, QRectF, QPointF, Signal, QTimer
-from PySide6.QtGui import QPainter, QColor, QFont, QPen, QBrush, QPolygonF
-from typing import List, Dict
+from PySide6.QtCore import Qt, QPoint, QRect, QRectF, QLineF, QPointF, Signal, QTimer
+from PySide6.QtGui import QPainter, QColor, QFont, QPen, QBrush, QPolygonF, QPixmap
+from typing import List, Dict, Set
 
 from src.midi_data_model import MidiProject, MidiNote
+from src.note_index import NoteIndex
+from src.note_tile_cache import NoteTileCache, TileRects, TILE_SIZE, TOP_PITCH, note_rect, extent_rect
+from src.note_density import NoteDensity, NUMPY_AVAILABLE
+from src.measure_summary import MeasureSummary
 from src.playback_engine import PlaybackState
+from src.settings import FollowMode
 from src.command_system import (
     CommandHistory, AddNoteCommand, DeleteNoteCommand, MoveNoteCommand,
     ResizeNoteCommand, DeleteMultipleNotesCommand, PasteNotesCommand, CutNotesCommand,
@@ -20,11 +25,30 @@ from src.audio_source_manager import AudioSourceType
 from src.logger import get_logger, print_debug
 import copy
 
+# Half-width of the strip repainted around the (3px) playhead line
+PLAYHEAD_MARGIN = 3
+# Above this many selected notes, the selection overlay finds its notes through the index
+SELECTION_SCAN_LIMIT = 2048
+# Horizontal zoom range; below LOD_PIXELS_PER_TICK notes are drawn as a density image
+MIN_PIXELS_PER_TICK = 0.001
+MAX_PIXELS_PER_TICK = 0.25
+LOD_PIXELS_PER_TICK = 0.02
+# Grid lines closer than this (in pixels) are left out
+MIN_GRID_LINE_SPACING = 4
+# Follow playback: a page turns when the playhead is this close (share of the grid width) to the
+# right edge and leaves it this far from the left; smooth follow holds it at FOLLOW_ANCHOR
+FOLLOW_PAGE_MARGIN = 0.05
+FOLLOW_ANCHOR = 0.5
+# Share of the view rendered into the drag overlay beyond each edge, so small drags reuse it
+DRAG_OVERLAY_MARGIN = 0.25
+
 class PianoRollWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
         self.setMinimumSize(600, 400)
+        # paintEvent covers every pixel (background pixmap), so partial repaints skip the erase
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         self.midi_project: MidiProject = None
 
         # Scaling factors (pixels per tick, pixels per pitch) - now configurable
@@ -44,17 +68,27 @@ class PianoRollWidget(QWidget):
         # Playhead settings
         self.playhead_position = 0  # Current playhead position in ticks
         self.is_playing = False
+        self.follow_mode = settings.display.follow_mode  # FollowMode value
         self.dragging_playhead = False
         self.playhead_drag_start_x = 0
         
         # Vertical scroll settings
         self.vertical_offset = 0  # Vertical scroll offset in pixels
+        
+        # Cached static background (see _get_background_pixmap)
+        self._background_pixmap: QPixmap = None
+        self._background_key = None
+        self._background_origin = 0  # Content x at the grid's left edge when it was drawn
+
+        # Ready-made brushes and pens by color (see _brush/_pen)
+        self._brush_cache: Dict[str, QBrush] = {}
+        self._pen_cache: Dict[tuple, QPen] = {}
 
         # Visible range (in ticks)
         self.visible_start_tick = 0
         self.visible_end_tick = 0 # Will be calculated dynamically
 
-        self.selected_notes: List[MidiNote] = []
+        self.selected_notes: Set[MidiNote] = set()  # Identity set (MidiNote has no __eq__)
         self.dragging_note: MidiNote = None
         self.drag_start_pos = None # QPointF
         self.drag_start_note_pos = None # (start_tick, pitch)
@@ -72,6 +106,17 @@ class PianoRollWidget(QWidget):
         # Multi-note resize - always resize all selected notes proportionally
         self.primary_resize_note: MidiNote = None  # The note being directly dragged
 
+        # Multi-note moves and resizes are previewed over the notes and applied as one command
+        # on release, so a mouse move costs the same however many notes are selected
+        self.drag_delta = (0, 0)           # (ticks, semitones) the selection has been dragged
+        self.resize_scale = 1.0            # Duration factor of the proportional resize
+        self._edit_bounds = QRectF()       # Content-pixel bounds of the selection when the edit began
+        self._drag_limits = (0, 0, 127)    # Earliest start, lowest and highest pitch of the selection
+        self._resize_max_duration = 0
+        self._drag_overlay: QPixmap = None # Selected notes at their original place (see _draw_drag_preview)
+        self._drag_overlay_rect = QRect()  # Content-pixel area the overlay covers
+        self._drag_overlay_key = None
+
         # Quantization unit (e.g., 16th note by default)
         self.quantize_grid_ticks = 480 // 4 # Default to 16th note (480 ticks/beat / 4 = 120 ticks)
         
@@ -85,6 +130,23 @@ class PianoRollWidget(QWidget):
         
         # Command history for undo/redo
         self.command_history = CommandHistory()
+
+        # Spatial index of the notes, kept current by the commands that edit them
+        self.note_index = NoteIndex()
+        self.command_history.add_listener(self.note_index.apply_command)
+
+        # Note layer tiles, rasterized in the background; edits drop the tiles they touch
+        self.tile_cache = NoteTileCache(self._collect_tile_rects, self)
+        self.note_index.add_listener(self.tile_cache.note_extent_changed)
+        self.tile_cache.tile_ready.connect(self.update)
+
+        # Far zoom levels: per-pixel-column occupancy instead of note rectangles
+        self.note_density = NoteDensity()
+        self.note_index.add_listener(self.note_density.note_extent_changed)
+
+        # Notes per measure and track, for the overview strip
+        self.measure_summary = MeasureSummary(self.note_index)
+        self.note_index.add_listener(self.measure_summary.note_extent_changed)
         
         # Edit mode manager
         self.edit_mode_manager = EditModeManager()
@@ -185,7 +247,10 @@ class PianoRollWidget(QWidget):
 
     def set_midi_project(self, project: MidiProject):
         self.midi_project = project
-        self.selected_notes = [] # Clear selection on new project
+        self.note_density.set_project(project)
+        self.measure_summary.set_project(project)
+        self.note_index.set_project(project)
+        self.selected_notes = set() # Clear selection on new project
         self.dragging_note = None
         self.resizing_note = None
         self.resizing_left_edge = False # Clear flag
@@ -243,8 +308,6 @@ class PianoRollWidget(QWidget):
             
             # Force measure bar resync after range extension
             self._sync_measure_bar()
-            
-            self.update()
     
     def _sync_measure_bar(self):
         """Synchronize measure bar with current piano roll state"""
@@ -265,6 +328,8 @@ class PianoRollWidget(QWidget):
                 current_visible_end_tick,
                 self.pixels_per_tick
             )
+            if hasattr(main_window, 'overview'):
+                main_window.overview.set_visible_range(self.visible_start_tick, current_visible_end_tick)
 
     def update_display_settings(self):
         """Update display settings and refresh"""
@@ -277,9 +342,26 @@ class PianoRollWidget(QWidget):
         
         # Refresh display
         self.update()
+
+    def _brush(self, color: str) -> QBrush:
+        """Cached brush for a color name"""
+        brush = self._brush_cache.get(color)
+        if brush is None:
+            brush = self._brush_cache[color] = QBrush(QColor(color))
+        return brush
+
+    def _pen(self, color: str, width: int = 1) -> QPen:
+        """Cached solid pen for a color name"""
+        key = (color, width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = self._pen_cache[key] = QPen(QColor(color), width)
+        return pen
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Everything drawn here is axis-aligned; antialiasing would only blur edges and cost time
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
         width = self.width()
         height = self.height()
@@ -297,12 +379,258 @@ class PianoRollWidget(QWidget):
         grid_start_x = self.piano_width if self.show_piano_keyboard else 0
         grid_width = width - grid_start_x
 
+        # Piano keyboard, pitch rows and grid lines come from a cached pixmap
+        painter.drawPixmap(0, 0, self._get_background_pixmap(width, height, grid_start_x))
+
+        # Draw MIDI notes: per-track layers come from cached tiles (missing ones fill in as
+        # they are rasterized), other tracks dimmed under the active one, selected notes on top
+        exposed = event.rect()
+        if self.midi_project:
+            # Dragged notes and out-of-band changes drop their tiles before compositing
+            self._refresh_edited_notes()
+            self.note_index.sync()
+
+            view_x, view_y = self._content_origin(grid_start_x)
+            notes_area = exposed.intersected(QRect(grid_start_x, 0, grid_width, height))
+            painter.save()
+            painter.setClipRect(notes_area)
+            if self.pixels_per_tick < LOD_PIXELS_PER_TICK and NUMPY_AVAILABLE:
+                self.note_density.draw(painter, self.pixels_per_tick, self.pixels_per_pitch,
+                                       view_x, view_y, notes_area, self.theme_colors.note_default)
+            else:
+                palette, active_track_index = self._track_palette()
+                self.tile_cache.draw(painter, self._tile_zoom(), palette, active_track_index,
+                                     view_x, view_y, notes_area)
+            if self.dragging_multiple_notes and self.multi_drag_start_positions:
+                self._draw_drag_preview(painter, view_x, view_y)
+            elif self.resizing_multiple_notes and self.multi_resize_start_data:
+                self._draw_resize_preview(painter, notes_area, view_x, view_y)
+            else:
+                self._draw_selected_notes(painter, notes_area, view_x, view_y)
+            painter.restore()
+
+        # Draw grid cells (selected cells and paste target)
+        self.grid_manager.draw_grid_cells(painter, self.pixels_per_tick, 
+                                        self.pixels_per_pitch, height, 
+                                        self.visible_start_tick)
+        
+        # Draw selection rectangle if in selection mode
+        selection_rect = self.edit_mode_manager.get_selection_rectangle()
+        if selection_rect:
+            selection_rect.draw(painter)
+        
+        # Draw playhead
+        self._draw_playhead(painter, height, grid_start_x)
+        
+        # Draw parameter automation layer (if enabled)
+        if self.parameter_edit_mode != "none":
+            self._draw_parameter_layer(painter, width, height, grid_start_x)
+        
+        # Draw mode indicator
+        self._draw_mode_indicator(painter, width, height)
+
+        painter.end()
+
+    def _content_origin(self, grid_start_x: int) -> tuple:
+        """Content-pixel point (see note_tile_cache) shown at widget (0, 0)"""
+        view_x = round(self.visible_start_tick * self.pixels_per_tick) - grid_start_x
+        view_y = round((TOP_PITCH + 1) * self.pixels_per_pitch - self.height() - self.vertical_offset)
+        return view_x, view_y
+
+    def _tile_zoom(self) -> tuple:
+        """Scale of the note tiles"""
+        return (self.pixels_per_tick, self.pixels_per_pitch, self.devicePixelRatioF())
+
+    def _track_palette(self) -> tuple:
+        """(color per track, active track index) for the note layers"""
+        track_manager = get_track_manager()
+        track_count = len(self.midi_project.tracks) if self.midi_project else 0
+        if not track_manager:
+            return ("#61afef",) * track_count, -1  # Default blue color
+        # Use track color or theme default
+        palette = tuple(track_manager.get_track_color(index) or self.theme_colors.note_default
+                        for index in range(track_count))
+        return palette, track_manager.get_active_track_index()
+
+    def _collect_tile_rects(self, zoom: tuple, track_index: int, color: str, tile_x: int, tile_y: int) -> TileRects:
+        """One track's note rectangles in one tile, in tile pixels (GUI thread snapshot)"""
+        pixels_per_tick, pixels_per_pitch, _ = zoom
+        left, top = tile_x * TILE_SIZE, tile_y * TILE_SIZE
+        start_tick = int(left / pixels_per_tick) - 1
+        end_tick = int((left + TILE_SIZE) / pixels_per_tick) + 2
+        high_pitch = TOP_PITCH - int(top / pixels_per_pitch) + 1
+        low_pitch = TOP_PITCH - int((top + TILE_SIZE) / pixels_per_pitch) - 1
+
+        rects = []
+        for _, note in self.note_index.query(start_tick, end_tick, max(0, low_pitch), high_pitch, track_index):
+            x, y, note_width, note_height = note_rect(note, pixels_per_tick, pixels_per_pitch)
+            if x - left < TILE_SIZE and x + note_width > left and y - top < TILE_SIZE and y + note_height > top:
+                rects.append((x - left, y - top, note_width, note_height))
+        return [(color, rects)] if rects else []
+
+    def _note_candidates(self, notes, area: QRectF, start_reach: int = 0, end_reach: int = 0):
+        """Notes of a selection that may lie in a content-pixel area: the selection itself
+        when small, otherwise whatever the index holds there (reaches widen the tick range)"""
+        if len(notes) <= SELECTION_SCAN_LIMIT:
+            return notes
+        start_tick = int(area.left() / self.pixels_per_tick) - 1 - start_reach
+        end_tick = int(area.right() / self.pixels_per_tick) + 2 + end_reach
+        high_pitch = TOP_PITCH - int(area.top() / self.pixels_per_pitch) + 1
+        low_pitch = TOP_PITCH - int(area.bottom() / self.pixels_per_pitch) - 1
+        return [note for _, note in self.note_index.query(start_tick, end_tick, max(0, low_pitch), high_pitch)
+                if note in notes]
+
+    def _draw_selected_notes(self, painter: QPainter, area: QRect, view_x: int, view_y: int):
+        """Draw the selected notes inside area in the theme selected color, over the tiles"""
+        if not self.selected_notes:
+            return
+        area_rect = QRectF(area)
+        rects = []
+        for note in self._note_candidates(self.selected_notes, area_rect.translated(view_x, view_y)):
+            x, y, note_width, note_height = note_rect(note, self.pixels_per_tick, self.pixels_per_pitch)
+            rect = QRectF(x - view_x, y - view_y, note_width, note_height)
+            if rect.intersects(area_rect):
+                rects.append(rect)
+        if rects:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._brush(self.theme_colors.note_selected))
+            painter.drawRects(rects)
+
+    def _draw_drag_preview(self, painter: QPainter, view_x: int, view_y: int):
+        """Dragged selection: a cached image of the selected notes, shifted by the drag delta"""
+        grid_start_x = self.piano_width if self.show_piano_keyboard else 0
+        grid = QRect(grid_start_x, 0, self.width() - grid_start_x, self.height())
+        shift = self._drag_shift()
+        # Content area, at the notes' original place, that the shift brings onto the grid
+        needed = grid.translated(view_x - shift.x(), view_y - shift.y())
+        key = self._tile_zoom() + (self.theme_colors.note_selected,)
+        if self._drag_overlay is None or key != self._drag_overlay_key or \
+                not self._drag_overlay_rect.contains(needed):
+            margin_x = int(grid.width() * DRAG_OVERLAY_MARGIN)
+            margin_y = int(grid.height() * DRAG_OVERLAY_MARGIN)
+            self._render_drag_overlay(needed.adjusted(-margin_x, -margin_y, margin_x, margin_y), key)
+        painter.drawPixmap(self._drag_overlay_rect.topLeft() + shift - QPoint(view_x, view_y), self._drag_overlay)
+
+    def _render_drag_overlay(self, area: QRect, key: tuple):
+        """Rasterize the selected notes inside a content-pixel area at their original place"""
+        device_pixel_ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, int(area.width() * device_pixel_ratio)), max(1, int(area.height() * device_pixel_ratio)))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        area_rect = QRectF(area)
+        rects = []
+        for note in self._note_candidates(self.multi_drag_start_positions, area_rect):
+            x, y, note_width, note_height = note_rect(note, self.pixels_per_tick, self.pixels_per_pitch)
+            rect = QRectF(x, y, note_width, note_height)
+            if rect.intersects(area_rect):
+                rects.append(rect.translated(-area.left(), -area.top()))
+        if rects:
+            painter = QPainter(pixmap)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._brush(self.theme_colors.note_selected))
+            painter.drawRects(rects)
+            painter.end()
+
+        self._drag_overlay = pixmap
+        self._drag_overlay_rect = area
+        self._drag_overlay_key = key
+
+    def _draw_resize_preview(self, painter: QPainter, area: QRect, view_x: int, view_y: int):
+        """Resized selection: the visible selected notes at their previewed extents"""
+        area_rect = QRectF(area)
+        # A note starting (or ending) up to a scaled duration off screen can reach into it
+        reach = int(self._resize_max_duration * max(1.0, self.resize_scale)) + 1
+        if self.resizing_left_edge:
+            candidates = self._note_candidates(self.multi_resize_start_data, area_rect.translated(view_x, view_y),
+                                               end_reach=reach)
+        else:
+            candidates = self._note_candidates(self.multi_resize_start_data, area_rect.translated(view_x, view_y),
+                                               start_reach=reach)
+        rects = []
+        for note in candidates:
+            start_tick, end_tick = self._resized_extent(*self.multi_resize_start_data[note])
+            x, y, note_width, note_height = extent_rect(start_tick, end_tick, note.pitch,
+                                                        self.pixels_per_tick, self.pixels_per_pitch)
+            rect = QRectF(x - view_x, y - view_y, note_width, note_height)
+            if rect.intersects(area_rect):
+                rects.append(rect)
+        if rects:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._brush(self.theme_colors.note_selected))
+            painter.drawRects(rects)
+
+    def _background_cache_key(self, width: int, height: int, grid_start_x: int) -> tuple:
+        """Everything the static background depends on"""
+        if self.midi_project:
+            ticks_per_beat = self.midi_project.ticks_per_beat
+            time_signatures = tuple((change.tick, change.numerator, change.denominator)
+                                    for change in self.midi_project.time_signature_changes)
+            if time_signatures:
+                # Beat lines follow the meter at the left edge
+                time_signatures += (self.midi_project.get_time_signature_at_tick(self.visible_start_tick),)
+        else:
+            ticks_per_beat, time_signatures = 480, ()
+        # The scroll position is not part of it: horizontal scrolling shifts the cached pixmap
+        return (width, height, grid_start_x, self.devicePixelRatioF(),
+                self.vertical_offset, self.pixels_per_tick, self.pixels_per_pitch, self.ticks_per_subdivision,
+                ticks_per_beat, time_signatures, self.theme_colors)
+
+    def _get_background_pixmap(self, width: int, height: int, grid_start_x: int) -> QPixmap:
+        """Cached background; horizontal scrolling shifts it, zooming, resizing or a theme/meter change re-renders it"""
+        key = self._background_cache_key(width, height, grid_start_x)
+        origin = round(self.visible_start_tick * self.pixels_per_tick)
+        if self._background_pixmap is None or key != self._background_key or \
+                not self._scroll_background(self._background_origin - origin, width, height, grid_start_x):
+            device_pixel_ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(int(width * device_pixel_ratio), int(height * device_pixel_ratio))
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            pixmap.fill(QColor(self.theme_colors.background))
+
+            painter = QPainter(pixmap)
+            self._draw_background(painter, width, height, grid_start_x)
+            painter.end()
+
+            self._background_pixmap = pixmap
+            self._background_key = key
+        self._background_origin = origin
+        return self._background_pixmap
+
+    def _scroll_background(self, dx: int, width: int, height: int, grid_start_x: int) -> bool:
+        """Shift the grid part of the cached background by dx pixels and draw the strip it exposes"""
+        if not dx:
+            return True
+        grid_width = width - grid_start_x
+        device_pixel_ratio = self.devicePixelRatioF()
+        device_dx = dx * device_pixel_ratio
+        if abs(dx) >= grid_width or device_dx != int(device_dx):
+            return False  # Nothing left to reuse, or no whole-pixel shift at this scale
+        self._background_pixmap.scroll(int(device_dx), 0, QRect(int(grid_start_x * device_pixel_ratio), 0,
+                                                                int(grid_width * device_pixel_ratio),
+                                                                int(height * device_pixel_ratio)))
+        if dx > 0:
+            strip = QRect(grid_start_x, 0, dx, height)
+        else:
+            strip = QRect(width + dx, 0, -dx, height)
+
+        painter = QPainter(self._background_pixmap)
+        painter.setClipRect(strip)
+        painter.fillRect(strip, QColor(self.theme_colors.background))
+        self._draw_background(painter, width, height, grid_start_x)
+        painter.end()
+        return True
+
+    def _draw_background(self, painter: QPainter, width: int, height: int, grid_start_x: int):
+        """Draw the piano keyboard, pitch rows and beat/measure/subdivision lines"""
+        grid_width = width - grid_start_x
+
         # Draw piano keyboard first (if enabled)
         if self.show_piano_keyboard:
             self._draw_piano_keyboard(painter, height)
 
         # Draw grid with alternating horizontal backgrounds and lines
         # First, draw alternating background colors for better pitch visibility
+        black_key_rows, white_key_rows = [], []
         for pitch in range(0, 120): # C-1 (0) to B9 (119)
             y = self._pitch_to_y(pitch)
             note_height = self.pixels_per_pitch
@@ -311,27 +639,30 @@ class PianoRollWidget(QWidget):
             note_in_octave = pitch % 12
             is_black_key = note_in_octave in [1, 3, 6, 8, 10]  # C#, D#, F#, G#, A#
             
-            # Draw background rectangle for this pitch
-            if is_black_key:
-                # Darker background for black key pitches
-                painter.setBrush(QColor(self.theme_colors.black_key_background))
-            else:
-                # Lighter background for white key pitches
-                painter.setBrush(QColor(self.theme_colors.white_key_background))
-            
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(grid_start_x, int(y), grid_width, int(note_height))
+            # Darker background for black key pitches, lighter for white key pitches
+            rows = black_key_rows if is_black_key else white_key_rows
+            rows.append(QRectF(grid_start_x, int(y), grid_width, int(note_height)))
+        
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._brush(self.theme_colors.black_key_background))
+        painter.drawRects(black_key_rows)
+        painter.setBrush(self._brush(self.theme_colors.white_key_background))
+        painter.drawRects(white_key_rows)
         
         # Then draw horizontal lines for pitches
+        c_lines, pitch_lines = [], []
         for pitch in range(0, 120): # C-1 (0) to B9 (119)
             y = self._pitch_to_y(pitch)
             if pitch % 12 == 0: # C notes (octaves)
                 # Draw C line at the bottom of the note (not top)
-                painter.setPen(QColor(self.theme_colors.grid_line_c_note))
-                painter.drawLine(grid_start_x, int(y + self.pixels_per_pitch), width, int(y + self.pixels_per_pitch))
+                c_lines.append(QLineF(grid_start_x, int(y + self.pixels_per_pitch), width, int(y + self.pixels_per_pitch)))
             else:
-                painter.setPen(QColor(self.theme_colors.grid_line_normal))
-                painter.drawLine(grid_start_x, int(y), width, int(y))
+                pitch_lines.append(QLineF(grid_start_x, int(y), width, int(y)))
+        
+        painter.setPen(self._pen(self.theme_colors.grid_line_c_note))
+        painter.drawLines(c_lines)
+        painter.setPen(self._pen(self.theme_colors.grid_line_normal))
+        painter.drawLines(pitch_lines)
 
         # Vertical lines for beats and measures
         ticks_per_beat = self.midi_project.ticks_per_beat if self.midi_project else 480
@@ -376,15 +707,20 @@ class PianoRollWidget(QWidget):
         # Use the same range calculation as measure lines
         start_beat_tick = (self.visible_start_tick // ticks_per_subdivision) * ticks_per_subdivision
         
+        beat_lines = []
+        if ticks_per_subdivision * self.pixels_per_tick < MIN_GRID_LINE_SPACING:
+            start_beat_tick = end_tick  # Zoomed too far out to tell beats apart
         for tick in range(start_beat_tick, end_tick, ticks_per_subdivision):
             if tick >= self.visible_start_tick - ticks_per_subdivision and tick % ticks_per_measure != 0:  # Skip measure lines
                 x = self._tick_to_x(tick) + grid_start_x
                 if x >= grid_start_x and x <= self.width():  # Only draw if visible
-                    painter.setPen(QColor(self.theme_colors.grid_line_beat))
-                    painter.drawLine(int(x), 0, int(x), height)
+                    beat_lines.append(QLineF(int(x), 0, int(x), height))
+        painter.setPen(self._pen(self.theme_colors.grid_line_beat))
+        painter.drawLines(beat_lines)
 
         # Draw subdivision lines (finest grid lines within beats)
-        if hasattr(self, 'ticks_per_subdivision') and self.ticks_per_subdivision < ticks_per_beat:
+        if hasattr(self, 'ticks_per_subdivision') and self.ticks_per_subdivision < ticks_per_beat and \
+                self.ticks_per_subdivision * self.pixels_per_tick >= MIN_GRID_LINE_SPACING:
             # Set up custom dashed pen for subdivision lines
             subdivision_pen = QPen(QColor(self.theme_colors.grid_line_subdivision))
             subdivision_pen.setStyle(Qt.CustomDashLine)  # Use custom dash pattern
@@ -394,6 +730,7 @@ class PianoRollWidget(QWidget):
             # Use the same range calculation as other grid lines
             start_subdivision_tick = (self.visible_start_tick // self.ticks_per_subdivision) * self.ticks_per_subdivision
             
+            subdivision_lines = []
             for tick in range(start_subdivision_tick, end_tick, self.ticks_per_subdivision):
                 if tick >= self.visible_start_tick - self.ticks_per_subdivision:
                     # Skip if this tick coincides with measure or beat lines
@@ -402,64 +739,15 @@ class PianoRollWidget(QWidget):
                     
                     x = self._tick_to_x(tick) + grid_start_x
                     if x >= grid_start_x and x <= self.width():  # Only draw if visible
-                        painter.setPen(subdivision_pen)  # Dashed pen for subdivisions
-                        painter.drawLine(int(x), 0, int(x), height)
-
-        # Draw MIDI notes
-        if self.midi_project:
-            track_manager = get_track_manager()
-            
-            for track_index, track in enumerate(self.midi_project.tracks):
-                # Get track color from TrackManager
-                track_color = "#61afef"  # Default blue color
-                if track_manager:
-                    track_color = track_manager.get_track_color(track_index)
-                
-                for note in track.notes:
-                    x = self._tick_to_x(note.start_tick) + grid_start_x
-                    y = self._pitch_to_y(note.pitch)
-                    note_width = note.duration * self.pixels_per_tick
-                    note_height = self.pixels_per_pitch
-
-                    # Only draw if visible
-                    if x < width and x + note_width > grid_start_x:
-                        # Draw note rectangle with track color
-                        if note in self.selected_notes:
-                            # For selected notes, use theme selected color
-                            painter.setBrush(QColor(self.theme_colors.note_selected))
-                        else:
-                            # Use track color or theme default for unselected notes
-                            if track_color:
-                                painter.setBrush(QColor(track_color))
-                            else:
-                                painter.setBrush(QColor(self.theme_colors.note_default))
-                        painter.setPen(Qt.NoPen)
-                        painter.drawRect(int(x), int(y), int(note_width), int(note_height))
+                        subdivision_lines.append(QLineF(int(x), 0, int(x), height))
+            painter.setPen(subdivision_pen)  # Dashed pen for subdivisions
+            painter.drawLines(subdivision_lines)
 
-        # Draw grid cells (selected cells and paste target)
-        self.grid_manager.draw_grid_cells(painter, self.pixels_per_tick, 
-                                        self.pixels_per_pitch, height, 
-                                        self.visible_start_tick)
-        
-        # Draw selection rectangle if in selection mode
-        selection_rect = self.edit_mode_manager.get_selection_rectangle()
-        if selection_rect:
-            selection_rect.draw(painter)
-        
-        # Draw playhead
-        self._draw_playhead(painter, height, grid_start_x)
-        
-        # Draw parameter automation layer (if enabled)
-        if self.parameter_edit_mode != "none":
-            self._draw_parameter_layer(painter, width, height, grid_start_x)
-        
-        # Draw mode indicator
-        self._draw_mode_indicator(painter, width, height)
-
-        painter.end()
 
     def _tick_to_x(self, tick: int) -> float:
-        x_coord = (tick - self.visible_start_tick) * self.pixels_per_tick
+        # Measured from the whole-pixel content origin (as the note tiles are), so scrolling
+        # moves everything by whole pixels and scrolled pixels match freshly drawn ones
+        x_coord = tick * self.pixels_per_tick - round(self.visible_start_tick * self.pixels_per_tick)
         return x_coord
 
     def _pitch_to_y(self, pitch: int) -> float:
@@ -472,8 +760,8 @@ class PianoRollWidget(QWidget):
 
     def _x_to_tick(self, x: int) -> int:
         grid_start_x = self.piano_width if self.show_piano_keyboard else 0
-        adjusted_x = x - grid_start_x
-        tick = int(adjusted_x / self.pixels_per_tick) + self.visible_start_tick
+        adjusted_x = x - grid_start_x + round(self.visible_start_tick * self.pixels_per_tick)
+        tick = int(adjusted_x / self.pixels_per_tick)
         return tick
 
     def _y_to_pitch(self, y: int) -> int:
@@ -484,6 +772,21 @@ class PianoRollWidget(QWidget):
         # Clamp pitch to extended range (C-1 to B9)
         return max(0, min(119, pitch))
 
+    def _notes_in_area(self, left: float, top: float, right: float, bottom: float):
+        """(track index, note) for notes that may overlap a widget-pixel rectangle (callers do exact tests)"""
+        self._refresh_edited_notes()
+        start_tick = self._x_to_tick(left) - 1
+        end_tick = self._x_to_tick(right) + 2
+        low_pitch = self._y_to_pitch(bottom) - 1
+        high_pitch = self._y_to_pitch(top) + 1
+        return self.note_index.query(start_tick, end_tick, low_pitch, high_pitch)
+
+    def _refresh_edited_notes(self):
+        """A single note moves in place while being dragged or resized; keep its index cells current"""
+        edited = [note for note in (self.dragging_note, self.resizing_note) if note is not None]
+        if edited:
+            self.note_index.update_notes(edited)
+
     def mousePressEvent(self, event):
         # Ensure this widget has focus for keyboard events
         if not self.hasFocus():
@@ -560,7 +863,7 @@ class PianoRollWidget(QWidget):
                     # If clicking on a note, play selected notes as chord
                     if clicked_note not in self.selected_notes:
                         # If the note isn't selected, select it first
-                        self.selected_notes = [clicked_note]
+                        self.selected_notes = {clicked_note}
                     self._play_selected_notes_as_chord()
                     self.update()
                     return
@@ -643,7 +946,7 @@ class PianoRollWidget(QWidget):
             # Update playback engine after deletion
             self._update_playback_engine()
             
-            self.selected_notes = [] # Clear selection
+            self.selected_notes = set() # Clear selection
             self.update() # Repaint
     def _delete_selected_notes(self):
         """Legacy method - calls the command version"""
@@ -729,13 +1032,11 @@ class PianoRollWidget(QWidget):
         # Arrow key scrolling
         elif event.key() == Qt.Key_Left:
             scroll_amount = 100  # Scroll by 100 ticks
-            self.visible_start_tick = max(0, self.visible_start_tick - scroll_amount)
-            self.update()
+            self.scroll_to_tick(self.visible_start_tick - scroll_amount)
         
         elif event.key() == Qt.Key_Right:
             scroll_amount = 100  # Scroll by 100 ticks
-            self.visible_start_tick += scroll_amount
-            self.update()
+            self.scroll_to_tick(self.visible_start_tick + scroll_amount)
         
         elif event.key() == Qt.Key_Up:
             # Vertical scroll up (show higher pitches)
@@ -884,39 +1185,66 @@ class PianoRollWidget(QWidget):
                     self.update()
             else:
                 # Horizontal movement is dominant - handle as horizontal scroll
+                # Keep the on-screen scroll speed when zoomed out past the old 0.08 pixels/tick limit
+                tick_scale = max(1.0, 0.08 / self.pixels_per_tick)
                 if scroll_y != 0:
-                    scroll_amount = scroll_y / 120 * 50  # Convert to reasonable scroll amount
+                    scroll_amount = scroll_y / 120 * 50 * tick_scale  # Convert to reasonable scroll amount
                     # Flip direction for intuitive trackpad behavior: right swipe = move right
-                    self.visible_start_tick = max(0, int(self.visible_start_tick + scroll_amount))
-                    
-                    # Check for range extension and sync measure bar
-                    self._handle_scroll_update()
+                    self.scroll_to_tick(self.visible_start_tick + scroll_amount)
                     
                 elif scroll_x != 0:
-                    scroll_amount = scroll_x / 120 * 50
+                    scroll_amount = scroll_x / 120 * 50 * tick_scale
                     # Flip direction for intuitive trackpad behavior
-                    self.visible_start_tick = max(0, int(self.visible_start_tick - scroll_amount))
-                    
-                    # Check for range extension and sync measure bar
-                    self._handle_scroll_update()
+                    self.scroll_to_tick(self.visible_start_tick - scroll_amount)
         
         event.accept()
     
-    def _handle_scroll_update(self):
-        """Handle updates after scrolling (range extension, measure bar sync)"""
-        # Calculate current visible end tick for range extension check
+    def scroll_to_tick(self, start_tick: float):
+        """Scroll horizontally so the grid starts at start_tick, moving the pixels already drawn"""
+        start_tick = max(0, int(start_tick))
+        if start_tick == self.visible_start_tick:
+            return
         grid_start_x = self.piano_width if self.show_piano_keyboard else 0
-        visible_width = self.width() - grid_start_x
-        visible_end_tick = self.visible_start_tick + int(visible_width / self.pixels_per_tick)
-        
-        # Check for range extension
+        grid_width = self.width() - grid_start_x
+        dx = round(self.visible_start_tick * self.pixels_per_tick) - round(start_tick * self.pixels_per_tick)
+        self.visible_start_tick = start_tick
+
+        # Only the strip scrolled into view gets painted; overlays drawn in widget
+        # coordinates would be dragged along, so with those on screen repaint everything
+        if 0 < abs(dx) < grid_width and self.parameter_edit_mode == "none" and \
+                not self.edit_mode_manager.get_selection_rectangle():
+            self.scroll(dx, 0, QRect(grid_start_x, 0, grid_width, self.height()))
+            # The mode indicator stays put: clear its scrolled copy too
+            self.update(self._mode_indicator_rect().adjusted(-abs(dx), 0, abs(dx), 0))
+        elif dx:
+            self.update()
+
+        visible_end_tick = start_tick + int(grid_width / self.pixels_per_tick)
         self.extend_range_if_needed(visible_end_tick)
-        
-        # Sync measure bar
+        if getattr(self, 'h_scrollbar', None) and self.h_scrollbar.value() != start_tick:
+            # Already scrolled: keep the scrollbar's own handler from repainting everything
+            self.h_scrollbar.blockSignals(True)
+            self.h_scrollbar.setValue(start_tick)
+            self.h_scrollbar.blockSignals(False)
         self._sync_measure_bar()
-        
-        # Update display
-        self.update()
+
+    def set_follow_mode(self, follow_mode: str):
+        """Choose how the view follows the playhead during playback (a FollowMode value)"""
+        self.follow_mode = follow_mode
+        self.settings_manager.settings.display.follow_mode = follow_mode
+        self.settings_manager.save_settings()
+
+    def _follow_playhead(self, position: int):
+        """Scroll to keep the playhead in view: a page at a time or continuously"""
+        grid_start_x = self.piano_width if self.show_piano_keyboard else 0
+        grid_width = self.width() - grid_start_x
+        x = self._tick_to_x(position)
+        if self.follow_mode == FollowMode.SMOOTH.value:
+            if x < 0 or x > grid_width * FOLLOW_ANCHOR:
+                self.scroll_to_tick(position - grid_width * FOLLOW_ANCHOR / self.pixels_per_tick)
+        elif self.follow_mode == FollowMode.PAGE.value:
+            if x < 0 or x > grid_width * (1 - FOLLOW_PAGE_MARGIN):
+                self.scroll_to_tick(position - grid_width * FOLLOW_PAGE_MARGIN / self.pixels_per_tick)
     
     def set_grid_subdivision(self, subdivision_type: str, ticks_per_subdivision: int):
         """Set the grid subdivision for beat division lines"""
@@ -978,7 +1306,7 @@ class PianoRollWidget(QWidget):
             # Update playback engine after cutting
             self._update_playback_engine()
             
-            self.selected_notes = [] # Clear selection after cutting
+            self.selected_notes = set() # Clear selection after cutting
             self.update()
     def _paste_notes(self):
         """Paste notes from clipboard"""
@@ -1034,7 +1362,7 @@ class PianoRollWidget(QWidget):
             self._update_playback_engine()
             
             # Select pasted notes
-            self.selected_notes = notes_to_paste
+            self.selected_notes = set(notes_to_paste)
             
             # Clear paste target after use, but keep selected cells
             self.grid_manager.clear_paste_target()
@@ -1050,7 +1378,7 @@ class PianoRollWidget(QWidget):
             # Update playback engine after undo
             self._update_playback_engine()
             
-            self.selected_notes = [] # Clear selection after undo
+            self.selected_notes = set() # Clear selection after undo
             self.update()
         else:
             pass
@@ -1061,7 +1389,7 @@ class PianoRollWidget(QWidget):
             # Update playback engine after redo
             self._update_playback_engine()
             
-            self.selected_notes = [] # Clear selection after redo
+            self.selected_notes = set() # Clear selection after redo
             self.update()
         else:
             pass
@@ -1075,7 +1403,7 @@ class PianoRollWidget(QWidget):
         for track in self.midi_project.tracks:
             all_notes.extend(track.notes)
         
-        self.selected_notes = all_notes
+        self.selected_notes = set(all_notes)
         self.update()
     def _on_mode_changed(self, mode: EditMode):
         """Handle mode change"""
@@ -1086,6 +1414,10 @@ class PianoRollWidget(QWidget):
         paste_target_after = self.grid_manager.get_paste_target_cell()
         self.update()
     
+    def _mode_indicator_rect(self) -> QRect:
+        """Area covered by the mode indicator text"""
+        return QRect(self.width() - 350, 0, 350, 55)
+
     def _draw_mode_indicator(self, painter: QPainter, width: int, height: int):
         """Draw mode indicator in top-right corner"""
         painter.save()
@@ -1121,50 +1453,47 @@ class PianoRollWidget(QWidget):
         # Check if an existing note was clicked or its right edge was clicked for resizing
         clicked_on_note = False
         if self.midi_project:
-            for track in self.midi_project.tracks:
-                for note in track.notes:
-                    grid_start_x = self.piano_width if self.show_piano_keyboard else 0
-                    note_x = self._tick_to_x(note.start_tick) + grid_start_x
-                    note_y = self._pitch_to_y(note.pitch)
-                    note_width = note.duration * self.pixels_per_tick
-                    note_height = self.pixels_per_pitch
-
-                    # Check if click is within note bounds
-                    if note_x <= clicked_x < (note_x + note_width) and \
-                       note_y <= clicked_y < (note_y + note_height):
-                        # Check if click is near the right edge for resizing
-                        resize_threshold = 5 # pixels
-                        if clicked_x >= (note_x + note_width - resize_threshold):
-                            self.resizing_note = note
-                            self.resize_start_tick = note.start_tick
-                            self.dragging_note = None # Not dragging, but resizing
-                            self.selected_notes = [note] # Select note when resizing
-                            clicked_on_note = True
-                            break
-                        # Check if click is near the left edge for resizing
-                        elif clicked_x <= (note_x + resize_threshold):
-                            self.resizing_left_edge = True
-                            self.resizing_note = note
-                            self.resize_start_tick = note.start_tick
-                            self.dragging_note = None
-                            self.selected_notes = [note]
-                            clicked_on_note = True
-                            break
-                        else:
-                            # Select the note for dragging
-                            self.selected_notes = [note] # For now, single selection
-                            self.dragging_note = note
-                            self.drag_start_pos = event.position()
-                            self.drag_start_note_pos = (note.start_tick, note.pitch)
-                            self.drag_original_duration = note.duration # Store original duration
-                            clicked_on_note = True
-                            break # Found a note, stop searching
-                if clicked_on_note:
-                    break
+            for _, note in self._notes_in_area(clicked_x, clicked_y, clicked_x, clicked_y):
+                grid_start_x = self.piano_width if self.show_piano_keyboard else 0
+                note_x = self._tick_to_x(note.start_tick) + grid_start_x
+                note_y = self._pitch_to_y(note.pitch)
+                note_width = note.duration * self.pixels_per_tick
+                note_height = self.pixels_per_pitch
+
+                # Check if click is within note bounds
+                if note_x <= clicked_x < (note_x + note_width) and \
+                   note_y <= clicked_y < (note_y + note_height):
+                    # Check if click is near the right edge for resizing
+                    resize_threshold = 5 # pixels
+                    if clicked_x >= (note_x + note_width - resize_threshold):
+                        self.resizing_note = note
+                        self.resize_start_tick = note.start_tick
+                        self.dragging_note = None # Not dragging, but resizing
+                        self.selected_notes = {note} # Select note when resizing
+                        clicked_on_note = True
+                        break
+                    # Check if click is near the left edge for resizing
+                    elif clicked_x <= (note_x + resize_threshold):
+                        self.resizing_left_edge = True
+                        self.resizing_note = note
+                        self.resize_start_tick = note.start_tick
+                        self.dragging_note = None
+                        self.selected_notes = {note}
+                        clicked_on_note = True
+                        break
+                    else:
+                        # Select the note for dragging
+                        self.selected_notes = {note} # For now, single selection
+                        self.dragging_note = note
+                        self.drag_start_pos = event.position()
+                        self.drag_start_note_pos = (note.start_tick, note.pitch)
+                        self.drag_original_duration = note.duration # Store original duration
+                        clicked_on_note = True
+                        break # Found a note, stop searching
 
         if not clicked_on_note:
             # If no note was clicked, clear selection and create a new note
-            self.selected_notes = []
+            self.selected_notes = set()
 
             # If no project is loaded, create a new one
             if self.midi_project is None:
@@ -1208,7 +1537,7 @@ class PianoRollWidget(QWidget):
                 # Play audio feedback for the new note using track-specific audio
                 self._play_track_preview(new_note.pitch, new_note.velocity)
                 # Select the newly created note
-                self.selected_notes = [new_note]
+                self.selected_notes = {new_note}
                 self.update() # Repaint to show the new note
     
     def _handle_selection_mode_click(self, event, clicked_x, clicked_y):
@@ -1219,23 +1548,7 @@ class PianoRollWidget(QWidget):
         clicked_pitch = self._y_to_pitch(clicked_y)
         
         # Check if clicking on an existing note
-        clicked_note = None
-        if self.midi_project:
-            for track in self.midi_project.tracks:
-                for note in track.notes:
-                    grid_start_x = self.piano_width if self.show_piano_keyboard else 0
-                    note_x = self._tick_to_x(note.start_tick) + grid_start_x
-                    note_y = self._pitch_to_y(note.pitch)
-                    note_width = note.duration * self.pixels_per_tick
-                    note_height = self.pixels_per_pitch
-
-                    # Check if click is within note bounds
-                    if note_x <= clicked_x < (note_x + note_width) and \
-                       note_y <= clicked_y < (note_y + note_height):
-                        clicked_note = note
-                        break
-                if clicked_note:
-                    break
+        clicked_note = self._find_note_at_position(clicked_x, clicked_y)
         
         if clicked_note:
             # Clicked on a note - check for resize/drag operations
@@ -1252,25 +1565,10 @@ class PianoRollWidget(QWidget):
                 # Clicked on already selected note - start operation
                 if is_right_edge or is_left_edge:
                     # Start resize operation (single or multi-note)
-                    self.resizing_multiple_notes = True
-                    self.resizing_left_edge = is_left_edge
-                    self.primary_resize_note = clicked_note
-                    
-                    # Always resize all selected notes proportionally
-                    
-                    # Store original data for all selected notes
-                    self.multi_resize_start_data = {}
-                    for note in self.selected_notes:
-                        self.multi_resize_start_data[note] = (note.start_tick, note.end_tick)
+                    self._start_multi_note_resize(clicked_note, is_left_edge)
                 else:
                     # Start drag operation (single or multi-note)
-                    self.dragging_multiple_notes = True
-                    self.drag_start_pos = QPointF(clicked_x, clicked_y)
-                    
-                    # Store original positions for all selected notes
-                    self.multi_drag_start_positions = {}
-                    for note in self.selected_notes:
-                        self.multi_drag_start_positions[note] = (note.start_tick, note.pitch)
+                    self._start_multi_note_drag(clicked_note, QPointF(clicked_x, clicked_y))
             else:
                 # New note clicked - update selection
                 if not (event.modifiers() & Qt.ControlModifier):
@@ -1278,30 +1576,15 @@ class PianoRollWidget(QWidget):
                     self.selected_notes.clear()
                 
                 # Add clicked note to selection
-                self.selected_notes.append(clicked_note)
+                self.selected_notes.add(clicked_note)
                 
                 # Also start operation immediately if we're on an edge
                 if is_right_edge or is_left_edge:
                     # Start resize operation
-                    self.resizing_multiple_notes = True
-                    self.resizing_left_edge = is_left_edge
-                    self.primary_resize_note = clicked_note
-                    
-                    # Always resize all selected notes proportionally
-                    
-                    # Store original data
-                    self.multi_resize_start_data = {}
-                    for note in self.selected_notes:
-                        self.multi_resize_start_data[note] = (note.start_tick, note.end_tick)
+                    self._start_multi_note_resize(clicked_note, is_left_edge)
                 else:
                     # Start drag operation
-                    self.dragging_multiple_notes = True
-                    self.drag_start_pos = QPointF(clicked_x, clicked_y)
-                    
-                    # Store original positions
-                    self.multi_drag_start_positions = {}
-                    for note in self.selected_notes:
-                        self.multi_drag_start_positions[note] = (note.start_tick, note.pitch)
+                    self._start_multi_note_drag(clicked_note, QPointF(clicked_x, clicked_y))
         else:
             # No note clicked - start rectangle selection or handle grid
             # Check if clicking on a grid cell
@@ -1331,7 +1614,7 @@ class PianoRollWidget(QWidget):
                 # Regular click: Start rectangle selection
                 self.edit_mode_manager.start_selection_rectangle(QPointF(clicked_x, clicked_y))
                 # Clear selections if not holding Ctrl
-                self.selected_notes = []
+                self.selected_notes = set()
                 self.grid_manager.clear_selection()
                 self.grid_manager.clear_paste_target()
     def _handle_note_input_mode_move(self, event):
@@ -1434,6 +1717,55 @@ class PianoRollWidget(QWidget):
                     self.edit_mode_manager.update_selection_rectangle(QPointF(event.position().x(), event.position().y()))
                     self.update()
     
+    def _start_multi_note_drag(self, clicked_note: MidiNote, position: QPointF):
+        """Begin moving the selection; the clicked note is the one snapped to the grid"""
+        self.dragging_multiple_notes = True
+        self.drag_start_pos = position
+        self.drag_start_note_pos = (clicked_note.start_tick, clicked_note.pitch)
+        self.drag_delta = (0, 0)
+
+        # Store original positions for all selected notes
+        self.multi_drag_start_positions = {note: (note.start_tick, note.pitch) for note in self.selected_notes}
+        self._drag_limits = (min(note.start_tick for note in self.selected_notes),
+                             min(note.pitch for note in self.selected_notes),
+                             max(note.pitch for note in self.selected_notes))
+        self._begin_edit_preview()
+
+    def _start_multi_note_resize(self, clicked_note: MidiNote, left_edge: bool):
+        """Begin resizing the selection proportionally to the clicked note"""
+        self.resizing_multiple_notes = True
+        self.resizing_left_edge = left_edge
+        self.primary_resize_note = clicked_note
+        self.resize_scale = 1.0
+
+        # Store original data for all selected notes
+        self.multi_resize_start_data = {note: (note.start_tick, note.end_tick) for note in self.selected_notes}
+        self._resize_max_duration = max(end - start for start, end in self.multi_resize_start_data.values())
+        self._begin_edit_preview()
+
+    def _begin_edit_preview(self):
+        """Remember where the selection is; its notes show in their track colors until release"""
+        left = min(note.start_tick for note in self.selected_notes)
+        right = max(note.end_tick for note in self.selected_notes)
+        low = min(note.pitch for note in self.selected_notes)
+        high = max(note.pitch for note in self.selected_notes)
+        self._edit_bounds = QRectF(left * self.pixels_per_tick, (TOP_PITCH - high) * self.pixels_per_pitch,
+                                   (right - left) * self.pixels_per_tick, (high - low + 1) * self.pixels_per_pitch)
+        self._drag_overlay = None
+        self.update()
+
+    def _drag_shift(self) -> QPoint:
+        """Pixel offset of the dragged selection"""
+        delta_ticks, delta_pitch = self.drag_delta
+        return QPoint(round(delta_ticks * self.pixels_per_tick), round(-delta_pitch * self.pixels_per_pitch))
+
+    def _drag_preview_rect(self) -> QRect:
+        """Widget area the dragged selection covers"""
+        grid_start_x = self.piano_width if self.show_piano_keyboard else 0
+        view_x, view_y = self._content_origin(grid_start_x)
+        shift = self._drag_shift()
+        return self._edit_bounds.translated(shift.x() - view_x, shift.y() - view_y).toAlignedRect().adjusted(-1, -1, 1, 1)
+
     def _handle_multi_note_drag(self, event):
         """Handle dragging multiple selected notes"""
         if not self.drag_start_pos or not self.multi_drag_start_positions:
@@ -1446,32 +1778,22 @@ class PianoRollWidget(QWidget):
         delta_x = current_x - self.drag_start_pos.x()
         delta_y = current_y - self.drag_start_pos.y()
         
-        # Convert pixel deltas to tick/pitch deltas
-        delta_ticks = delta_x / self.pixels_per_tick
-        delta_pitch = -delta_y / self.pixels_per_pitch  # Negative because Y increases downward
+        # Convert pixel deltas to tick/pitch deltas; the clicked note lands on the grid
+        # and the rest of the selection keeps its offsets to it
+        anchor_tick, _ = self.drag_start_note_pos
+        delta_ticks = self._apply_grid_snap(anchor_tick + delta_x / self.pixels_per_tick) - anchor_tick
+        delta_pitch = int(round(-delta_y / self.pixels_per_pitch))  # Negative because Y increases downward
         
-        # Apply movement to all selected notes
-        for note in self.selected_notes:
-            if note in self.multi_drag_start_positions:
-                original_start_tick, original_pitch = self.multi_drag_start_positions[note]
-                
-                # Calculate new position
-                new_start_tick = original_start_tick + delta_ticks
-                new_pitch = original_pitch + delta_pitch
-                
-                # Apply grid snapping to new position
-                new_start_tick = self._apply_grid_snap(new_start_tick)
-                new_pitch = max(0, min(127, int(round(new_pitch))))  # Clamp to MIDI range
-                
-                # Calculate duration to preserve note length
-                duration = note.end_tick - note.start_tick
-                
-                # Apply new position
-                note.start_tick = max(0, int(new_start_tick))  # Ensure non-negative
-                note.end_tick = note.start_tick + duration
-                note.pitch = new_pitch
+        # Keep the whole selection at tick 0 or later and inside the MIDI range
+        earliest_start, lowest_pitch, highest_pitch = self._drag_limits
+        delta_ticks = max(-earliest_start, int(delta_ticks))
+        delta_pitch = max(-lowest_pitch, min(127 - highest_pitch, delta_pitch))
         
-        self.update()
+        if (delta_ticks, delta_pitch) == self.drag_delta:
+            return
+        old_rect = self._drag_preview_rect()
+        self.drag_delta = (delta_ticks, delta_pitch)
+        self.update(old_rect.united(self._drag_preview_rect()))
     
     def _handle_multi_note_resize(self, event):
         """Handle resizing all selected notes proportionally"""
@@ -1486,8 +1808,6 @@ class PianoRollWidget(QWidget):
         
         # Always resize all notes proportionally
         self._handle_proportional_multi_resize(quantized_tick)
-        
-        self.update()
     
     
     def _handle_proportional_multi_resize(self, quantized_tick: int):
@@ -1518,51 +1838,23 @@ class PianoRollWidget(QWidget):
             new_ref_duration = new_ref_end - ref_original_start
             scale_factor = new_ref_duration / ref_original_duration if ref_original_duration > 0 else 1.0
         
-        # Apply scaling to all selected notes
-        for note in self.selected_notes:
-            if note in self.multi_resize_start_data:
-                original_start_tick, original_end_tick = self.multi_resize_start_data[note]
-                original_duration = original_end_tick - original_start_tick
-                
-                if self.resizing_left_edge:
-                    # Scale duration and adjust start position
-                    new_duration = max(self.quantize_grid_ticks, int(original_duration * scale_factor))
-                    note.start_tick = original_end_tick - new_duration
-                    note.end_tick = original_end_tick
-                    
-                    # Ensure non-negative start_tick
-                    if note.start_tick < 0:
-                        note.start_tick = 0
-                        note.end_tick = new_duration
-                else:
-                    # Scale duration and adjust end position
-                    new_duration = max(self.quantize_grid_ticks, int(original_duration * scale_factor))
-                    note.start_tick = original_start_tick
-                    note.end_tick = original_start_tick + new_duration
-        
-        # Apply scaling to all selected notes
-        for note in self.selected_notes:
-            if note in self.multi_resize_start_data:
-                original_start_tick, original_end_tick = self.multi_resize_start_data[note]
-                original_duration = original_end_tick - original_start_tick
-                
-                if self.resizing_left_edge:
-                    # Scale duration and adjust start position
-                    new_duration = max(self.quantize_grid_ticks, int(original_duration * scale_factor))
-                    note.start_tick = original_end_tick - new_duration
-                    note.end_tick = original_end_tick
-                    
-                    # Ensure start tick is not negative
-                    if note.start_tick < 0:
-                        note.start_tick = 0
-                        note.end_tick = new_duration
-                else:
-                    # Scale duration and adjust end position
-                    new_duration = max(self.quantize_grid_ticks, int(original_duration * scale_factor))
-                    note.start_tick = original_start_tick
-                    note.end_tick = original_start_tick + new_duration
-        
-        self.update()
+        # The notes themselves change on release; only the preview follows the mouse
+        if scale_factor != self.resize_scale:
+            self.resize_scale = scale_factor
+            self.update()
+    
+    def _resized_extent(self, original_start_tick: int, original_end_tick: int) -> tuple:
+        """(start_tick, end_tick) of a selected note at the current resize scale"""
+        original_duration = original_end_tick - original_start_tick
+        new_duration = max(self.quantize_grid_ticks, int(original_duration * self.resize_scale))
+        if self.resizing_left_edge:
+            # Scale duration and adjust start position, keeping the start tick non-negative
+            start_tick = original_end_tick - new_duration
+            if start_tick < 0:
+                return 0, new_duration
+            return start_tick, original_end_tick
+        # Scale duration and adjust end position
+        return original_start_tick, original_start_tick + new_duration
     
     def _handle_note_input_mode_release(self, event):
         """Handle mouse release in note input mode"""
@@ -1635,17 +1927,13 @@ class PianoRollWidget(QWidget):
             self.dragging_multiple_notes = False
             return
         
-        # Create list of note movements for command
+        # Create list of note movements for command (the whole selection moves by drag_delta)
         notes_with_deltas = []
-        for note in self.selected_notes:
-            if note in self.multi_drag_start_positions:
-                old_start_tick, old_pitch = self.multi_drag_start_positions[note]
-                new_start_tick = note.start_tick
-                new_pitch = note.pitch
-                
-                # Only add to command if position actually changed
-                if old_start_tick != new_start_tick or old_pitch != new_pitch:
-                    notes_with_deltas.append((note, old_start_tick, old_pitch, new_start_tick, new_pitch))
+        delta_ticks, delta_pitch = self.drag_delta
+        if delta_ticks or delta_pitch:
+            for note, (old_start_tick, old_pitch) in self.multi_drag_start_positions.items():
+                notes_with_deltas.append((note, old_start_tick, old_pitch,
+                                          old_start_tick + delta_ticks, old_pitch + delta_pitch))
         
         # Create and execute command if there were changes
         if notes_with_deltas:
@@ -1659,6 +1947,9 @@ class PianoRollWidget(QWidget):
         self.dragging_multiple_notes = False
         self.multi_drag_start_positions.clear()
         self.drag_start_pos = None
+        self.drag_start_note_pos = None
+        self.drag_delta = (0, 0)
+        self._drag_overlay = None
     
     def _finish_multi_note_resize(self):
         """Finish multi-note resize operation and create command"""
@@ -1668,15 +1959,12 @@ class PianoRollWidget(QWidget):
         
         # Create list of note resizes for command
         notes_with_resize_data = []
-        for note in self.selected_notes:
-            if note in self.multi_resize_start_data:
-                old_start_tick, old_end_tick = self.multi_resize_start_data[note]
-                new_start_tick = note.start_tick
-                new_end_tick = note.end_tick
-                
-                # Only add to command if size actually changed
-                if old_start_tick != new_start_tick or old_end_tick != new_end_tick:
-                    notes_with_resize_data.append((note, old_start_tick, old_end_tick, new_start_tick, new_end_tick))
+        for note, (old_start_tick, old_end_tick) in self.multi_resize_start_data.items():
+            new_start_tick, new_end_tick = self._resized_extent(old_start_tick, old_end_tick)
+            
+            # Only add to command if size actually changed
+            if old_start_tick != new_start_tick or old_end_tick != new_end_tick:
+                notes_with_resize_data.append((note, old_start_tick, old_end_tick, new_start_tick, new_end_tick))
         
         # Create and execute command if there were changes
         if notes_with_resize_data:
@@ -1690,6 +1978,7 @@ class PianoRollWidget(QWidget):
         self.resizing_multiple_notes = False
         self.multi_resize_start_data.clear()
         self.resizing_left_edge = False
+        self.resize_scale = 1.0
     
     def _select_notes_in_rectangle(self, rect, add_to_selection=False):
         """Select notes within the given rectangle"""
@@ -1697,21 +1986,19 @@ class PianoRollWidget(QWidget):
             return
         
         if not add_to_selection:
-            self.selected_notes = []
+            self.selected_notes = set()
         
-        for track in self.midi_project.tracks:
-            for note in track.notes:
-                grid_start_x = self.piano_width if self.show_piano_keyboard else 0
-                note_x = self._tick_to_x(note.start_tick) + grid_start_x
-                note_y = self._pitch_to_y(note.pitch)
-                note_width = note.duration * self.pixels_per_tick
-                note_height = self.pixels_per_pitch
-                
-                # Check if note overlaps with selection rectangle
-                note_rect = QRectF(note_x, note_y, note_width, note_height)
-                if rect.intersects(note_rect):
-                    if note not in self.selected_notes:
-                        self.selected_notes.append(note)
+        for _, note in self._notes_in_area(rect.left(), rect.top(), rect.right(), rect.bottom()):
+            grid_start_x = self.piano_width if self.show_piano_keyboard else 0
+            note_x = self._tick_to_x(note.start_tick) + grid_start_x
+            note_y = self._pitch_to_y(note.pitch)
+            note_width = note.duration * self.pixels_per_tick
+            note_height = self.pixels_per_pitch
+            
+            # Check if note overlaps with selection rectangle
+            note_rect = QRectF(note_x, note_y, note_width, note_height)
+            if rect.intersects(note_rect):
+                self.selected_notes.add(note)
     def get_edit_mode_manager(self):
         """Get the edit mode manager (for external access)"""
         return self.edit_mode_manager
@@ -1736,50 +2023,40 @@ class PianoRollWidget(QWidget):
         # Background for piano area
         painter.fillRect(0, 0, self.piano_width, height, QColor(self.theme_colors.background))
         
-        # Draw white keys first (extended range)
+        # Collect keys (extended range); white keys are drawn first, black keys on top
+        white_keys, black_key_rects, c_labels = [], [], []
         for pitch in range(0, 120):
             note_index = pitch % 12
+            y = self._pitch_to_y(pitch)
+            key_height = self.pixels_per_pitch
             if note_index not in black_keys:  # White key
-                y = self._pitch_to_y(pitch)
-                key_height = self.pixels_per_pitch
-                
-                # White key color
-                key_color = QColor(self.theme_colors.piano_white_key)
-                
-                painter.fillRect(0, int(y), self.piano_width - 1, int(key_height), key_color)
-                
-                # Key border
-                painter.setPen(QColor(self.theme_colors.piano_separator))
-                painter.drawRect(0, int(y), self.piano_width - 1, int(key_height))
+                white_keys.append(QRectF(0, int(y), self.piano_width - 1, int(key_height)))
                 
                 # Note label for C notes
                 if note_index == 0:  # C note
                     octave = (pitch // 12) - 1
-                    font = QFont()
-                    font.setPointSize(8)
-                    painter.setFont(font)
-                    painter.setPen(QColor(self.theme_colors.piano_black_key))
-                    painter.drawText(5, int(y + key_height - 3), f"C{octave}")
-        
-        # Draw black keys on top (extended range)
-        for pitch in range(0, 120):
-            note_index = pitch % 12
-            if note_index in black_keys:  # Black key
-                y = self._pitch_to_y(pitch)
-                key_height = self.pixels_per_pitch
+                    c_labels.append((int(y + key_height - 3), f"C{octave}"))
+            else:  # Black key
                 black_key_width = self.piano_width  # Make black keys full width
-                
-                # Black key color
-                key_color = QColor(self.theme_colors.piano_black_key)
-                
-                painter.fillRect(0, int(y), black_key_width, int(key_height), key_color)
-                
-                # Key border
-                painter.setPen(QColor(self.theme_colors.piano_separator))
-                painter.drawRect(0, int(y), black_key_width, int(key_height))
+                black_key_rects.append(QRectF(0, int(y), black_key_width, int(key_height)))
+        
+        # Keys with their borders
+        painter.setPen(self._pen(self.theme_colors.piano_separator))
+        painter.setBrush(self._brush(self.theme_colors.piano_white_key))
+        painter.drawRects(white_keys)
+        
+        font = QFont()
+        font.setPointSize(8)
+        painter.setFont(font)
+        painter.setPen(self._pen(self.theme_colors.piano_black_key))
+        for label_y, label in c_labels:
+            painter.drawText(5, label_y, label)
+        
+        painter.setPen(self._pen(self.theme_colors.piano_separator))
+        painter.setBrush(self._brush(self.theme_colors.piano_black_key))
+        painter.drawRects(black_key_rects)
         
         # Separator line between piano and grid
-        painter.setPen(QColor(self.theme_colors.piano_separator))
         painter.drawLine(self.piano_width - 1, 0, self.piano_width - 1, height)
         
         painter.restore()
@@ -1797,7 +2074,7 @@ class PianoRollWidget(QWidget):
             return
         
         # Draw simple playhead line
-        painter.setPen(QPen(QColor(self.theme_colors.playhead), 3))
+        painter.setPen(self._pen(self.theme_colors.playhead, 3))
         
         painter.drawLine(int(playhead_x), 0, int(playhead_x), height)
         
@@ -1901,6 +2178,9 @@ class PianoRollWidget(QWidget):
         painter.setPen(QPen(value_color))
         painter.setFont(QFont("Arial", 11, QFont.Bold))  # Larger, bold font
         
+        font_metrics = painter.fontMetrics()
+        text_height = font_metrics.height()
+        backgrounds, labels = [], []
         for note in track.notes:
             note_start_x = self._tick_to_x(note.start_tick) + grid_start_x
             note_end_x = self._tick_to_x(note.end_tick) + grid_start_x
@@ -1922,118 +2202,66 @@ class PianoRollWidget(QWidget):
             else:
                 continue
             
-            # Draw value label with background for better readability
+            # Value label with background for better readability
             value_text = str(current_value)
-            text_width = painter.fontMetrics().horizontalAdvance(value_text)
-            text_height = painter.fontMetrics().height()
+            text_width = font_metrics.horizontalAdvance(value_text)
             
             # Position label to the right of the bar
             label_x = int(note_start_x) + 20
             label_y = int(value_y) + 4
-            
-            # Draw background
-            bg_color = QColor(0, 0, 0, 150)
-            painter.fillRect(label_x - 2, label_y - text_height + 2, text_width + 4, text_height, bg_color)
-            
-            # Draw text
+            backgrounds.append(QRectF(label_x - 2, label_y - text_height + 2, text_width + 4, text_height))
+            labels.append((label_x, label_y, value_text))
+        
+        # Draw all backgrounds, then all text
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(QColor(0, 0, 0, 150)))
+        painter.drawRects(backgrounds)
+        painter.setPen(QPen(value_color))
+        for label_x, label_y, value_text in labels:
             painter.drawText(label_x, label_y, value_text)
     
     def _draw_velocity_automation(self, painter: QPainter, track, color: QColor, grid_start_x: int, height: int):
         """Draw velocity bars for the track (simplified - no automation)"""
-        # Set up semi-transparent overlay
-        overlay_color = QColor(color)
-        overlay_color.setAlpha(120)  # Semi-transparent
-        painter.setBrush(QBrush(overlay_color))
-        
-        line_color = QColor(color)
-        line_color.setAlpha(200)  # More opaque for lines
-        painter.setPen(QPen(line_color, 2))
-        
-        # Draw velocity bars for each note
-        for note in track.notes:
-            note_start_x = self._tick_to_x(note.start_tick) + grid_start_x
-            note_end_x = self._tick_to_x(note.end_tick) + grid_start_x
-            note_width = note_end_x - note_start_x
-            
-            # Skip notes that are outside visible area
-            if note_end_x < grid_start_x or note_start_x > self.width():
-                continue
-            
-            # Draw single unified velocity bar
-            velocity_y = self._velocity_to_y(note.velocity, height)
-            bar_bottom = height * 0.8
-            bar_height = bar_bottom - velocity_y  # Calculate height properly (bottom - top)
-            
-            # Draw velocity bar - make it prominent for easy editing
-            bar_width = max(8, min(16, int(note_width * 0.3)))  # Wider bars for easier clicking
-            
-            # Draw single bar from velocity level down to bottom
-            bar_color = QColor(color)
-            bar_color.setAlpha(180)  # More opaque for better visibility
-            painter.setBrush(QBrush(bar_color))
-            painter.fillRect(int(note_start_x), int(velocity_y), bar_width, int(bar_height), bar_color)
+        self._draw_parameter_bars(painter, track, color, grid_start_x, height,
+                                  lambda note: self._velocity_to_y(note.velocity, height))
     
     def _draw_volume_automation(self, painter: QPainter, track, color: QColor, grid_start_x: int, height: int):
         """Draw volume bars for the track (simplified - same as velocity)"""
-        # Set up semi-transparent overlay
-        overlay_color = QColor(color)
-        overlay_color.setAlpha(180)  # More opaque for better visibility
-        painter.setBrush(QBrush(overlay_color))
-        
-        # Draw volume bars for each note
-        for note in track.notes:
-            note_start_x = self._tick_to_x(note.start_tick) + grid_start_x
-            note_end_x = self._tick_to_x(note.end_tick) + grid_start_x
-            note_width = note_end_x - note_start_x
-            
-            # Skip notes that are outside visible area
-            if note_end_x < grid_start_x or note_start_x > self.width():
-                continue
-            
-            # Draw single unified volume bar
-            volume_y = self._cc_to_y(note.volume, height)
-            bar_bottom = height * 0.8
-            bar_height = bar_bottom - volume_y  # Calculate height properly (bottom - top)
-            
-            # Draw volume bar - make it prominent for easy editing
-            bar_width = max(8, min(16, int(note_width * 0.3)))  # Wider bars for easier clicking
-            
-            # Draw single bar from volume level down to bottom
-            bar_color = QColor(color)
-            bar_color.setAlpha(180)  # More opaque for better visibility
-            painter.setBrush(QBrush(bar_color))
-            painter.fillRect(int(note_start_x), int(volume_y), bar_width, int(bar_height), bar_color)
+        self._draw_parameter_bars(painter, track, color, grid_start_x, height,
+                                  lambda note: self._cc_to_y(note.volume, height))
     
     def _draw_expression_automation(self, painter: QPainter, track, color: QColor, grid_start_x: int, height: int):
         """Draw expression bars for the track (simplified - same as velocity)"""
-        # Set up semi-transparent overlay
-        overlay_color = QColor(color)
-        overlay_color.setAlpha(180)  # More opaque for better visibility
-        painter.setBrush(QBrush(overlay_color))
-        
-        # Draw expression bars for each note
+        self._draw_parameter_bars(painter, track, color, grid_start_x, height,
+                                  lambda note: self._cc_to_y(note.expression, height))
+    
+    def _draw_parameter_bars(self, painter: QPainter, track, color: QColor, grid_start_x: int, height: int, value_to_y):
+        """Draw one bar per visible note, from its parameter value down to the bottom, in a single drawRects call"""
+        bar_bottom = height * 0.8
+        widget_width = self.width()
+        bars = []
         for note in track.notes:
             note_start_x = self._tick_to_x(note.start_tick) + grid_start_x
             note_end_x = self._tick_to_x(note.end_tick) + grid_start_x
             note_width = note_end_x - note_start_x
             
             # Skip notes that are outside visible area
-            if note_end_x < grid_start_x or note_start_x > self.width():
+            if note_end_x < grid_start_x or note_start_x > widget_width:
                 continue
             
-            # Draw single unified expression bar
-            expression_y = self._cc_to_y(note.expression, height)
-            bar_bottom = height * 0.8
-            bar_height = bar_bottom - expression_y  # Calculate height properly (bottom - top)
+            value_y = value_to_y(note)
+            bar_height = bar_bottom - value_y  # Calculate height properly (bottom - top)
             
-            # Draw expression bar - make it prominent for easy editing
+            # Make bars prominent for easy editing
             bar_width = max(8, min(16, int(note_width * 0.3)))  # Wider bars for easier clicking
-            
-            # Draw single bar from expression level down to bottom
-            bar_color = QColor(color)
-            bar_color.setAlpha(180)  # More opaque for better visibility
-            painter.setBrush(QBrush(bar_color))
-            painter.fillRect(int(note_start_x), int(expression_y), bar_width, int(bar_height), bar_color)
+            bars.append(QRectF(int(note_start_x), int(value_y), bar_width, int(bar_height)))
+        
+        # Single bar color, more opaque for better visibility
+        bar_color = QColor(color)
+        bar_color.setAlpha(180)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(bar_color))
+        painter.drawRects(bars)
     
     def _velocity_to_y(self, velocity: int, height: int) -> float:
         """Convert velocity value (0-127) to y coordinate"""
@@ -2924,17 +3152,16 @@ class PianoRollWidget(QWidget):
         
         grid_start_x = self.piano_width if self.show_piano_keyboard else 0
         
-        for track in self.midi_project.tracks:
-            for note in track.notes:
-                note_x = self._tick_to_x(note.start_tick) + grid_start_x
-                note_y = self._pitch_to_y(note.pitch)
-                note_width = note.duration * self.pixels_per_tick
-                note_height = self.pixels_per_pitch
+        for _, note in self._notes_in_area(clicked_x, clicked_y, clicked_x, clicked_y):
+            note_x = self._tick_to_x(note.start_tick) + grid_start_x
+            note_y = self._pitch_to_y(note.pitch)
+            note_width = note.duration * self.pixels_per_tick
+            note_height = self.pixels_per_pitch
 
-                # Check if click is within note bounds
-                if note_x <= clicked_x < (note_x + note_width) and \
-                   note_y <= clicked_y < (note_y + note_height):
-                    return note
+            # Check if click is within note bounds
+            if note_x <= clicked_x < (note_x + note_width) and \
+               note_y <= clicked_y < (note_y + note_height):
+                return note
         
         return None
     
@@ -3279,15 +3506,29 @@ class PianoRollWidget(QWidget):
     
     def set_playhead_position(self, position: int):
         """Set playhead position from external source (like playback engine)"""
+        if position == self.playhead_position:
+            return
+        old_position = self.playhead_position
         self.playhead_position = position
-        # print(f"Piano roll playhead updated to: {position}")  # Debug log
-        self.update()
+        if self.is_playing and not self.dragging_playhead:
+            self._follow_playhead(position)
+        # Repaint only the columns under the old and new playhead
+        self._update_playhead_column(old_position)
+        self._update_playhead_column(position)
+    
+    def _update_playhead_column(self, tick: int):
+        """Schedule a repaint of the strip the playhead covers at a tick"""
+        grid_start_x = self.piano_width if self.show_piano_keyboard else 0
+        x = int(self._tick_to_x(tick) + grid_start_x)
+        if -PLAYHEAD_MARGIN <= x <= self.width() + PLAYHEAD_MARGIN:
+            self.update(QRect(x - PLAYHEAD_MARGIN, 0, 2 * PLAYHEAD_MARGIN + 1, self.height()))
     
     def connect_playback_engine(self, engine):
         """Connect to the playback engine signals"""
         self.playback_engine = engine
         if self.playback_engine:
-            self.playback_engine.position_changed.connect(self.set_playhead_position)
+            # The interpolated playhead moves every display frame without waiting for the engine
+            self.playback_engine.playhead.position_changed.connect(self.set_playhead_position)
             self.playback_engine.state_changed.connect(self.set_playing_state)
             print("PianoRollWidget: Connected to playback engine signals.")
 
@@ -3298,6 +3539,11 @@ class PianoRollWidget(QWidget):
     
     def _update_playback_engine(self):
         """Update playback engine with current project state"""
+        # Edits to frozen tracks make their rendered buffers stale
+        track_manager = get_track_manager()
+        if track_manager:
+            track_manager.refresh_freeze_state()
+        
         if self.playback_engine and self.midi_project:
             # Preserve current playhead position during update
             self.playback_engine.set_project(self.midi_project, preserve_position=True)
@@ -3311,13 +3557,11 @@ class PianoRollWidget(QWidget):
             # Calculate new zoom level
             new_pixels_per_tick = self.pixels_per_tick * zoom_factor
             
-            # Apply bounds based on optimal range (0.08 to 0.25 pixels per tick)
-            min_pixels_per_tick = 0.08
-            max_pixels_per_tick = 0.25
-            new_pixels_per_tick = max(min_pixels_per_tick, min(max_pixels_per_tick, new_pixels_per_tick))
+            # Apply bounds (far zoom levels switch to density rendering)
+            new_pixels_per_tick = max(MIN_PIXELS_PER_TICK, min(MAX_PIXELS_PER_TICK, new_pixels_per_tick))
             
             # Only update if the value actually changed
-            if abs(new_pixels_per_tick - self.pixels_per_tick) > 0.001:
+            if abs(new_pixels_per_tick - self.pixels_per_tick) > self.pixels_per_tick * 0.001:
                 # Update zoom
                 self.pixels_per_tick = new_pixels_per_tick
                 settings.display.grid_width_pixels = new_pixels_per_tick
@@ -3354,6 +3598,13 @@ class PianoRollWidget(QWidget):
         except Exception as e:
             pass  # Silent fail for stability
     
+    def _measure_step(self, ticks_per_measure: int, min_spacing: float) -> int:
+        """Ticks between drawn measure lines: whole measures, doubled until at least min_spacing pixels apart"""
+        step = ticks_per_measure
+        while step * self.pixels_per_tick < min_spacing:
+            step *= 2
+        return step
+
     def _draw_measure_lines_simple(self, painter, ticks_per_beat: int, numerator: int, denominator: int, grid_start_x: int, height: int, end_tick: int):
         """Draw measure lines with a single time signature"""
         # Calculate ticks per measure using centralized method
@@ -3368,15 +3619,18 @@ class PianoRollWidget(QWidget):
                 beats_per_measure = numerator * (4 / denominator)
                 ticks_per_measure = int(ticks_per_beat * beats_per_measure)
         
-        # Calculate the range of measures to draw
-        start_measure_tick = (self.visible_start_tick // ticks_per_measure) * ticks_per_measure
+        # Calculate the range of measures to draw (every measure_step-th one when zoomed far out)
+        measure_step = self._measure_step(ticks_per_measure, MIN_GRID_LINE_SPACING)
+        start_measure_tick = (self.visible_start_tick // measure_step) * measure_step
         
-        for tick in range(start_measure_tick, end_tick, ticks_per_measure):
+        measure_lines = []
+        for tick in range(start_measure_tick, end_tick, measure_step):
             if tick >= self.visible_start_tick - ticks_per_measure:
                 x = self._tick_to_x(tick) + grid_start_x
                 if x >= grid_start_x and x <= self.width():
-                    painter.setPen(QColor(self.theme_colors.grid_line_measure))
-                    painter.drawLine(int(x), 0, int(x), height)
+                    measure_lines.append(QLineF(int(x), 0, int(x), height))
+        painter.setPen(self._pen(self.theme_colors.grid_line_measure))
+        painter.drawLines(measure_lines)
     
     def _draw_measure_lines_with_time_signature_changes(self, painter, ticks_per_beat: int, grid_start_x: int, height: int, end_tick: int):
         """Draw measure lines with time signature changes support"""
@@ -3385,6 +3639,7 @@ class PianoRollWidget(QWidget):
             
         time_sig_changes = sorted(self.midi_project.time_signature_changes, key=lambda x: x.tick)
         
+        measure_lines = []
         for i, ts_change in enumerate(time_sig_changes):
             next_change_tick = time_sig_changes[i + 1].tick if i + 1 < len(time_sig_changes) else end_tick + 10000
             
@@ -3403,12 +3658,19 @@ class PianoRollWidget(QWidget):
             
             # Find the first measure boundary at or after section_start_tick
             first_measure_tick = ((section_start_tick + ticks_per_measure - 1) // ticks_per_measure) * ticks_per_measure
+            # Skip the measures left of the view instead of walking them one by one
+            measure_step = self._measure_step(ticks_per_measure, MIN_GRID_LINE_SPACING)
+            visible_from = self.visible_start_tick - ticks_per_measure
+            if first_measure_tick < visible_from:
+                first_measure_tick += ((visible_from - first_measure_tick) // measure_step) * measure_step
             
             # Draw measures in this section
-            for tick in range(first_measure_tick, section_end_tick, ticks_per_measure):
+            for tick in range(first_measure_tick, section_end_tick, measure_step):
                 if tick >= self.visible_start_tick - ticks_per_measure:
                     x = self._tick_to_x(tick) + grid_start_x
                     if x >= grid_start_x and x <= self.width():
-                        painter.setPen(QColor(self.theme_colors.grid_line_measure))
-                        painter.drawLine(int(x), 0, int(x), height)
+                        measure_lines.append(QLineF(int(x), 0, int(x), height))
+        
+        painter.setPen(self._pen(self.theme_colors.grid_line_measure))
+        painter.drawLines(measure_lines)
 
@@ -0,0 +1,148 @@
+"""
+Playback Statistics Dialog
+Debug panel showing playback jitter and sink latency
+"""
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QDoubleSpinBox,
+                              QFileDialog, QMessageBox, QCheckBox)
+from PySide6.QtCore import Qt, QTimer
+
+from src.playback_engine import get_playback_engine
+
+SUMMARY_COLUMNS = [
+    ("Scope", 'scope'), ("Key", 'key'), ("Count", 'count'),
+    ("p50 ms", 'p50_ms'), ("p95 ms", 'p95_ms'), ("p99 ms", 'p99_ms'), ("Max ms", 'max_ms'),
+    ("Late", 'late_count'),
+    ("Sink p50 ms", 'latency_p50_ms'), ("Sink p99 ms", 'latency_p99_ms'), ("Sink max ms", 'latency_max_ms'),
+]
+
+
+class PlaybackStatsDialog(QDialog):
+    """Live view of playback lateness per sink and per track"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Playback Statistics")
+        self.resize(820, 420)
+
+        self._setup_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self._refresh)
+        self.refresh_timer.start(500)
+        self._refresh()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Controls
+        controls = QHBoxLayout()
+        self.enabled_checkbox = QCheckBox("Collect")
+        self.enabled_checkbox.toggled.connect(self._on_enabled_toggled)
+        controls.addWidget(self.enabled_checkbox)
+
+        controls.addWidget(QLabel("Late threshold (ms):"))
+        self.threshold_spin = QDoubleSpinBox()
+        self.threshold_spin.setRange(0.5, 500.0)
+        self.threshold_spin.setSingleStep(1.0)
+        self.threshold_spin.valueChanged.connect(self._on_threshold_changed)
+        controls.addWidget(self.threshold_spin)
+        controls.addStretch()
+
+        self.overrun_label = QLabel()
+        controls.addWidget(self.overrun_label)
+        layout.addLayout(controls)
+
+        # Summary table
+        self.table = QTableWidget(0, len(SUMMARY_COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in SUMMARY_COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        # Buttons
+        buttons = QHBoxLayout()
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self._reset)
+        buttons.addWidget(reset_button)
+        buttons.addStretch()
+
+        export_summary_button = QPushButton("Export Summary CSV...")
+        export_summary_button.clicked.connect(self._export_summary)
+        buttons.addWidget(export_summary_button)
+
+        export_events_button = QPushButton("Export Events CSV...")
+        export_events_button.clicked.connect(self._export_events)
+        buttons.addWidget(export_events_button)
+
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+        engine = get_playback_engine()
+        if engine:
+            self.enabled_checkbox.setChecked(engine.stats.enabled)
+            self.threshold_spin.setValue(engine.stats.late_threshold_ms)
+
+    def _refresh(self):
+        """Reload the summary from the playback engine"""
+        engine = get_playback_engine()
+        if not engine:
+            self.overrun_label.setText("Playback engine not available")
+            return
+
+        stats = engine.stats
+        rows = stats.get_summary_rows()
+        self.table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for column, (_, key) in enumerate(SUMMARY_COLUMNS):
+                value = row.get(key, '')
+                text = f"{value:.2f}" if isinstance(value, float) else str(value)
+                item = QTableWidgetItem(text)
+                if column >= 2:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row_index, column, item)
+
+        self.overrun_label.setText(
+            f"Timer overruns: {stats.timer_overruns} (worst gap {stats.worst_timer_gap * 1000.0:.1f} ms)")
+
+    def _on_enabled_toggled(self, enabled: bool):
+        engine = get_playback_engine()
+        if engine:
+            engine.stats.enabled = enabled
+
+    def _on_threshold_changed(self, value: float):
+        engine = get_playback_engine()
+        if engine:
+            engine.stats.late_threshold_ms = value
+
+    def _reset(self):
+        engine = get_playback_engine()
+        if engine:
+            engine.stats.reset()
+        self._refresh()
+
+    def _export_summary(self):
+        self._export("Export Playback Summary", "playback_stats.csv", summary=True)
+
+    def _export_events(self):
+        self._export("Export Playback Events", "playback_events.csv", summary=False)
+
+    def _export(self, title: str, default_name: str, summary: bool):
+        engine = get_playback_engine()
+        if not engine:
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(self, title, default_name, "CSV Files (*.csv)")
+        if not file_path:
+            return
+
+        success = engine.stats.export_csv(file_path) if summary else engine.stats.export_events_csv(file_path)
+        if not success:
+            QMessageBox.warning(self, "Export Error", f"Failed to export statistics to {file_path}")
+
+    def closeEvent(self, event):
+        self.refresh_timer.stop()
+        super().closeEvent(event)
@@ -2,10 +2,10 @@
 Status bar for DominoPy
 Displays real-time information about notes, chords, tempo, and playback
 """
-from PySide6.QtWidgets import QStatusBar, QLabel, QWidget, QHBoxLayout, QVBoxLayout
+from PySide6.QtWidgets import QStatusBar, QLabel, QWidget, QHBoxLayout, QVBoxLayout, QPushButton
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from src.music_theory import MusicTheory, analyze_harmony
 from src.midi_data_model import MidiNote
@@ -125,10 +125,12 @@ class PlaybackInfoWidget(QWidget):
         }
         
         icon = state_icons.get(state, "⏹️")
-        self.state_label.setText(f"{icon} {state.value.title()}")
+        state_text = f"{icon} {state.value.title()}"
+        if state_text != self.state_label.text():
+            self.state_label.setText(state_text)
         
         # Update position and tempo
-        current_tick = engine.get_current_tick()
+        current_tick = engine.playhead.current_tick()
         tempo_bpm = engine.get_tempo()
         
         # Convert ticks to time (simplified)
@@ -137,7 +139,10 @@ class PlaybackInfoWidget(QWidget):
         minutes = int(beats / tempo_bpm)
         seconds = int((beats / tempo_bpm * 60) % 60)
         
-        self.position_label.setText(f"{minutes}:{seconds:02d} | {tempo_bpm:.0f} BPM")
+        # Only touch the label when the text changes (setText relayouts and repaints)
+        position_text = f"{minutes}:{seconds:02d} | {tempo_bpm:.0f} BPM"
+        if position_text != self.position_label.text():
+            self.position_label.setText(position_text)
 
 
 class DominoPyStatusBar(QStatusBar):
@@ -155,6 +160,18 @@ class DominoPyStatusBar(QStatusBar):
         self.project_label.setStyleSheet("color: #bd93f9; font-weight: bold; padding: 2px;")
         self.addPermanentWidget(self.project_label)
         
+        # Button of the current show_action() prompt
+        self.action_button = QPushButton()
+        self.action_button.setFont(QFont("Arial", 9))
+        self.action_button.setStyleSheet("color: #50fa7b; padding: 0px 6px;")
+        self.action_button.clicked.connect(self._on_action_clicked)
+        self.action_button.hide()
+        self.addPermanentWidget(self.action_button)
+        self._action_callback: Optional[Callable[[], None]] = None
+        self.action_timer = QTimer(self)
+        self.action_timer.setSingleShot(True)
+        self.action_timer.timeout.connect(self.hide_action)
+        
         # Set overall styling
         self.setStyleSheet("""
             QStatusBar {
@@ -174,4 +191,25 @@ class DominoPyStatusBar(QStatusBar):
     
     def show_message(self, message: str, timeout: int = 2000):
         """Show temporary message"""
-        super().showMessage(message, timeout)
\ No newline at end of file
+        super().showMessage(message, timeout)
+    
+    def show_action(self, message: str, action_text: str, callback: Callable[[], None], timeout: int = 15000):
+        """Show a temporary message with a button; a non-blocking alternative to a question dialog"""
+        self.show_message(message, timeout)
+        self._action_callback = callback
+        self.action_button.setText(action_text)
+        self.action_button.show()
+        self.action_timer.start(timeout)
+    
+    def hide_action(self):
+        """Remove the show_action() button"""
+        self.action_timer.stop()
+        self.action_button.hide()
+        self._action_callback = None
+    
+    def _on_action_clicked(self):
+        callback = self._action_callback
+        self.hide_action()
+        self.clearMessage()
+        if callback:
+            callback()
\ No newline at end of file
@@ -92,6 +92,16 @@ class TrackItemWidget(QFrame):
         # Spacer
         layout.addStretch()
         
+        # Mute / solo toggles
+        self.mute_button = self._create_toggle_button("M", "Mute track", "#FF6B6B")
+        self.mute_button.toggled.connect(self._on_mute_toggled)
+        layout.addWidget(self.mute_button)
+        
+        self.solo_button = self._create_toggle_button("S", "Solo track", "#F7DC6F")
+        self.solo_button.toggled.connect(self._on_solo_toggled)
+        layout.addWidget(self.solo_button)
+        self.update_mute_solo()
+        
         # Track info
         track_info = self.track_manager.get_track_info(self.track_index) if self.track_manager else {}
         note_count = track_info.get('note_count', 0)
@@ -104,7 +114,7 @@ class TrackItemWidget(QFrame):
         info_layout.setContentsMargins(0, 0, 0, 0)
         
         # Note count
-        self.info_label = QLabel(f"{note_count} notes")
+        self.info_label = QLabel(self._format_note_count(note_count))
         self.info_label.setFont(QFont("Arial", 8))
         self.info_label.setStyleSheet("color: #666666;")
         info_layout.addWidget(self.info_label)
@@ -144,6 +154,39 @@ class TrackItemWidget(QFrame):
         
         layout.addLayout(info_layout)
     
+    def _create_toggle_button(self, text: str, tooltip: str, checked_color: str) -> QPushButton:
+        """Create a small checkable button for track toggles"""
+        button = QPushButton(text)
+        button.setCheckable(True)
+        button.setFixedSize(20, 20)
+        button.setFont(QFont("Arial", 8, QFont.Bold))
+        button.setToolTip(tooltip)
+        button.setStyleSheet(f"""
+            QPushButton {{ background-color: #E0E0E0; border: 1px solid #AAAAAA; border-radius: 3px; color: #555555; }}
+            QPushButton:checked {{ background-color: {checked_color}; color: #000000; }}
+        """)
+        return button
+    
+    def update_mute_solo(self):
+        """Sync mute/solo buttons with the track manager"""
+        if not self.track_manager:
+            return
+        for button, checked in ((self.mute_button, self.track_manager.is_track_muted(self.track_index)),
+                                (self.solo_button, self.track_manager.is_track_soloed(self.track_index))):
+            button.blockSignals(True)
+            button.setChecked(checked)
+            button.blockSignals(False)
+    
+    def _on_mute_toggled(self, checked: bool):
+        """Handle mute button toggle"""
+        if self.track_manager:
+            self.track_manager.set_track_muted(self.track_index, checked)
+    
+    def _on_solo_toggled(self, checked: bool):
+        """Handle solo button toggle"""
+        if self.track_manager:
+            self.track_manager.set_track_soloed(self.track_index, checked)
+    
     def update_style(self):
         """Update the visual style based on active state"""
         if self.is_active:
@@ -173,9 +216,19 @@ class TrackItemWidget(QFrame):
             self.is_active = active
             self.update_style()
     
+    def _format_note_count(self, note_count: int) -> str:
+        """Format the note count, flagging frozen tracks and tracks still loading"""
+        track = self.track_manager.get_track(self.track_index) if self.track_manager else None
+        if track is not None and track.loading:
+            return "loading…"
+        if self.track_manager and self.track_manager.is_track_frozen(self.track_index):
+            state = "stale" if self.track_manager.is_freeze_stale(self.track_index) else "frozen"
+            return f"{note_count} notes ❄ {state}"
+        return f"{note_count} notes"
+    
     def update_info(self, note_count: int, program: int = None, audio_source_name: str = None):
         """Update track information display"""
-        self.info_label.setText(f"{note_count} notes")
+        self.info_label.setText(self._format_note_count(note_count))
         if hasattr(self, 'program_label'):
             # Get GM instrument name from track manager for proper display
             track_info = self.track_manager.get_track_info(self.track_index) if self.track_manager else {}
@@ -272,6 +325,19 @@ class TrackItemWidget(QFrame):
         duplicate_action = menu.addAction("Duplicate Track")
         duplicate_action.triggered.connect(lambda: self.track_duplicated.emit(self.track_index))
         
+        # Freeze: render to audio and release the track's synth
+        if self.track_manager and self.track_manager.is_track_frozen(self.track_index):
+            if self.track_manager.is_freeze_stale(self.track_index):
+                rerender_action = menu.addAction("Re-render Frozen Track")
+                rerender_action.triggered.connect(lambda: self.track_manager.rerender_frozen_track(self.track_index))
+            freeze_action = menu.addAction("Unfreeze Track")
+            freeze_action.triggered.connect(lambda: self.track_manager.unfreeze_track(self.track_index))
+        else:
+            freeze_action = menu.addAction("Freeze Track")
+            freeze_action.triggered.connect(lambda: self.track_manager.freeze_track(self.track_index))
+            if not self.track_manager or self.track_manager.is_freeze_rendering(self.track_index):
+                freeze_action.setEnabled(False)
+        
         menu.addSeparator()
         
         remove_action = menu.addAction("Remove Track")
@@ -475,6 +541,10 @@ class TrackListWidget(QWidget):
         track_manager.track_renamed.connect(self._on_track_renamed)
         track_manager.track_color_changed.connect(self._on_track_color_changed)
         track_manager.project_changed.connect(self._on_project_changed)
+        track_manager.track_freeze_changed.connect(lambda track_index, frozen: self.update_track_info())
+        track_manager.track_freeze_stale.connect(lambda track_index: self.update_track_info())
+        track_manager.track_mute_changed.connect(self._on_track_mute_solo_changed)
+        track_manager.track_solo_changed.connect(self._on_track_mute_solo_changed)
         
         # Refresh the display
         self.refresh_tracks()
@@ -555,6 +625,11 @@ class TrackListWidget(QWidget):
         if track_index < len(self.track_items):
             self.track_items[track_index].update_color(new_color)
     
+    def _on_track_mute_solo_changed(self, track_index: int, enabled: bool):
+        """Handle mute/solo change"""
+        if track_index < len(self.track_items):
+            self.track_items[track_index].update_mute_solo()
+    
     def _on_project_changed(self):
         """Handle project change"""
         self.refresh_tracks()
@@ -0,0 +1,89 @@
+"""
+Voice Table
+Tracks sounding voices per (track, channel, pitch) with reference counts
+"""
+from typing import Dict, List, Set, Tuple
+
+from src.midi_data_model import MidiNote
+
+VoiceKey = Tuple[int, int, int]  # (track_index, channel, pitch)
+
+
+class VoiceTable:
+    """
+    Accounting for currently sounding voices during playback.
+
+    Overlapping notes with the same key share one voice; the note-off is only
+    sent when the last of them ends, so tracks never cut each other's notes.
+    """
+
+    def __init__(self):
+        self._voices: Dict[VoiceKey, List] = {}          # key -> [refcount, note]
+        self._track_voices: Dict[int, Set[VoiceKey]] = {}  # track_index -> keys
+
+    def __len__(self) -> int:
+        return len(self._voices)
+
+    def __contains__(self, key: VoiceKey) -> bool:
+        return key in self._voices
+
+    def note_on(self, track_index: int, note: MidiNote) -> int:
+        """Register a sounding note and return the voice's new reference count"""
+        key = (track_index, note.channel, note.pitch)
+        entry = self._voices.get(key)
+        if entry:
+            entry[0] += 1
+            entry[1] = note
+            return entry[0]
+
+        self._voices[key] = [1, note]
+        self._track_voices.setdefault(track_index, set()).add(key)
+        return 1
+
+    def note_off(self, track_index: int, note: MidiNote) -> bool:
+        """Release one reference; return True if the voice ended and needs a note-off"""
+        key = (track_index, note.channel, note.pitch)
+        entry = self._voices.get(key)
+        if not entry:
+            return False
+
+        entry[0] -= 1
+        if entry[0] > 0:
+            return False
+
+        self._remove(key)
+        return True
+
+    def is_sounding(self, track_index: int, channel: int, pitch: int) -> bool:
+        """Check if a voice is sounding"""
+        return (track_index, channel, pitch) in self._voices
+
+    def has_track_voices(self, track_index: int) -> bool:
+        """Check if a track has any sounding voices"""
+        return bool(self._track_voices.get(track_index))
+
+    def sounding_tracks(self) -> List[int]:
+        """Get the tracks that currently have sounding voices"""
+        return [track_index for track_index, keys in self._track_voices.items() if keys]
+
+    def release_track(self, track_index: int) -> List[Tuple[int, MidiNote]]:
+        """Drop every voice on a track and return (track_index, note) pairs to silence"""
+        keys = self._track_voices.pop(track_index, set())
+        released = [(track_index, self._voices.pop(key)[1]) for key in keys]
+        return released
+
+    def release_all(self) -> List[Tuple[int, MidiNote]]:
+        """Drop every voice and return (track_index, note) pairs to silence"""
+        released = [(key[0], entry[1]) for key, entry in self._voices.items()]
+        self._voices.clear()
+        self._track_voices.clear()
+        return released
+
+    def _remove(self, key: VoiceKey):
+        """Remove a voice key from both indexes"""
+        del self._voices[key]
+        keys = self._track_voices.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._track_voices[key[0]]
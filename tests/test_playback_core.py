@@ -0,0 +1,87 @@
+"""
+PlaybackCore tests driven by a VirtualClock and a RecordingSink
+"""
+import pytest
+
+from src.midi_data_model import MidiNote, MidiProject, MidiTrack
+from src.playback_core import PlaybackCore, PlaybackState, RecordingSink, VirtualClock
+
+# 120 BPM at 480 ticks per beat
+TICKS_PER_SECOND = 960
+
+
+def _make_core(notes_per_track, is_track_audible=None):
+    project = MidiProject()
+    project.tracks = []
+    for notes in notes_per_track:
+        track = MidiTrack()
+        track.notes = notes
+        project.add_track(track)
+    clock = VirtualClock()
+    sink = RecordingSink(clock)
+    core = PlaybackCore(clock, lambda: sink, is_track_audible)
+    core.set_project(project)
+    return core, clock, sink
+
+
+def _pitches(sink, is_note_on):
+    return [(track_index, note.pitch) for _, track_index, note, note_on in sink.events if note_on == is_note_on]
+
+
+def test_play_dispatches_notes_in_order():
+    core, _, sink = _make_core([[MidiNote(60, 0, 480, 100), MidiNote(62, 480, 960, 100)]])
+    core.run_until(2000)
+
+    assert core.state == PlaybackState.STOPPED  # Stops by itself past the last note
+    assert [(note.pitch, note_on) for _, _, note, note_on in sink.events] == [
+        (60, True), (60, False), (62, True), (62, False)]
+    # A note-off and the next note-on at the same tick go out off-first
+    times = [time for time, _, _, _ in sink.events]
+    assert times[1] == pytest.approx(0.5, abs=0.03)
+    assert times[1] == times[2]
+
+
+def test_seek_releases_sounding_voices():
+    core, _, sink = _make_core([[MidiNote(60, 0, 480, 100), MidiNote(62, 480, 960, 100),
+                                 MidiNote(64, 960, 1440, 100)]])
+    core.run_until(240)
+    assert _pitches(sink, True) == [(0, 60)]
+
+    core.seek_to_tick(720)
+    assert core.state == PlaybackState.PLAYING
+    assert _pitches(sink, False) == [(0, 60)]  # Released by the seek, not by its own note-off
+
+    core.run_until(2000)
+    # The note under the new position isn't retriggered, and its note-off isn't sent
+    assert _pitches(sink, True) == [(0, 60), (0, 64)]
+    assert _pitches(sink, False) == [(0, 60), (0, 64)]
+
+
+def test_tempo_change_retimes_remaining_events():
+    core, _, sink = _make_core([[MidiNote(60, 0, 480, 100), MidiNote(62, 960, 1440, 100)]])
+    core.run_until(480)
+    core.set_tempo(60.0)
+    assert core.ticks_per_second == TICKS_PER_SECOND / 2
+
+    core.run_until(2000)
+    on_times = {note.pitch: time for time, _, note, note_on in sink.events if note_on}
+    # 0.5 s for the first 480 ticks at 120 BPM, then 480 more ticks at 60 BPM
+    assert on_times[62] == pytest.approx(1.5, abs=0.03)
+
+
+def test_muted_track_is_skipped_and_released():
+    muted = set()
+    core, _, sink = _make_core([[MidiNote(60, 0, 960, 100)], [MidiNote(48, 0, 960, 100),
+                                                              MidiNote(50, 960, 1440, 100)]],
+                               lambda track_index: track_index not in muted)
+    core.run_until(240)
+    assert sorted(_pitches(sink, True)) == [(0, 60), (1, 48)]
+
+    muted.add(1)
+    assert core.release_inaudible_voices() == 1
+    assert _pitches(sink, False) == [(1, 48)]
+
+    core.run_until(2000)
+    # Nothing more sounds on the muted track, and its released note sends no second note-off
+    assert _pitches(sink, True) == [(0, 60), (1, 48)]
+    assert _pitches(sink, False) == [(1, 48), (0, 60)]
@@ -0,0 +1,32 @@
+"""
+Round-trip tests for the SMF writer and reader
+"""
+from src.midi_data_model import MidiNote, MidiProject
+from src.smf_reader import read_midi_file
+from src.smf_writer import write_midi_file
+
+
+def _round_trip(notes, tmp_path):
+    project = MidiProject()
+    project.tracks[0].notes = notes
+    file_path = str(tmp_path / "round_trip.mid")
+    write_midi_file(project, file_path)
+    return read_midi_file(file_path, parallel=False)
+
+
+def _note_tuples(project):
+    return sorted((note.pitch, note.start_tick, note.end_tick, note.velocity, note.channel)
+                  for track in project.tracks for note in track.notes)
+
+
+def test_zero_length_note_survives(tmp_path):
+    notes = [MidiNote(60, 0, 480, 100), MidiNote(62, 480, 480, 90), MidiNote(64, 960, 960, 80, 1)]
+    loaded = _round_trip(notes, tmp_path)
+    assert _note_tuples(loaded) == [(60, 0, 480, 100, 0), (62, 480, 480, 90, 0), (64, 960, 960, 80, 1)]
+
+
+def test_zero_length_note_after_same_pitch_note(tmp_path):
+    # The earlier note's off must still close it before the zero-length note starts
+    notes = [MidiNote(60, 0, 480, 100), MidiNote(60, 480, 480, 70)]
+    loaded = _round_trip(notes, tmp_path)
+    assert _note_tuples(loaded) == [(60, 0, 480, 100, 0), (60, 480, 480, 70, 0)]